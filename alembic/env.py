@@ -17,7 +17,9 @@ from models import (
     league,
     league_team,
     player_season_stat,
+    player_leaderboard,
     venue,
+    ingestion_job,
 )
 
 import asyncio
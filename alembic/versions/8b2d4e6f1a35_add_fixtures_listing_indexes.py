@@ -0,0 +1,53 @@
+"""add fixtures listing indexes
+
+Revision ID: 8b2d4e6f1a35
+Revises: 3f1c9a7d2b10
+Create Date: 2026-10-18 14:05:47.208114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2d4e6f1a35'
+down_revision: Union[str, None] = '3f1c9a7d2b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ('ix_fixtures_date_api_id', ['match_DATE', 'api_id']),
+    ('ix_fixtures_league_season_date', ['league_id', 'season', 'match_DATE', 'api_id']),
+    ('ix_fixtures_home_team_date', ['home_team_id', 'match_DATE', 'api_id']),
+    ('ix_fixtures_away_team_date', ['away_team_id', 'match_DATE', 'api_id']),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY não bloqueia as escritas da ingestão, mas não pode rodar
+    # dentro de uma transação
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                'fixtures',
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name='fixtures',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
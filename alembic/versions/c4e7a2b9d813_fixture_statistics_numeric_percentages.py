@@ -0,0 +1,47 @@
+"""fixture statistics numeric percentages
+
+Revision ID: c4e7a2b9d813
+Revises: 8b2d4e6f1a35
+Create Date: 2026-10-18 16:42:10.531907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e7a2b9d813'
+down_revision: Union[str, None] = '8b2d4e6f1a35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ('ball_possession', 'passes_percentage')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # "55%" -> 55; valores vazios viram NULL
+    for column in COLUMNS:
+        op.alter_column(
+            'fixture_statistics',
+            column,
+            existing_type=sa.String(length=10),
+            type_=sa.SmallInteger(),
+            existing_nullable=True,
+            postgresql_using=f"NULLIF(replace({column}, '%', ''), '')::smallint",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in COLUMNS:
+        op.alter_column(
+            'fixture_statistics',
+            column,
+            existing_type=sa.SmallInteger(),
+            type_=sa.String(length=10),
+            existing_nullable=True,
+            postgresql_using=f"{column}::text || '%'",
+        )
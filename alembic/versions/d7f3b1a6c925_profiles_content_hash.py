@@ -0,0 +1,33 @@
+"""profiles content hash
+
+Revision ID: d7f3b1a6c925
+Revises: c4e7a2b9d813
+Create Date: 2026-10-18 18:05:37.214830
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f3b1a6c925'
+down_revision: Union[str, None] = 'c4e7a2b9d813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('base_players', 'base_coaches')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Perfis já gravados ficam sem hash e são regravados uma vez
+    for table in TABLES:
+        op.add_column(table, sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_column(table, 'content_hash')
@@ -0,0 +1,36 @@
+"""player season stats rating sum
+
+Revision ID: e2a8c4f7b316
+Revises: d7f3b1a6c925
+Create Date: 2026-10-18 19:12:48.603151
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a8c4f7b316'
+down_revision: Union[str, None] = 'd7f3b1a6c925'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'players_season_stats',
+        sa.Column('rating_sum', sa.DECIMAL(precision=7, scale=2), nullable=True),
+    )
+    op.add_column(
+        'players_season_stats',
+        sa.Column('rated_appearances', sa.SmallInteger(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('players_season_stats', 'rated_appearances')
+    op.drop_column('players_season_stats', 'rating_sum')
@@ -0,0 +1,80 @@
+"""player leaderboards
+
+Revision ID: f6b9d2e4a187
+Revises: e2a8c4f7b316
+Create Date: 2026-10-18 20:31:09.457162
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b9d2e4a187'
+down_revision: Union[str, None] = 'e2a8c4f7b316'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INCLUDE = [
+    'rank',
+    'base_player_api_id',
+    'league_team_id',
+    'value',
+    'appearances',
+    'minutes',
+    'player_name',
+    'player_photo_url',
+    'team_name',
+    'team_logo_url',
+    'refreshed_at',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Linhas existentes ficam com NULL até o próximo rebuild das estatísticas
+    op.add_column(
+        'players_season_stats',
+        sa.Column('clean_sheets', sa.SmallInteger(), nullable=True),
+    )
+    op.create_table(
+        'player_leaderboards',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('league_id', sa.Integer(), nullable=False),
+        sa.Column('metric', sa.String(length=20), nullable=False),
+        sa.Column('position', sa.SmallInteger(), nullable=False),
+        sa.Column('rank', sa.SmallInteger(), nullable=False),
+        sa.Column('base_player_api_id', sa.Integer(), nullable=False),
+        sa.Column('league_team_id', sa.Integer(), nullable=False),
+        sa.Column('value', sa.DECIMAL(precision=7, scale=2), nullable=False),
+        sa.Column('appearances', sa.SmallInteger(), nullable=True),
+        sa.Column('minutes', sa.SmallInteger(), nullable=True),
+        sa.Column('player_name', sa.String(length=255), nullable=True),
+        sa.Column('player_photo_url', sa.String(length=255), nullable=True),
+        sa.Column('team_name', sa.String(), nullable=True),
+        sa.Column('team_logo_url', sa.String(length=255), nullable=True),
+        sa.Column('refreshed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['base_player_api_id'], ['base_players.api_id']),
+        sa.ForeignKeyConstraint(['league_id'], ['leagues.id']),
+        sa.ForeignKeyConstraint(['league_team_id'], ['league_teams.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_player_leaderboards_league_metric_position',
+        'player_leaderboards',
+        ['league_id', 'metric', 'position'],
+        unique=True,
+        postgresql_include=INCLUDE,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_player_leaderboards_league_metric_position',
+        table_name='player_leaderboards',
+    )
+    op.drop_table('player_leaderboards')
+    op.drop_column('players_season_stats', 'clean_sheets')
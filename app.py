@@ -1,13 +1,18 @@
-from fastapi import FastAPI, Depends, BackgroundTasks, HTTPException, Query
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Depends, HTTPException, Query
 from typing import Optional
-from database.database import get_db_session, engine, Base
+from database.database import get_db_session, engine, Base, replica_engine, replica_router
+from database.pool import pool_metrics
 from sqlalchemy.ext.asyncio import AsyncSession
-from integrations.save_json import fetch_and_save_to_json
-from integrations.venues_processor import process_venues_json_and_save_to_db
-from integrations.league_processor import process_league_json_and_save_to_db
-from integrations.teams_processor import process_teams_json_and_save_to_db
-from integrations.league_teams_processor import link_teams_to_league_and_venues
-from integrations.fixtures_processor import process_fixtures_json_and_save_to_db
+from integrations.http_client import close_http_client
+from config import LIVE_UPDATER_ENABLED
+from integrations.broker import broker
+from integrations.jobs import job_runner
+from integrations.leaderboards import leaderboard_cache, leaderboard_refresher
+from integrations.live_updater import live_updater
+from integrations.payload_cache import cache_file_name
+from integrations.rate_limiter import api_scheduler, LIVE, DEFAULT
+from integrations.reference_cache import country_cache
 from models import (
     base_coach,
     base_player,
@@ -21,29 +26,65 @@ from models import (
     league,
     league_team,
     player_season_stat,
+    player_leaderboard,
     venue,
+    ingestion_job,
 )
 
-from routes import auth
+from utils.feed_cache import feed_cache
+from utils.security import password_hasher
+from routes import auth, fixtures, jobs, leagues, live, me
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Atualizações de partidas (locais ou via NOTIFY) invalidam os feeds em cache
+    broker.add_listener(feed_cache.on_fixture_events)
+    await replica_router.start()
+    await broker.start()
+    await job_runner.start()
+    leaderboard_refresher.start()
+    if LIVE_UPDATER_ENABLED:
+        live_updater.start()
+    yield
+    await live_updater.stop()
+    await leaderboard_refresher.stop()
+    await job_runner.stop()
+    await broker.stop()
+    await replica_router.stop()
+    password_hasher.shutdown()
+    # Fecha o pool de conexões HTTP compartilhado pelas rotas de fetch
+    await close_http_client()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 @app.post("/fetch-countries")
-async def fetch_countries(background_tasks: BackgroundTasks):
+async def fetch_countries():
     """Endpoint para obter os paises e guardar num arquivo Json"""
     try:
-        background_tasks.add_task(
-            fetch_and_save_to_json("/countries", "countries.json")
-        )
-        return {"message": "Download dos países iniciada em segundo plano"}
+        job_id = await job_runner.submit("fetch", endpoint="/countries")
+        return {
+            "message": f"Download dos países iniciada em segundo plano. Arquivo: {cache_file_name('/countries')}",
+            "job_id": job_id,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/refresh-countries-cache")
+async def refresh_countries_cache():
+    """Endpoint para recarregar o cache em memória de países (nome -> id)"""
+    try:
+        await country_cache.refresh()
+        return {"message": "Cache de países recarregado"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/fetch-venues")
 async def fetch_venues(
-    background_tasks: BackgroundTasks,
     id: Optional[int] = Query(None, description="Filtrar por id do estadio"),
     name: Optional[str] = Query(None, description="Filtrar pelo nome do estadio"),
     city: Optional[str] = Query(None, description="Filtrar pela cidade do estadio"),
@@ -54,50 +95,49 @@ async def fetch_venues(
 ):
     """Endpoint para obter os estadios e guardar num arquivo Json"""
     params = {}
-    filename_parts = ["venues"]
 
     if id is not None:
         params["id"] = id
-        filename_parts.append(f"id_{id}")
     if name is not None:
         params["name"] = name
-        filename_parts.append(f"name_{name.lower().replace(' ', '_')}")
     if city is not None:
         params["city"] = city
-        filename_parts.append(f"city_{city.lower().replace(' ', '_')}")
     if country is not None:
         params["country"] = country
-        filename_parts.append(f"country_{country.lower().replace(' ', '_')}")
     if search is not None:
         params["search"] = search
-        filename_parts.append(f"search_{search.lower().replace(' ', '_')}")
 
-    filename = "_".join(filename_parts) + ".json"
+    filename = cache_file_name("/venues", params)
 
     try:
-        background_tasks.add_task(
-            fetch_and_save_to_json, "/venues", filename, params=params
+        job_id = await job_runner.submit(
+            "fetch", endpoint="/venues", params=params
         )
-        return {"message": "Download dos estadios iniciada em segundo plano"}
+        return {
+            "message": f"Download dos estadios iniciada em segundo plano. Arquivo: {filename}",
+            "job_id": job_id,
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/save_venues_in_db")
-async def save_venues_in_db(background_tasks: BackgroundTasks):
+async def save_venues_in_db():
     """Endpoint para salvar os estadios no banco de dados"""
     try:
-        background_tasks.add_task(
-            process_venues_json_and_save_to_db, "venues_country_brazil.json"
+        job_id = await job_runner.submit(
+            "process_venues", file_name="venues_country_brazil.json"
         )
-        return {"message": "Processamento dos estadios iniciado em segundo plano"}
+        return {
+            "message": "Processamento dos estadios iniciado em segundo plano",
+            "job_id": job_id,
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/fetch-leagues")
 async def fetch_leagues(
-    background_tasks: BackgroundTasks,
     id: Optional[int] = Query(None, description="The id of the league"),
     name: Optional[str] = Query(None, description="The name of the league"),
     country: Optional[str] = Query(None, description="The country name of the league"),
@@ -124,49 +164,39 @@ async def fetch_leagues(
 ):
     """Endpoint para obter ligas e guardar num arquivo Json e no banco de dados"""
     params = {}
-    filename_parts = ["leagues"]
 
     if id is not None:
         params["id"] = id
-        filename_parts.append(f"id_{id}")
     if name is not None:
         params["name"] = name
-        filename_parts.append(f"name_{name.lower().replace(' ', '_')}")
     if country is not None:
         params["country"] = country
-        filename_parts.append(f"country_{country.lower().replace(' ', '_')}")
     if code is not None:
         params["code"] = code
-        filename_parts.append(f"code_{code.lower()}")
     if season is not None:
         params["season"] = season
-        filename_parts.append(f"season_{season}")
     if team is not None:
         params["team"] = team
-        filename_parts.append(f"team_{team}")
     if type is not None:
         params["type"] = type
-        filename_parts.append(f"type_{type.lower()}")
     if current is not None:
         params["current"] = current
-        filename_parts.append(f"current_{current.lower()}")
     if search is not None:
         params["search"] = search
-        filename_parts.append(f"search_{search.lower().replace(' ', '_')}")
     if last is not None:
         params["last"] = last
-        filename_parts.append(f"last_{last}")
 
-    filename = "_".join(filename_parts) + ".json"
+    filename = cache_file_name("/leagues", params)
 
     try:
-        background_tasks.add_task(
-            fetch_and_save_to_json, "/leagues", filename, params=params
+        # Download e processamento no mesmo job: o arquivo só é lido depois de baixado
+        job_id = await job_runner.submit(
+            "fetch_and_process_leagues", params=params
         )
-        background_tasks.add_task(process_league_json_and_save_to_db, filename)
 
         return {
-            "message": f"Download e processamento de ligas iniciado em segundo plano. Arquivo: {filename}"
+            "message": f"Download e processamento de ligas iniciado em segundo plano. Arquivo: {filename}",
+            "job_id": job_id,
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -174,7 +204,6 @@ async def fetch_leagues(
 
 @app.post("/fetch-teams")
 async def fetch_teams(
-    background_tasks: BackgroundTasks,
     league: int = Query(None, description="The id of the league"),
     season: int = Query(None, description="The season of the league (e.g., 2023)"),
     id: Optional[int] = Query(None, description="The id of the team"),
@@ -188,43 +217,71 @@ async def fetch_teams(
 ):
     """Endpoint para obter equipes e guardar num arquivo Json e no banco de dados"""
     params = {}
-    filename_parts = ["teams"]
 
     if id is not None:
         params["id"] = id
-        filename_parts.append(f"id_{id}")
     if league is not None:
         params["league"] = league
-        filename_parts.append(f"league_{league}")
     if season is not None:
         params["season"] = season
-        filename_parts.append(f"season_{season}")
     if name is not None:
         params["name"] = name
-        filename_parts.append(f"name_{name.lower().replace(' ', '_')}")
     if country is not None:
         params["country"] = country
-        filename_parts.append(f"country_{country.lower().replace(' ', '_')}")
     if code is not None:
         params["code"] = code
-        filename_parts.append(f"code_{code.lower()}")
     if venue is not None:
         params["venue"] = venue
-        filename_parts.append(f"venue_{venue}")
     if search is not None:
         params["search"] = search
-        filename_parts.append(f"search_{search.lower().replace(' ', '_')}")
 
-    filename = "_".join(filename_parts) + ".json"
+    filename = cache_file_name("/teams", params)
 
     try:
-        background_tasks.add_task(
-            fetch_and_save_to_json, "/teams", filename, params=params
+        job_id = await job_runner.submit(
+            "fetch_and_process_teams", params=params
         )
-        background_tasks.add_task(process_teams_json_and_save_to_db, filename)
 
         return {
-            "message": f"Download e processamento de equipes iniciado em segundo plano. Arquivo: {filename}"
+            "message": f"Download e processamento de equipes iniciado em segundo plano. Arquivo: {filename}",
+            "job_id": job_id,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/fetch-players")
+async def fetch_players(
+    season: int = Query(..., description="A temporada (ex: 2023)"),
+    league: Optional[int] = Query(None, description="O id da liga"),
+    team: Optional[int] = Query(None, description="O id da equipe"),
+    id: Optional[int] = Query(None, description="O id do jogador"),
+    search: Optional[str] = Query(
+        None, min_length=4, description="O nome do jogador (requer league ou team)"
+    ),
+):
+    """Endpoint para obter todas as páginas de jogadores e guardar num arquivo Json"""
+    params = {"season": season}
+
+    if id is not None:
+        params["id"] = id
+    if league is not None:
+        params["league"] = league
+    if team is not None:
+        params["team"] = team
+    if search is not None:
+        params["search"] = search
+
+    filename = cache_file_name("/players", params)
+
+    try:
+        # O endpoint /players é paginado: todas as páginas vão para o mesmo arquivo
+        job_id = await job_runner.submit(
+            "fetch", endpoint="/players", params=params
+        )
+        return {
+            "message": f"Download de jogadores iniciado em segundo plano. Arquivo: {filename}",
+            "job_id": job_id,
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -232,7 +289,6 @@ async def fetch_teams(
 
 @app.post("/link-teams-to-league")
 async def link_teams_to_league(
-    background_tasks: BackgroundTasks,
     file_name: str = Query(
         ..., description="Nome do arquivo JSON de equipes (dentro da pasta json/)"
     ),
@@ -243,11 +299,15 @@ async def link_teams_to_league(
 ):
     """Endpoint para enlazar equipes de um arquivo JSON a uma liga e temporada específicas no banco de dados."""
     try:
-        background_tasks.add_task(
-            link_teams_to_league_and_venues, file_name, api_league_id, season
+        job_id = await job_runner.submit(
+            "link_teams_to_league",
+            file_name=file_name,
+            api_league_id=api_league_id,
+            season=season,
         )
         return {
-            "message": f"Processo de enlace de equipes do arquivo '{file_name}' à liga (ID API: {api_league_id}, Temporada: {season}) iniciado em segundo plano."
+            "message": f"Processo de enlace de equipes do arquivo '{file_name}' à liga (ID API: {api_league_id}, Temporada: {season}) iniciado em segundo plano.",
+            "job_id": job_id,
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -255,7 +315,6 @@ async def link_teams_to_league(
 
 @app.post("/fetch-fixtures")
 async def fetch_fixtures(
-    background_tasks: BackgroundTasks,
     id: Optional[int] = Query(None, description="O id da partida"),
     ids: Optional[str] = Query(
         None, description="Máximo de 20 ids de partidas (ex: 123-456-789)"
@@ -291,72 +350,54 @@ async def fetch_fixtures(
 ):
     """Endpoint para baixar dados de partidas da API e salvar em um arquivo JSON."""
     params = {}
-    filename_parts = ["fixtures"]
 
-    # Adiciona parâmetros se não forem None e constrói partes do nome do arquivo
+    # Adiciona parâmetros se não forem None
     if id is not None:
         params["id"] = id
-        filename_parts.append(f"id_{id}")
     if ids is not None:
         params["ids"] = ids
-        filename_parts.append(f"ids_{ids.replace('-', '_')}")
     if live is not None:
         params["live"] = live
-        filename_parts.append(f"live_{live.replace('-', '_')}")
     if date is not None:
         params["date"] = date
-        filename_parts.append(f"date_{date}")
     if league is not None:
         params["league"] = league
-        filename_parts.append(f"league_{league}")
     if season is not None:
         params["season"] = season
-        filename_parts.append(f"season_{season}")
     if team is not None:
         params["team"] = team
-        filename_parts.append(f"team_{team}")
     if last is not None:
         params["last"] = last
-        filename_parts.append(f"last_{last}")
     if next is not None:
         params["next"] = next
-        filename_parts.append(f"next_{next}")
     if from_date is not None:
         params["from"] = from_date
-        filename_parts.append(f"from_{from_date}")
     if to_date is not None:
         params["to"] = to_date
-        filename_parts.append(f"to_{to_date}")
     if round is not None:
         params["round"] = round
-        cleaned_round = (
-            round.lower().replace(" ", "_").replace("-", "_").replace(":", "_")
-        )
-        filename_parts.append(f"round_{cleaned_round}")
     if status is not None:
         params["status"] = status
-        filename_parts.append(f"status_{status.lower().replace('-', '_')}")
     if venue is not None:
         params["venue"] = venue
-        filename_parts.append(f"venue_{venue}")
     if timezone is not None:
         params["timezone"] = timezone
-        filename_parts.append(f"timezone_{timezone.lower().replace('/', '_')}")
 
-    # Constrói o nome do arquivo dinamicamente ou usa um padrão
-    if len(filename_parts) > 1:
-        filename = "_".join(filename_parts) + ".json"
-    else:
-        filename = "fixtures_data.json"  # Nome padrão se nenhum filtro for usado
+    filename = cache_file_name("/fixtures", params)
 
     try:
         # Lança a tarefa de download e salvamento em JSON
-        background_tasks.add_task(
-            fetch_and_save_to_json, "/fixtures", filename, params=params
+        # Partidas ao vivo passam na frente dos downloads históricos na fila da API
+        job_id = await job_runner.submit(
+            "fetch",
+            endpoint="/fixtures",
+            params=params,
+            priority=LIVE if live is not None else DEFAULT,
         )
 
         return {
-            "message": f"Download de partidas iniciado em segundo plano. Arquivo: {filename}"
+            "message": f"Download de partidas iniciado em segundo plano. Arquivo: {filename}",
+            "job_id": job_id,
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -367,27 +408,225 @@ async def fetch_fixtures(
 
 @app.post("/process-fixtures")
 async def process_fixtures(
-    background_tasks: BackgroundTasks,
     file_name: str = Query(
         ...,
         description="Nome do arquivo JSON de partidas a ser processado (dentro da pasta json/)",
     ),
+    upsert: bool = Query(
+        False,
+        description="Atualiza placar, status e tempo de partidas já existentes em vez de pulá-las",
+    ),
 ):
     """Endpoint para processar um arquivo JSON de partidas e salvar os dados no banco de dados."""
     try:
         # Lança a tarefa de processamento e salvamento no banco de dados
-        background_tasks.add_task(process_fixtures_json_and_save_to_db, file_name)
+        job_id = await job_runner.submit(
+            "process_fixtures", file_name=file_name, upsert=upsert
+        )
+
+        return {
+            "message": f"Processamento da partida do arquivo '{file_name}' iniciado em segundo plano para salvar no banco de dados.",
+            "job_id": job_id,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/process-players")
+async def process_players(
+    file_name: str = Query(
+        ...,
+        description="Nome do arquivo JSON de jogadores a ser processado (dentro da pasta json/)",
+    ),
+):
+    """Endpoint para processar um arquivo JSON de /players e gravar os perfis dos jogadores."""
+    try:
+        job_id = await job_runner.submit("process_players", file_name=file_name)
+        return {
+            "message": f"Processamento dos jogadores do arquivo '{file_name}' iniciado em segundo plano.",
+            "job_id": job_id,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/ingest/coaches")
+async def ingest_coaches(
+    league: int = Query(..., description="O id da liga segundo a API"),
+    season: int = Query(..., description="A temporada da liga (ex: 2023)"),
+):
+    """Endpoint para baixar e gravar os perfis dos técnicos das equipes de uma liga-temporada"""
+    try:
+        job_id = await job_runner.submit(
+            "ingest_league_coaches", league=league, season=season
+        )
+        return {
+            "message": f"Ingestão dos técnicos da liga (ID API: {league}, Temporada: {season}) iniciada em segundo plano.",
+            "job_id": job_id,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/ingest/league-season")
+async def ingest_league_season(
+    league: int = Query(..., description="O id da liga segundo a API"),
+    season: int = Query(..., description="A temporada da liga (ex: 2023)"),
+    country: str = Query(..., description="O nome do país da liga (ex: Brazil)"),
+    force: bool = Query(
+        False, description="Reprocessa todas as etapas mesmo sem mudanças nos arquivos"
+    ),
+):
+    """Endpoint para executar o pipeline completo de uma liga-temporada
+    (países -> estádios/equipes/liga -> equipes da liga -> partidas)."""
+    try:
+        job_id = await job_runner.submit(
+            "ingest_league_season",
+            league=league,
+            season=season,
+            country=country,
+            force=force,
+        )
+        return {
+            "message": f"Pipeline da liga (ID API: {league}, Temporada: {season}) iniciado em segundo plano.",
+            "job_id": job_id,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/ingest/fixture-statistics")
+async def ingest_fixture_statistics(
+    league: int = Query(..., description="O id da liga segundo a API"),
+    season: int = Query(..., description="A temporada da liga (ex: 2023)"),
+    force: bool = Query(
+        False, description="Baixa de novo mesmo as estatísticas já finais"
+    ),
+):
+    """Endpoint para baixar as estatísticas de todas as partidas encerradas de uma liga-temporada"""
+    try:
+        job_id = await job_runner.submit(
+            "ingest_fixture_statistics", league=league, season=season, force=force
+        )
+        return {
+            "message": f"Ingestão das estatísticas da liga (ID API: {league}, Temporada: {season}) iniciada em segundo plano.",
+            "job_id": job_id,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/ingest/fixture-players")
+async def ingest_fixture_players(
+    league: int = Query(..., description="O id da liga segundo a API"),
+    season: int = Query(..., description="A temporada da liga (ex: 2023)"),
+    force: bool = Query(
+        False, description="Baixa de novo mesmo os jogadores e escalações já finais"
+    ),
+):
+    """Endpoint para baixar as estatísticas de jogadores e as escalações de todas as partidas encerradas de uma liga-temporada"""
+    try:
+        job_id = await job_runner.submit(
+            "ingest_fixture_players", league=league, season=season, force=force
+        )
+        return {
+            "message": f"Ingestão dos jogadores e escalações da liga (ID API: {league}, Temporada: {season}) iniciada em segundo plano.",
+            "job_id": job_id,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
+
+@app.post("/rebuild-standings")
+async def rebuild_standings(
+    league_id: int = Query(..., description="O id interno da liga (tabela leagues)"),
+):
+    """Endpoint para recalcular a classificação inteira de uma liga a partir das partidas."""
+    try:
+        job_id = await job_runner.submit("rebuild_standings", league_id=league_id)
         return {
-            "message": f"Processamento da partida do arquivo '{file_name}' iniciado em segundo plano para salvar no banco de dados."
+            "message": f"Recálculo da classificação da liga {league_id} iniciado em segundo plano.",
+            "job_id": job_id,
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/rebuild-player-season-stats")
+async def rebuild_player_season_stats(
+    league_id: int = Query(..., description="O id interno da liga (tabela leagues)"),
+    dry_run: bool = Query(
+        False, description="Só compara com os totais atuais, sem gravar"
+    ),
+):
+    """Endpoint para recalcular do zero as estatísticas de temporada dos jogadores de uma liga a partir das estatísticas por partida."""
+    try:
+        job_id = await job_runner.submit(
+            "rebuild_player_season_stats", league_id=league_id, dry_run=dry_run
+        )
+        return {
+            "message": f"Recálculo das estatísticas de temporada da liga {league_id} iniciado em segundo plano.",
+            "job_id": job_id,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/refresh-leaderboards")
+async def refresh_leaderboards(
+    league_id: int = Query(..., description="O id interno da liga (tabela leagues)"),
+):
+    """Endpoint para recalcular agora os rankings de jogadores de uma liga."""
+    try:
+        job_id = await job_runner.submit("refresh_leaderboards", league_id=league_id)
+        return {
+            "message": f"Recálculo dos rankings da liga {league_id} iniciado em segundo plano.",
+            "job_id": job_id,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/live/start")
+async def start_live_updates():
+    """Endpoint para iniciar o acompanhamento contínuo das partidas ao vivo"""
+    live_updater.start()
+    return {"message": "Atualização de partidas ao vivo iniciada"}
+
+
+@app.post("/live/stop")
+async def stop_live_updates():
+    """Endpoint para parar o acompanhamento das partidas ao vivo"""
+    await live_updater.stop()
+    return {"message": "Atualização de partidas ao vivo parada"}
+
+
+@app.get("/metrics")
+async def metrics():
+    """Métricas do processo: hashes de senha, jobs, API, clientes ao vivo, feeds, pool do banco e rankings"""
+    return {
+        "password_hasher": password_hasher.metrics(),
+        "ingestion_queue_size": job_runner.queue_size(),
+        "api_daily_remaining": api_scheduler.current_daily_remaining(),
+        "live_fixtures_tracked": live_updater.tracked_count(),
+        "live_subscribers": broker.subscriber_count(),
+        "feed_cache": feed_cache.metrics(),
+        "database_pool": pool_metrics(engine.pool),
+        "replica_pool": pool_metrics(replica_engine.pool) if replica_engine else None,
+        "replica": replica_router.metrics(),
+        "leaderboard_cache": leaderboard_cache.metrics(),
+        "leaderboards": leaderboard_refresher.metrics(),
+    }
+
+
 @app.get("/")
 async def root(db: AsyncSession = Depends(get_db_session)):
     return {"message": "Conexão establecida com o banco de dados"}
 
 
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
+app.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
+app.include_router(fixtures.router, prefix="/fixtures", tags=["fixtures"])
+app.include_router(leagues.router, prefix="/leagues", tags=["leagues"])
+app.include_router(live.router, prefix="/live", tags=["live"])
+app.include_router(me.router, prefix="/me", tags=["me"])
@@ -0,0 +1,79 @@
+"""
+Responsividade do event loop durante signins simultâneos: o bcrypt chamado
+direto no handler (como era) contra o pool dedicado de utils.security.
+
+Enquanto `--concurrency` verificações de senha rodam, uma tarefa mede o
+atraso de um `asyncio.sleep(0.01)` repetido; é esse atraso que as demais
+requisições do worker sentem.
+
+Uso:
+    BCRYPT_ROUNDS=12 python -m benchmarks.bench_auth --concurrency 32
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.security import PasswordHasher, hash_password, verify_password
+
+
+async def monitor_lag(stop: asyncio.Event, lags: list):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append((time.perf_counter() - start - 0.01) * 1000)
+
+
+async def run(concurrency: int, hashed: str, hasher=None):
+    async def signin():
+        if hasher is None:
+            return verify_password("securepassword", hashed)
+        return await hasher.verify("securepassword", hashed)
+
+    stop = asyncio.Event()
+    lags = []
+    monitor = asyncio.create_task(monitor_lag(stop, lags))
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(signin() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await monitor
+    return elapsed, lags
+
+
+def report(label: str, elapsed: float, lags: list, concurrency: int):
+    lags = sorted(lags) or [0.0]
+    print(
+        f"{label:10} {concurrency / elapsed:6.1f} signins/s | atraso do loop: "
+        f"mediana {statistics.median(lags):7.1f} ms, máx {lags[-1]:7.1f} ms, "
+        f"{len(lags)} medições"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    hashed = hash_password("securepassword")
+    hasher = PasswordHasher(workers=args.workers, max_pending=args.concurrency)
+
+    elapsed, lags = asyncio.run(run(args.concurrency, hashed))
+    report("inline", elapsed, lags, args.concurrency)
+    elapsed, lags = asyncio.run(run(args.concurrency, hashed, hasher))
+    report("pool", elapsed, lags, args.concurrency)
+    print(hasher.metrics())
+    hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark do download de payloads: `requests.get` bloqueante (sem sessão,
+uma conexão nova por chamada, rodando no threadpool como as BackgroundTasks
+síncronas) contra o cliente httpx assíncrono compartilhado.
+
+Sobe um servidor stub local que devolve um payload no formato da API e
+mede requisições por segundo em cada modo. Como o stub é HTTP puro em
+loopback, cada conexão nova espera `--handshake-ms` para simular o custo
+do handshake TCP+TLS com v3.football.api-sports.io.
+
+Uso:
+    python -m benchmarks.bench_fetch --requests 500 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PAYLOAD_FILE = os.path.join("json", "leagues_id_71_season_2023.json")
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # mantém a conexão aberta (keep-alive)
+    payload = b"{}"
+    handshake_delay = 0.0
+
+    def setup(self):
+        # Executado uma vez por conexão TCP aceita
+        super().setup()
+        time.sleep(self.handshake_delay)
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.payload)))
+        self.end_headers()
+        self.wfile.write(self.payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(handshake_delay):
+    _StubHandler.handshake_delay = handshake_delay
+    with open(PAYLOAD_FILE, "rb") as payload_file:
+        _StubHandler.payload = json.dumps(json.load(payload_file)).encode()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+async def run_blocking(base_url, total, concurrency):
+    import requests
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            response = await asyncio.to_thread(
+                requests.get, f"{base_url}/leagues", params={"id": 71}
+            )
+            response.json()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return total / (time.perf_counter() - start)
+
+
+async def run_async_pool(total, concurrency):
+    from integrations.http_client import get_http_client, close_http_client
+
+    client = get_http_client()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            response = await client.get("/leagues", params={"id": 71})
+            response.json()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - start
+    await close_http_client()
+    return total / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--handshake-ms", type=float, default=30.0)
+    args = parser.parse_args()
+
+    server = start_stub_server(args.handshake_ms / 1000)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    # O cliente compartilhado lê API_BASE_URL do config na importação
+    os.environ["API_BASE_URL"] = base_url
+
+    try:
+        before = asyncio.run(run_blocking(base_url, args.requests, args.concurrency))
+        after = asyncio.run(run_async_pool(args.requests, args.concurrency))
+    finally:
+        server.shutdown()
+
+    print(f"requests.get (sem sessão) : {before:8.1f} req/s")
+    print(f"httpx.AsyncClient (pool)  : {after:8.1f} req/s")
+    print(f"ganho                     : {after / before:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
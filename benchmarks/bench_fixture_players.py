@@ -0,0 +1,210 @@
+"""
+Vazão (linhas/s) da gravação de fixture_player_stats: o caminho ORM
+(`session.add_all` + commit, um INSERT por linha) contra o COPY numa tabela
+temporária seguido de merge de integrations.fixture_players.
+
+Precisa de um Postgres descartável em DATABASE_URL: as tabelas são criadas
+num schema próprio (`--schema`), apagado no fim. Com uma URL SQLite o COPY
+cai para um INSERT em lote e os números não representam o Postgres.
+
+Uso:
+    DATABASE_URL=postgresql+asyncpg://postgres@localhost/bench \\
+        python -m benchmarks.bench_fixture_players --fixtures 380 --repeat 3
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from database.database import Base, DATABASE_URL
+from integrations.fixture_players import parse_player_stats, save_player_stats
+from models import (
+    base_coach,
+    base_player,
+    base_team,
+    country,
+    fixture,
+    fixture_lineup,
+    fixture_player_stat,
+    fixture_statistic,
+    league,
+    league_classification,
+    league_team,
+    player_season_stat,
+    user,
+    venue,
+)
+from models.base_player import BasePlayer
+from models.base_team import BaseTeam
+from models.country import Country
+from models.fixture import Fixture
+from models.fixture_player_stat import FixturePlayerStat
+from models.league import League
+from models.league_team import LeagueTeam
+
+PLAYERS_PER_TEAM = 16
+TEAMS = 20
+
+
+def player_payload(team_api_id: int) -> dict:
+    """Um item de /fixtures/players com estatísticas em todos os grupos."""
+    players = []
+    for number in range(PLAYERS_PER_TEAM):
+        players.append(
+            {
+                "player": {"id": team_api_id * 100 + number},
+                "statistics": [
+                    {
+                        "games": {
+                            "minutes": 90,
+                            "number": number + 1,
+                            "position": "M",
+                            "rating": "7.1",
+                            "captain": number == 0,
+                            "substitute": number >= 11,
+                        },
+                        "offsides": 0,
+                        "shots": {"total": 2, "on": 1},
+                        "goals": {"total": 0, "conceded": 0, "assists": 1, "saves": 0},
+                        "passes": {"total": 40, "key": 2, "accuracy": "88"},
+                        "tackles": {"total": 3, "blocks": 0, "interceptions": 1},
+                        "duels": {"total": 9, "won": 5},
+                        "dribbles": {"attempts": 2, "success": 1, "past": 0},
+                        "fouls": {"drawn": 1, "committed": 2},
+                        "cards": {"yellow": 0, "red": 0},
+                        "penalty": {
+                            "won": 0,
+                            "commited": 0,
+                            "scored": 0,
+                            "missed": 0,
+                            "saved": 0,
+                        },
+                    }
+                ],
+            }
+        )
+    return {"team": {"id": team_api_id}, "players": players}
+
+
+async def seed(factory, fixtures: int) -> list:
+    """Cadastra liga, equipes, jogadores e partidas e devolve as linhas a gravar."""
+    now = datetime(2023, 1, 1)
+    async with factory() as session:
+        session.add(Country(id=1, name="Benchland"))
+        session.add(
+            League(id=1, api_id=1, season=2023, name="B", type="League", country_id=1)
+        )
+        await session.flush()
+        await session.execute(
+            insert(BaseTeam),
+            [
+                {"api_id": team, "name": f"T{team}", "country_id": 1}
+                for team in range(1, TEAMS + 1)
+            ],
+        )
+        await session.execute(
+            insert(LeagueTeam),
+            [
+                {"id": team, "league_id": 1, "base_team_api_id": team}
+                for team in range(1, TEAMS + 1)
+            ],
+        )
+        await session.execute(
+            insert(BasePlayer),
+            [
+                {"api_id": team * 100 + number, "name": "P", "firstname": "P"}
+                for team in range(1, TEAMS + 1)
+                for number in range(PLAYERS_PER_TEAM)
+            ],
+        )
+        await session.execute(
+            insert(Fixture),
+            [
+                {
+                    "api_id": fixture_id,
+                    "league_id": 1,
+                    "round": "R",
+                    "home_team_id": fixture_id % TEAMS + 1,
+                    "away_team_id": (fixture_id + 1) % TEAMS + 1,
+                }
+                for fixture_id in range(1, fixtures + 1)
+            ],
+        )
+        await session.commit()
+
+    rows = []
+    for fixture_id in range(1, fixtures + 1):
+        home, away = fixture_id % TEAMS + 1, (fixture_id + 1) % TEAMS + 1
+        data = {"response": [player_payload(home), player_payload(away)]}
+        league_teams = {home: home, away: away}
+        rows.extend(parse_player_stats(fixture_id, data, league_teams, {}, now))
+    return rows
+
+
+async def save_orm(session, rows: list):
+    session.add_all(FixturePlayerStat(**row) for row in rows)
+
+
+async def timed(factory, rows: list, save, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        async with factory() as session:
+            await session.execute(delete(FixturePlayerStat))
+            await session.commit()
+        start = time.perf_counter()
+        async with factory() as session:
+            await save(session, rows)
+            await session.commit()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fixtures", type=int, default=380)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--schema", default="bench_fixture_players")
+    args = parser.parse_args()
+
+    postgres = DATABASE_URL.get_backend_name() == "postgresql"
+    drop_schema = text(f'DROP SCHEMA IF EXISTS "{args.schema}" CASCADE')
+    options = {}
+    if postgres:
+        admin = create_async_engine(DATABASE_URL)
+        async with admin.begin() as connection:
+            await connection.execute(drop_schema)
+            await connection.execute(text(f'CREATE SCHEMA "{args.schema}"'))
+        options["connect_args"] = {"server_settings": {"search_path": args.schema}}
+
+    engine = create_async_engine(DATABASE_URL, **options)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        rows = await seed(factory, args.fixtures)
+        print(f"{len(rows)} linhas ({args.fixtures} partidas), melhor de {args.repeat}")
+
+        strategies = (("orm add_all", save_orm), ("copy + merge", save_player_stats))
+        for name, save in strategies:
+            elapsed = await timed(factory, rows, save, args.repeat)
+            rate = len(rows) / elapsed
+            print(f"{name:14} {elapsed * 1000:9.1f} ms  {rate:10.0f} linhas/s")
+    finally:
+        await engine.dispose()
+        if postgres:
+            async with admin.begin() as connection:
+                await connection.execute(drop_schema)
+            await admin.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+"""
+Pico de memória (tracemalloc) ao percorrer os itens de `response` com
+`json.load` contra `iter_response_items` + `iter_chunks`, para cada
+arquivo da pasta json/.
+
+Uso:
+    python -m benchmarks.bench_json_stream --chunk-size 500
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integrations.json_stream import iter_response_items, iter_chunks
+
+
+def measure(consume):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = consume()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+
+    for file_name in sorted(os.listdir("json")):
+        if not file_name.endswith(".json"):
+            continue
+        file_path = os.path.join("json", file_name)
+
+        def full_load():
+            with open(file_path) as json_file:
+                return len(json.load(json_file)["response"])
+
+        def streamed():
+            return sum(
+                len(chunk)
+                for chunk in iter_chunks(
+                    iter_response_items(file_path), args.chunk_size
+                )
+            )
+
+        count, load_peak, load_time = measure(full_load)
+        _, stream_peak, stream_time = measure(streamed)
+        print(
+            f"{file_name:45} {count:5} itens | json.load {load_peak / 1024:8.0f} KiB "
+            f"{load_time * 1000:7.1f} ms | stream {stream_peak / 1024:8.0f} KiB "
+            f"{stream_time * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Espaço em disco e tempo de leitura dos payloads da pasta json/ em cada
+formato de armazenamento: o JSON original (indent=4), gzip e zstd (se o
+pacote zstandard estiver instalado). A leitura percorre todos os itens de
+`response` com `iter_response_items`, como fazem os processadores.
+
+Uso:
+    python -m benchmarks.bench_payload_storage --repeat 3
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integrations.json_stream import iter_response_items
+from integrations.payload_storage import (
+    EXTENSIONS,
+    GZIP,
+    JSON,
+    ZSTD,
+    write_payload,
+    zstandard,
+)
+
+
+def best_time(function, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    formats = [JSON, GZIP] + ([ZSTD] if zstandard is not None else [])
+    totals = {fmt: [0, 0.0, 0.0] for fmt in formats}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for file_name in sorted(os.listdir("json")):
+            if not file_name.endswith(".json"):
+                continue
+            with open(os.path.join("json", file_name)) as json_file:
+                data = json.load(json_file)
+
+            line = [f"{file_name:40}"]
+            for fmt in formats:
+                if fmt == JSON:
+                    # O arquivo original, como o fetch gravava até agora
+                    path = os.path.join("json", file_name)
+                    write_time = 0.0
+                else:
+                    path = os.path.join(tmp, file_name + EXTENSIONS[fmt])
+                    write_time = best_time(
+                        lambda: write_payload(path, data, fmt), args.repeat
+                    )
+                size = os.path.getsize(path)
+                read_time = best_time(
+                    lambda: sum(1 for _ in iter_response_items(path)), args.repeat
+                )
+                totals[fmt][0] += size
+                totals[fmt][1] += read_time
+                totals[fmt][2] += write_time
+                line.append(
+                    f"{fmt} {size / 1024:7.0f} KiB {read_time * 1000:6.1f} ms"
+                )
+            print(" | ".join(line))
+
+    print()
+    base_size = totals[JSON][0]
+    for fmt, (size, read_time, write_time) in totals.items():
+        print(
+            f"{fmt:5} total {size / 1024:8.0f} KiB ({size / base_size:6.1%}) | "
+            f"leitura {read_time * 1000:7.1f} ms | gravação {write_time * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,5 +5,121 @@ load_dotenv()
 
 API_HOST = "v3.football.api-sports.io"
 API_KEY = os.getenv("API_KEY")
+# Permite apontar o cliente para um servidor local (ex.: stub de benchmark)
+API_BASE_URL = os.getenv("API_BASE_URL", f"https://{API_HOST}")
 
 HEADERS = {"x-rapidapi-host": API_HOST, "x-rapidapi-key": API_KEY}
+
+# Pool de conexões do cliente HTTP compartilhado
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+
+# Quantidade de itens de `response` gravados por commit nos processadores
+INGEST_CHUNK_SIZE = int(os.getenv("INGEST_CHUNK_SIZE", "500"))
+
+# Validade (segundos) do cache em memória de países (nome -> id)
+COUNTRY_CACHE_TTL = int(os.getenv("COUNTRY_CACHE_TTL", "86400"))
+
+# Quantidade de jobs de ingestão executados ao mesmo tempo
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "4"))
+
+# Limites da API (ajustados em tempo real pelos cabeçalhos x-ratelimit-*)
+API_RATE_PER_MINUTE = int(os.getenv("API_RATE_PER_MINUTE", "30"))
+API_BURST = int(os.getenv("API_BURST", "5"))
+API_MAX_RETRIES = int(os.getenv("API_MAX_RETRIES", "5"))
+API_BACKOFF_BASE = float(os.getenv("API_BACKOFF_BASE", "1"))
+API_BACKOFF_MAX = float(os.getenv("API_BACKOFF_MAX", "60"))
+# Requisições diárias reservadas para partidas ao vivo
+API_DAILY_RESERVE = int(os.getenv("API_DAILY_RESERVE", "0"))
+
+# Páginas buscadas em paralelo quando um endpoint é paginado
+API_PAGE_CONCURRENCY = int(os.getenv("API_PAGE_CONCURRENCY", "4"))
+
+# Tamanho máximo (MB) da pasta json/cache com os payloads brutos da API
+PAYLOAD_CACHE_MAX_BYTES = int(os.getenv("PAYLOAD_CACHE_MAX_MB", "500")) * 1024 * 1024
+# Segundos em que um payload recém-servido não é apagado pelo limite de tamanho
+PAYLOAD_CACHE_EVICTION_GRACE = int(os.getenv("PAYLOAD_CACHE_EVICTION_GRACE", "600"))
+
+# Formato dos payloads gravados em json/cache: "json" (legível), "gzip" ou "zstd"
+PAYLOAD_STORAGE_FORMAT = os.getenv("PAYLOAD_STORAGE_FORMAT", "gzip")
+PAYLOAD_COMPRESSION_LEVEL = int(os.getenv("PAYLOAD_COMPRESSION_LEVEL", "6"))
+
+# Atualização de partidas ao vivo (/fixtures?live=...)
+LIVE_UPDATER_ENABLED = os.getenv("LIVE_UPDATER_ENABLED", "false").lower() == "true"
+LIVE_POLL_INTERVAL = float(os.getenv("LIVE_POLL_INTERVAL", "15"))
+# "all" ou ids de ligas separados por "-" (ex: "71-72")
+LIVE_LEAGUES = os.getenv("LIVE_LEAGUES", "all")
+
+# Pub/sub das atualizações de partidas: "local" (um processo) ou "postgres"
+# (LISTEN/NOTIFY, para vários workers)
+BROKER_BACKEND = os.getenv("BROKER_BACKEND", "local")
+# Eventos guardados por cliente conectado antes de descartar os mais antigos
+SUBSCRIBER_QUEUE_SIZE = int(os.getenv("SUBSCRIBER_QUEUE_SIZE", "100"))
+# Intervalo (segundos) dos comentários de keep-alive do SSE
+SSE_HEARTBEAT_INTERVAL = float(os.getenv("SSE_HEARTBEAT_INTERVAL", "15"))
+
+# Custo do bcrypt (2^rounds iterações) e pool dedicado aos hashes de senha
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(
+    os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+# Hashes na fila + em execução antes de recusar novos pedidos (503)
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
+# Tokens de autenticação (JWT HS256): chave de assinatura e validades em segundos
+AUTH_SECRET_KEY = os.getenv("AUTH_SECRET_KEY")
+ACCESS_TOKEN_TTL = int(os.getenv("ACCESS_TOKEN_TTL", "900"))
+REFRESH_TOKEN_TTL = int(os.getenv("REFRESH_TOKEN_TTL", str(30 * 24 * 3600)))
+
+# Cache do /me/feed por (equipe favorita, ligas favoritas): validade máxima
+# em segundos (as gravações de partidas invalidam antes) e número de entradas
+FEED_CACHE_TTL = int(os.getenv("FEED_CACHE_TTL", "300"))
+FEED_CACHE_MAX_ENTRIES = int(os.getenv("FEED_CACHE_MAX_ENTRIES", "1000"))
+
+# Banco de dados. DATABASE_URL, se definida, substitui as variáveis DB_*
+# (ex.: um Postgres local ou "sqlite+aiosqlite:///teste.db" nos testes)
+DB_URL = os.getenv("DATABASE_URL")
+DB_SSL = os.getenv("DB_SSL", "true").lower() == "true"
+# Certificado da CA do servidor; padrão: database/ca.pem
+DB_CA_FILE = os.getenv("DB_CA_FILE")
+# Pool de conexões do SQLAlchemy (por processo)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Conexões mais velhas que isso (segundos) são reabertas; -1 desativa
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# Cache de prepared statements do asyncpg por conexão; 0 atrás do pgbouncer
+# em modo transaction
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+
+# Réplica de leitura para as rotas GET pesadas (mesmas opções de pool do
+# primário). Sem DATABASE_REPLICA_URL todas as leituras vão ao primário.
+DB_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+# Atraso de replicação (segundos) acima do qual as leituras voltam ao primário
+DB_REPLICA_MAX_LAG = float(os.getenv("DB_REPLICA_MAX_LAG", "10"))
+DB_REPLICA_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_CHECK_INTERVAL", "5"))
+
+# Downloads simultâneos de /fixtures/statistics (um por partida) na ingestão
+# de estatísticas; a cota da API continua limitada pelo agendador
+STATISTICS_CONCURRENCY = int(os.getenv("STATISTICS_CONCURRENCY", "8"))
+
+# Ingestão de jogadores e escalações por partida: downloads simultâneos
+# (duas chamadas por partida) e linhas por COPY/merge
+PLAYERS_CONCURRENCY = int(os.getenv("PLAYERS_CONCURRENCY", "4"))
+COPY_CHUNK_SIZE = int(os.getenv("COPY_CHUNK_SIZE", "5000"))
+
+# Rankings de jogadores por liga (artilharia, assistências, ...): linhas
+# guardadas por métrica, intervalo (segundos) do recálculo das ligas cujas
+# estatísticas de temporada mudaram e mínimo de partidas com nota para
+# entrar no ranking de nota média
+LEADERBOARD_SIZE = int(os.getenv("LEADERBOARD_SIZE", "50"))
+LEADERBOARD_REFRESH_INTERVAL = float(os.getenv("LEADERBOARD_REFRESH_INTERVAL", "60"))
+LEADERBOARD_MIN_RATED_APPEARANCES = int(
+    os.getenv("LEADERBOARD_MIN_RATED_APPEARANCES", "5")
+)
+# Cache em memória dos rankings mais consultados; recarregado a cada recálculo
+LEADERBOARD_CACHE_TTL = float(os.getenv("LEADERBOARD_CACHE_TTL", "3600"))
+LEADERBOARD_CACHE_MAX_ENTRIES = int(os.getenv("LEADERBOARD_CACHE_MAX_ENTRIES", "500"))
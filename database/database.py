@@ -1,30 +1,120 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.orm import declarative_base
 from dotenv import load_dotenv
+from config import (
+    DB_URL,
+    DB_SSL,
+    DB_CA_FILE,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_STATEMENT_CACHE_SIZE,
+    DB_REPLICA_URL,
+)
+from database.pool import InstrumentedPool
+from database.replica import ReplicaRouter
 import ssl
 import os
 
 load_dotenv()
 
-DATABASE_URL = (
-    f"postgresql+asyncpg://{os.getenv('DB_USER')}:"
-    f"{os.getenv('DB_PASSWORD')}@"
-    f"{os.getenv('DB_HOST')}:"
-    f"{os.getenv('DB_PORT')}/"
-    f"{os.getenv('DB_NAME')}"
-)
+
+def _database_url() -> URL:
+    if DB_URL:
+        return make_url(DB_URL)
+    port = os.getenv("DB_PORT")
+    return URL.create(
+        "postgresql+asyncpg",
+        username=os.getenv("DB_USER"),
+        password=os.getenv("DB_PASSWORD"),
+        host=os.getenv("DB_HOST"),
+        port=int(port) if port else None,
+        database=os.getenv("DB_NAME"),
+    )
+
+
+DATABASE_URL = _database_url()
+
+
+def _ssl_context() -> ssl.SSLContext:
+    # Caminho relativo a este arquivo, e não à pasta de onde o app foi iniciado
+    ca_file = DB_CA_FILE or os.path.join(os.path.dirname(__file__), "ca.pem")
+    if os.path.exists(ca_file):
+        return ssl.create_default_context(cafile=ca_file)
+    print(f"Certificado {ca_file} não encontrado: usando as CAs do sistema.")
+    return ssl.create_default_context()
+
+
+def _engine_options(url: URL) -> dict:
+    """
+    Pool e opções de conexão do Postgres. Outros bancos (ex.: SQLite nos
+    testes) usam o pool padrão do dialeto.
+    """
+    if url.get_backend_name() != "postgresql":
+        return {}
+    connect_args = {"statement_cache_size": DB_STATEMENT_CACHE_SIZE}
+    if DB_SSL:
+        connect_args["ssl"] = _ssl_context()
+    return {
+        "poolclass": InstrumentedPool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
 
 
-ssl_context = ssl.create_default_context(cafile="database/ca.pem")
+def _engine_url(url: URL) -> URL:
+    if url.get_backend_name() != "postgresql":
+        return url
+    # Cache de statements do próprio SQLAlchemy, acompanhando o do asyncpg
+    return url.update_query_dict(
+        {"prepared_statement_cache_size": str(DB_STATEMENT_CACHE_SIZE)}
+    )
+
 
 Base = declarative_base()
 
-engine = create_async_engine(DATABASE_URL, connect_args={"ssl": ssl_context})
+engine = create_async_engine(
+    _engine_url(DATABASE_URL), **_engine_options(DATABASE_URL)
+)
 async_session_factory = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
 
+# Réplica de leitura opcional, com o mesmo pool e as mesmas opções do primário
+replica_engine = None
+replica_session_factory = None
+if DB_REPLICA_URL:
+    replica_url = make_url(DB_REPLICA_URL)
+    replica_engine = create_async_engine(
+        _engine_url(replica_url), **_engine_options(replica_url)
+    )
+    replica_session_factory = async_sessionmaker(
+        replica_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+replica_router = ReplicaRouter(
+    async_session_factory, replica_engine, replica_session_factory
+)
+
+
 async def get_db_session():
+    """Sessão no primário: gravações e leituras que precisam ver a última escrita."""
     async with async_session_factory() as session:
         yield session
+
+
+async def get_read_session():
+    """
+    Sessão das rotas GET pesadas: na réplica quando ela está em dia, senão
+    no primário.
+    """
+    async with replica_router.reader_factory()() as session:
+        yield session
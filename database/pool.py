@@ -0,0 +1,56 @@
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Pool assíncrono padrão do SQLAlchemy que também mede a espera para
+    obter uma conexão (fila do pool mais a abertura de conexões novas) e
+    conta as esperas que estouraram o `pool_timeout`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+
+def pool_metrics(pool) -> dict:
+    """Ocupação do pool de conexões e, no InstrumentedPool, o tempo de espera."""
+    metrics = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        metrics.update(
+            {
+                "size": pool.size(),
+                "in_use": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(0, pool.overflow()),
+            }
+        )
+    if isinstance(pool, InstrumentedPool):
+        checkouts = pool.checkouts or 1
+        metrics.update(
+            {
+                "checkouts": pool.checkouts,
+                "timeouts": pool.timeouts,
+                "avg_wait_ms": round(pool.wait_total / checkouts * 1000, 2),
+                "max_wait_ms": round(pool.wait_max * 1000, 2),
+            }
+        )
+    return metrics
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from config import DB_REPLICA_MAX_LAG, DB_REPLICA_CHECK_INTERVAL
+from sqlalchemy import text
+
+# Atraso de uma réplica Postgres em streaming: zero quando tudo o que foi
+# recebido já foi aplicado (ou quando o servidor não está em recuperação),
+# senão o tempo desde a última transação aplicada. NULL = réplica sem dados.
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """
+)
+
+
+class ReplicaRouter:
+    """
+    Escolhe a fábrica de sessões das leituras: a réplica enquanto o atraso
+    medido estiver dentro de `max_lag`, o primário caso contrário.
+
+    O atraso é medido em segundo plano a cada `interval` segundos. Até a
+    primeira medição, ou se a réplica não responde, as leituras vão ao
+    primário.
+    """
+
+    def __init__(
+        self,
+        primary_factory,
+        replica_engine=None,
+        replica_factory=None,
+        max_lag: float = DB_REPLICA_MAX_LAG,
+        interval: float = DB_REPLICA_CHECK_INTERVAL,
+    ):
+        self.primary_factory = primary_factory
+        self.replica_engine = replica_engine
+        self.replica_factory = replica_factory
+        self.max_lag = max_lag
+        self.interval = interval
+        self.lag = None  # segundos; None = desconhecido ou réplica fora do ar
+        self.checked_at = None
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self._task = None
+
+    @property
+    def healthy(self) -> bool:
+        return self.lag is not None and self.lag <= self.max_lag
+
+    def reader_factory(self):
+        if self.replica_factory is not None and self.healthy:
+            self.replica_reads += 1
+            return self.replica_factory
+        self.primary_reads += 1
+        return self.primary_factory
+
+    async def check(self):
+        """Mede o atraso da réplica e atualiza o roteamento."""
+        if self.replica_engine is None:
+            return
+        was_healthy = self.healthy
+        try:
+            async with self.replica_engine.connect() as connection:
+                if self.replica_engine.dialect.name == "postgresql":
+                    lag = await connection.scalar(REPLICA_LAG_QUERY)
+                else:
+                    # Instância independente (ex.: SQLite nos testes): sem replicação
+                    await connection.execute(text("SELECT 1"))
+                    lag = 0
+            self.lag = None if lag is None else float(lag)
+        except Exception as e:
+            self.lag = None
+            if was_healthy:
+                print(f"Réplica de leitura indisponível: {e}")
+        self.checked_at = time.time()
+        if was_healthy and not self.healthy and self.lag is not None:
+            print(
+                f"Réplica de leitura com atraso de {self.lag:.1f}s: leituras no primário."
+            )
+
+    async def start(self):
+        if self.replica_engine is None:
+            return
+        await self.check()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
+
+    def metrics(self) -> dict:
+        return {
+            "configured": self.replica_engine is not None,
+            "healthy": self.healthy,
+            "lag_seconds": self.lag,
+            "max_lag_seconds": self.max_lag,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+        }
@@ -0,0 +1,168 @@
+import asyncio
+import json
+from config import BROKER_BACKEND, SUBSCRIBER_QUEUE_SIZE
+from database.database import engine
+from sqlalchemy import text
+from typing import Iterable
+
+# Canal do LISTEN/NOTIFY usado quando BROKER_BACKEND=postgres
+NOTIFY_CHANNEL = "fixture_updates"
+
+
+def fixture_event(row: dict, home_team_api_id: int, away_team_api_id: int) -> dict:
+    """Evento publicado para uma linha de Fixture gravada (placar, status e tempo)."""
+    return {
+        "api_id": row["api_id"],
+        "league_id": row["league_id"],
+        "home_team_api_id": home_team_api_id,
+        "away_team_api_id": away_team_api_id,
+        "status": row["status"],
+        "status_short": row["status_short"],
+        "elapsed": row["elapsed"],
+        "home_team_score_goals": row["home_team_score_goals"],
+        "away_team_score_goals": row["away_team_score_goals"],
+    }
+
+
+def fixture_topics(event: dict) -> set:
+    """Tópicos de uma atualização de partida: a partida, a liga e as duas equipes."""
+    return {
+        f"fixture:{event['api_id']}",
+        f"league:{event['league_id']}",
+        f"team:{event['home_team_api_id']}",
+        f"team:{event['away_team_api_id']}",
+    }
+
+
+class Subscription:
+    """
+    Fila de eventos de um cliente conectado. Se o cliente não consome a
+    tempo, os eventos mais antigos são descartados para não acumular memória.
+    """
+
+    def __init__(self, broker, topics: set, maxsize: int):
+        self.topics = topics
+        self.dropped = 0
+        self._broker = broker
+        self._queue = asyncio.Queue(maxsize=maxsize)
+
+    def put(self, event: dict):
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    async def get(self) -> dict:
+        return await self._queue.get()
+
+    def close(self):
+        self._broker.unsubscribe(self)
+
+
+class Broker:
+    """
+    Pub/sub em memória das atualizações de partidas.
+
+    A ingestão publica cada mudança uma única vez e o broker a entrega a
+    todos os clientes inscritos nos tópicos da partida (`fixture:<api_id>`,
+    `league:<league_id>`, `team:<api_id da equipe>`), sem nenhuma leitura no
+    banco por cliente.
+
+    Com `backend="postgres"` a publicação vira um NOTIFY e cada processo
+    (worker do uvicorn) escuta o canal com LISTEN, repassando os eventos aos
+    seus próprios inscritos; com `backend="local"` tudo fica no processo.
+    """
+
+    def __init__(
+        self, backend: str = BROKER_BACKEND, queue_size: int = SUBSCRIBER_QUEUE_SIZE
+    ):
+        self.backend = backend
+        self.queue_size = queue_size
+        self._subscriptions = {}  # tópico -> conjunto de Subscription
+        self._listeners = []
+        self._listen_connection = None
+
+    async def start(self):
+        if self.backend != "postgres":
+            return
+        # Conexão dedicada ao LISTEN, fora do pool das sessões
+        self._listen_connection = await engine.connect()
+        raw_connection = await self._listen_connection.get_raw_connection()
+        await raw_connection.driver_connection.add_listener(
+            NOTIFY_CHANNEL, self._on_notify
+        )
+        print(f"Broker de partidas escutando o canal {NOTIFY_CHANNEL}.")
+
+    async def stop(self):
+        if self._listen_connection is not None:
+            await self._listen_connection.close()
+            self._listen_connection = None
+
+    def subscribe(self, topics: Iterable[str]) -> Subscription:
+        subscription = Subscription(self, set(topics), self.queue_size)
+        for topic in subscription.topics:
+            self._subscriptions.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        for topic in subscription.topics:
+            subscribers = self._subscriptions.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[topic]
+
+    def add_listener(self, callback):
+        """
+        Registra `callback(events)`, chamado no processo a cada lote de
+        atualizações entregue (ex.: invalidação de caches).
+        """
+        self._listeners.append(callback)
+
+    def subscriber_count(self) -> int:
+        return len(
+            {s for subscribers in self._subscriptions.values() for s in subscribers}
+        )
+
+    async def publish(self, events: list):
+        """Publica atualizações de partidas (dicts com api_id, league_id e equipes)."""
+        if not events:
+            return
+        if self.backend != "postgres":
+            self._deliver(events)
+            return
+        try:
+            async with engine.begin() as connection:
+                await connection.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    [
+                        {"channel": NOTIFY_CHANNEL, "payload": json.dumps(event)}
+                        for event in events
+                    ],
+                )
+        except Exception as e:
+            # A gravação já foi feita; uma falha na notificação não desfaz a ingestão
+            print(f"Erro ao publicar {len(events)} atualizações de partidas: {e}")
+
+    def _on_notify(self, connection, pid, channel, payload):
+        try:
+            self._deliver([json.loads(payload)])
+        except Exception as e:
+            print(f"Erro ao repassar notificação do canal {channel}: {e}")
+
+    def _deliver(self, events: list):
+        for listener in self._listeners:
+            try:
+                listener(events)
+            except Exception as e:
+                print(f"Erro no ouvinte de atualizações de partidas: {e}")
+        for event in events:
+            # Um cliente inscrito na partida e na liga recebe o evento uma vez
+            subscribers = set()
+            for topic in fixture_topics(event):
+                subscribers.update(self._subscriptions.get(topic, ()))
+            for subscription in subscribers:
+                subscription.put(event)
+
+
+broker = Broker()
@@ -0,0 +1,46 @@
+from sqlalchemy import Column, MetaData, Table, insert
+
+
+def staging_table(model, columns: tuple) -> Table:
+    """
+    Tabela temporária com as colunas `columns` de `model`, sem chaves nem
+    restrições: recebe o COPY e serve de origem para o merge.
+    """
+    table = model.__table__
+    return Table(
+        f"{table.name}_staging",
+        MetaData(),
+        *(Column(name, table.c[name].type) for name in columns),
+        prefixes=["TEMPORARY"],
+    )
+
+
+async def copy_to_staging(session, model, columns: tuple, rows: list) -> Table:
+    """
+    Cria a tabela temporária de `model` na conexão da sessão e carrega
+    `rows` (dicts) nela.
+
+    No asyncpg a carga usa COPY (`copy_records_to_table`), que envia as
+    linhas em formato binário num único comando, sem um INSERT por linha.
+    Em outros drivers (ex.: SQLite nos testes) cai para um INSERT em lote.
+    A tabela fica na transação da sessão; `drop_staging` a remove.
+    """
+    staging = staging_table(model, columns)
+    connection = await session.connection()
+    await connection.run_sync(staging.create)
+
+    if connection.dialect.driver == "asyncpg":
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            staging.name,
+            records=[tuple(row[name] for name in columns) for row in rows],
+            columns=list(columns),
+        )
+    else:
+        await connection.execute(insert(staging), rows)
+    return staging
+
+
+async def drop_staging(session, staging: Table):
+    connection = await session.connection()
+    await connection.run_sync(staging.drop)
@@ -1,31 +1,68 @@
 import json
 import os
+from config import INGEST_CHUNK_SIZE
 from database.database import async_session_factory
 from datetime import datetime, timezone
+from integrations.json_stream import (
+    iter_response_chunks,
+    UnexpectedPayloadError,
+)
+from integrations.reference_cache import country_cache
 from models.country import Country
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 
-async def process_countries_json_and_save_to_db(file_name="countries.json"):
+async def process_countries_json_and_save_to_db(
+    file_name="countries.json", chunk_size: int = INGEST_CHUNK_SIZE
+):
     json_dir = "json"
     file_path = os.path.join(json_dir, file_name)
+    saved_count = 0
 
     try:
-        with open(file_path, "r") as json_file:
-            data = json.load(json_file)
-        if "response" in data and isinstance(data["response"], list):
-            async with async_session_factory() as session:
-                for country_data in data["response"]:
-                    country = Country(
-                        name=country_data["name"],
-                        flag_url=country_data["flag"],
-                        last_updated=datetime.now(timezone.utc).replace(tzinfo=None),
-                    )
-                    session.add(country)
+        async with async_session_factory() as session:
+            async for chunk in iter_response_chunks(file_path, chunk_size):
+                now = datetime.now(timezone.utc).replace(tzinfo=None)
+                # Um mesmo nome repetido no bloco: vale o último
+                rows = {
+                    country_data["name"]: {
+                        "name": country_data["name"],
+                        "flag_url": country_data.get("flag"),
+                        "last_updated": now,
+                    }
+                    for country_data in chunk
+                    if country_data.get("name")
+                }
+                if not rows:
+                    continue
 
+                # Países já gravados só têm a bandeira atualizada
+                stmt = pg_insert(Country).values(list(rows.values()))
+                await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[Country.name],
+                        set_={
+                            "flag_url": stmt.excluded.flag_url,
+                            "last_updated": stmt.excluded.last_updated,
+                        },
+                    )
+                )
                 await session.commit()
+                saved_count += len(rows)
+                # Novos países: o cache nome -> id precisa ser recarregado
+                country_cache.invalidate()
 
         print("Dados dos países processados e salvos no banco de dados com sucesso!")
     except FileNotFoundError:
         print(f"Arquivo não encontrado: {file_path}")
+        raise
+    except UnexpectedPayloadError:
+        print(
+            "Formato JSON inesperado para países: 'response' não encontrado ou não é uma lista."
+        )
+        raise
     except Exception as e:
         print(f"Erro ao processar os dados: {e}")
+        raise
+
+    return saved_count
@@ -0,0 +1,160 @@
+import asyncio
+from datetime import timedelta
+from integrations.rate_limiter import QuotaExhaustedError
+from integrations.standings import FINISHED_STATUSES
+from models.fixture import Fixture
+from models.league import League
+from models.league_team import LeagueTeam
+from sqlalchemy import func
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+
+# Dados por partida (estatísticas, jogadores, escalações) baixados mais de
+# FINAL_AFTER depois do início da partida encerrada não mudam mais e não são
+# baixados de novo
+FINAL_AFTER = timedelta(hours=3)
+
+
+async def pending_fixtures(
+    session, league: int, season: int, model, min_rows: int, force: bool = False
+):
+    """
+    Partidas encerradas da liga-temporada com as equipes (api_id ->
+    league_team_id), sem as que já têm dados finais em `model` (uma tabela
+    com fixture_id e last_updated): ao menos `min_rows` linhas, todas
+    baixadas depois de FINAL_AFTER.
+
+    Returns:
+        tuple: (lista de (fixture_id, {team_api_id: league_team_id}), finais puladas)
+    """
+    home_team = aliased(LeagueTeam)
+    away_team = aliased(LeagueTeam)
+    stored = (
+        select(
+            model.fixture_id,
+            func.count().label("rows"),
+            func.min(model.last_updated).label("fetched_at"),
+        )
+        .group_by(model.fixture_id)
+        .subquery()
+    )
+    result = await session.execute(
+        select(
+            Fixture.api_id,
+            Fixture.date,
+            Fixture.home_team_id,
+            Fixture.away_team_id,
+            home_team.base_team_api_id,
+            away_team.base_team_api_id,
+            stored.c.rows,
+            stored.c.fetched_at,
+        )
+        .join(League, League.id == Fixture.league_id)
+        .join(home_team, home_team.id == Fixture.home_team_id)
+        .join(away_team, away_team.id == Fixture.away_team_id)
+        .outerjoin(stored, stored.c.fixture_id == Fixture.api_id)
+        .where(
+            League.api_id == league,
+            League.season == season,
+            Fixture.status_short.in_(FINISHED_STATUSES),
+        )
+        .order_by(Fixture.date)
+    )
+
+    pending, final = [], 0
+    for (
+        fixture_id,
+        match_date,
+        home_team_id,
+        away_team_id,
+        home_team_api_id,
+        away_team_api_id,
+        rows,
+        fetched_at,
+    ) in result:
+        is_final = (
+            rows is not None
+            and rows >= min_rows
+            and match_date is not None
+            and fetched_at >= match_date + FINAL_AFTER
+        )
+        if is_final and not force:
+            final += 1
+            continue
+        league_teams = {home_team_api_id: home_team_id, away_team_api_id: away_team_id}
+        pending.append((fixture_id, league_teams))
+    return pending, final
+
+
+class BatchWriter:
+    """
+    Acumula linhas vindas de vários downloads simultâneos e as grava em
+    lotes de até `chunk_size` linhas, um lote de cada vez.
+
+    `write(batch)` grava o lote numa sessão própria e devolve quantas linhas
+    foram gravadas, somadas em report["<key>_written"]; as linhas de lotes
+    com erro vão para report["<key>_failed"].
+    """
+
+    def __init__(self, write, chunk_size: int, report, label: str, key: str = "rows"):
+        self.write = write
+        self.chunk_size = chunk_size
+        self.report = report
+        self.label = label
+        self.key = key
+        self._rows = []
+        self._lock = asyncio.Lock()
+
+    async def add(self, rows: list):
+        self._rows.extend(rows)
+        if len(self._rows) >= self.chunk_size:
+            await self.flush()
+
+    async def flush(self):
+        async with self._lock:
+            if not self._rows:
+                return
+            batch = self._rows
+            self._rows = []
+            try:
+                self.report[f"{self.key}_written"] += await self.write(batch)
+            except Exception as e:
+                self.report[f"{self.key}_failed"] += len(batch)
+                print(f"Erro ao gravar {len(batch)} linhas de {self.label}: {e}")
+
+
+async def fan_out(pending: list, fetch, handle, concurrency: int, report, label: str):
+    """
+    Executa `fetch(fixture_id)` para cada partida de `pending`, no máximo
+    `concurrency` de cada vez, e entrega o resultado a
+    `handle(fixture_id, league_teams, data)`.
+
+    Falhas de uma partida são contadas em report["failed"] e não interrompem
+    as demais; ao atingir a reserva da cota diária as partidas restantes não
+    são baixadas (report["not_fetched"]).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    quota_exhausted = asyncio.Event()
+
+    async def run(fixture_id: int, league_teams: dict):
+        async with semaphore:
+            if quota_exhausted.is_set():
+                report["not_fetched"] += 1
+                return
+            try:
+                data = await fetch(fixture_id)
+            except QuotaExhaustedError as e:
+                quota_exhausted.set()
+                report["not_fetched"] += 1
+                print(f"Ingestão de {label} interrompida: {e}")
+                return
+            except Exception as e:
+                report["failed"] += 1
+                print(f"Erro ao baixar {label} da partida {fixture_id}: {e}")
+                return
+        report["fetched"] += 1
+        await handle(fixture_id, league_teams, data)
+
+    await asyncio.gather(
+        *(run(fixture_id, league_teams) for fixture_id, league_teams in pending)
+    )
@@ -0,0 +1,335 @@
+import asyncio
+from collections import Counter
+from config import COPY_CHUNK_SIZE, PLAYERS_CONCURRENCY
+from database.database import async_session_factory
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from integrations.bulk_copy import copy_to_staging, drop_staging
+from integrations.fixture_fan_out import BatchWriter, fan_out, pending_fixtures
+from integrations.fixture_statistics import parse_statistic_value
+from integrations.leaderboards import leaderboard_refresher
+from integrations.rate_limiter import api_scheduler, BACKFILL
+from integrations.season_stats import apply_season_deltas, fixture_totals, season_deltas
+from models.base_coach import Coach
+from models.base_player import BasePlayer
+from models.fixture_lineup import FixtureLineup
+from models.fixture_player_stat import FixturePlayerStat
+from sqlalchemy import Boolean, DECIMAL, SmallInteger
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.future import select
+
+# Caminho no objeto `statistics` de /fixtures/players -> coluna de FixturePlayerStat
+PLAYER_STAT_PATHS = {
+    ("games", "minutes"): "game_minute",
+    ("games", "number"): "game_number",
+    ("games", "position"): "position",
+    ("games", "rating"): "game_position",
+    ("games", "captain"): "game_captain",
+    ("games", "substitute"): "game_substitute",
+    ("offsides",): "offsides",
+    ("shots", "total"): "shots_total",
+    ("shots", "on"): "shots_on",
+    ("goals", "total"): "goals",
+    ("goals", "conceded"): "goals_conceded",
+    ("goals", "assists"): "assists",
+    ("goals", "saves"): "goals_saves",
+    ("passes", "total"): "passes_total",
+    ("passes", "key"): "passes_key",
+    ("passes", "accuracy"): "passes_accuracy",
+    ("tackles", "total"): "tackles_total",
+    ("tackles", "blocks"): "tackles_blocks",
+    ("tackles", "interceptions"): "tackles_interceptions",
+    ("duels", "total"): "duels_total",
+    ("duels", "won"): "duels_won",
+    ("dribbles", "attempts"): "dribbles_attempts",
+    ("dribbles", "success"): "dribbles_success",
+    ("dribbles", "past"): "dribbles_completed",
+    ("fouls", "drawn"): "fouls_drawn",
+    ("fouls", "committed"): "fouls_committed",
+    ("cards", "yellow"): "cards_yellow",
+    ("cards", "red"): "cards_red",
+    ("penalty", "won"): "penalty_won",
+    ("penalty", "commited"): "penalty_commited",
+    ("penalty", "scored"): "penalty_scored",
+    ("penalty", "missed"): "penalty_missed",
+    ("penalty", "saved"): "penalty_saved",
+}
+
+PLAYER_KEY_COLUMNS = ("fixture_id", "league_team_id", "base_player_api_id")
+PLAYER_COLUMNS = (
+    *PLAYER_KEY_COLUMNS,
+    "jersey_number",
+    "formation_grid",
+    "is_starter",
+    *PLAYER_STAT_PATHS.values(),
+    "last_updated",
+)
+
+LINEUP_KEY_COLUMNS = ("fixture_id", "league_team_id")
+LINEUP_COLUMNS = (*LINEUP_KEY_COLUMNS, "coach_api_id", "formation", "last_updated")
+
+# A nota (game_position) é DECIMAL(3, 2): um 10 vira 9.99
+MAX_RATING = Decimal("9.99")
+
+REPORT_KEYS = (
+    "fetched",
+    "failed",
+    "not_fetched",
+    "final_skipped",
+    "player_rows_written",
+    "player_rows_failed",
+    "unknown_players",
+    "lineup_rows_written",
+    "lineup_rows_failed",
+)
+
+
+def _convert(column: str, value):
+    """Converte um valor da API para o tipo da coluna de FixturePlayerStat."""
+    if value is None:
+        return None
+    column_type = FixturePlayerStat.__table__.c[column].type
+    if isinstance(column_type, Boolean):
+        return bool(value)
+    if isinstance(column_type, SmallInteger):
+        return parse_statistic_value(value)
+    if isinstance(column_type, DECIMAL):
+        try:
+            return min(Decimal(str(value)), MAX_RATING).quantize(Decimal("0.01"))
+        except InvalidOperation:
+            return None
+    return str(value)
+
+
+def parse_lineups(fixture_id: int, data: dict, league_teams: dict, now):
+    """
+    Linhas de FixtureLineup de uma resposta de /fixtures/lineups e os dados
+    de escalação de cada jogador.
+
+    Returns:
+        tuple: (linhas, {(league_team_id, player_api_id): dados da escalação})
+    """
+    rows, players = [], {}
+    for item in data.get("response") or []:
+        league_team_id = league_teams.get((item.get("team") or {}).get("id"))
+        if league_team_id is None:
+            continue
+        rows.append(
+            {
+                "fixture_id": fixture_id,
+                "league_team_id": league_team_id,
+                "coach_api_id": (item.get("coach") or {}).get("id"),
+                "formation": item.get("formation"),
+                "last_updated": now,
+            }
+        )
+        for group, is_starter in (("startXI", True), ("substitutes", False)):
+            for entry in item.get(group) or []:
+                player = entry.get("player") or {}
+                if player.get("id") is None:
+                    continue
+                players[(league_team_id, player["id"])] = {
+                    "jersey_number": _convert("jersey_number", player.get("number")),
+                    "formation_grid": player.get("grid"),
+                    "is_starter": is_starter,
+                }
+    return rows, players
+
+
+def parse_player_stats(
+    fixture_id: int, data: dict, league_teams: dict, lineup_players: dict, now
+):
+    """
+    Linhas de FixturePlayerStat de uma resposta de /fixtures/players,
+    completadas com a camisa, a posição no campo e a titularidade da
+    escalação.
+    """
+    rows = []
+    for item in data.get("response") or []:
+        league_team_id = league_teams.get((item.get("team") or {}).get("id"))
+        if league_team_id is None:
+            continue
+        for entry in item.get("players") or []:
+            player_api_id = (entry.get("player") or {}).get("id")
+            if player_api_id is None:
+                continue
+            statistics = (entry.get("statistics") or [{}])[0] or {}
+            row = {
+                "fixture_id": fixture_id,
+                "league_team_id": league_team_id,
+                "base_player_api_id": player_api_id,
+            }
+            for path, column in PLAYER_STAT_PATHS.items():
+                value = statistics
+                for key in path:
+                    value = value.get(key) if isinstance(value, dict) else None
+                row[column] = _convert(column, value)
+
+            lineup = lineup_players.get((league_team_id, player_api_id), {})
+            row["jersey_number"] = lineup.get("jersey_number", row["game_number"])
+            row["formation_grid"] = lineup.get("formation_grid")
+            row["is_starter"] = lineup.get("is_starter")
+            row["last_updated"] = now
+            rows.append(row)
+    return rows
+
+
+def _unique(rows: list, key_columns: tuple) -> list:
+    # O merge não pode atualizar a mesma linha duas vezes num comando
+    return list({tuple(row[c] for c in key_columns): row for row in rows}.values())
+
+
+async def save_player_stats(session, rows: list) -> int:
+    """
+    Carrega as linhas por COPY numa tabela temporária e faz o merge em
+    fixture_player_stats num único INSERT ... SELECT ... ON CONFLICT.
+    Jogadores ainda não cadastrados em base_players ficam de fora.
+
+    Na mesma transação, a diferença entre os agregados das partidas do lote
+    antes e depois do merge é somada em players_season_stats: regravar as
+    mesmas estatísticas não muda os totais da temporada.
+
+    Returns:
+        int: Linhas inseridas ou atualizadas.
+    """
+    rows = _unique(rows, PLAYER_KEY_COLUMNS)
+    fixture_ids = {row["fixture_id"] for row in rows}
+    before = await fixture_totals(session, fixture_ids, lock=True)
+    staging = await copy_to_staging(session, FixturePlayerStat, PLAYER_COLUMNS, rows)
+    stmt = pg_insert(FixturePlayerStat).from_select(
+        PLAYER_COLUMNS,
+        select(*(staging.c[column] for column in PLAYER_COLUMNS)).join(
+            BasePlayer, BasePlayer.api_id == staging.c.base_player_api_id
+        ),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(PLAYER_KEY_COLUMNS),
+        set_={
+            column: stmt.excluded[column]
+            for column in PLAYER_COLUMNS
+            if column not in PLAYER_KEY_COLUMNS
+        },
+    )
+    result = await session.execute(stmt)
+    await drop_staging(session, staging)
+
+    after = await fixture_totals(session, fixture_ids)
+    changed_teams = await apply_season_deltas(session, season_deltas(before, after))
+    leaderboard_refresher.mark_league_teams(changed_teams)
+    return result.rowcount
+
+
+async def save_lineups(session, rows: list) -> int:
+    """
+    COPY + merge das escalações em fixture_lineups. Técnicos ainda não
+    cadastrados em base_coaches ficam com coach_api_id nulo.
+    """
+    rows = _unique(rows, LINEUP_KEY_COLUMNS)
+    staging = await copy_to_staging(session, FixtureLineup, LINEUP_COLUMNS, rows)
+    stmt = pg_insert(FixtureLineup).from_select(
+        LINEUP_COLUMNS,
+        select(
+            staging.c.fixture_id,
+            staging.c.league_team_id,
+            Coach.api_id,
+            staging.c.formation,
+            staging.c.last_updated,
+        )
+        .select_from(staging)
+        .outerjoin(Coach, Coach.api_id == staging.c.coach_api_id),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(LINEUP_KEY_COLUMNS),
+        set_={
+            column: stmt.excluded[column]
+            for column in LINEUP_COLUMNS
+            if column not in LINEUP_KEY_COLUMNS
+        },
+    )
+    result = await session.execute(stmt)
+    await drop_staging(session, staging)
+    return result.rowcount
+
+
+async def ingest_fixture_players(
+    league: int,
+    season: int,
+    force: bool = False,
+    concurrency: int = PLAYERS_CONCURRENCY,
+    chunk_size: int = COPY_CHUNK_SIZE,
+):
+    """
+    Baixa /fixtures/players e /fixtures/lineups de todas as partidas
+    encerradas de uma liga-temporada e grava em fixture_player_stats e
+    fixture_lineups.
+
+    Os downloads são feitos em paralelo (no máximo `concurrency` partidas
+    de cada vez, na faixa BACKFILL do agendador) e as linhas são acumuladas
+    e gravadas em lotes de até `chunk_size` por COPY numa tabela temporária
+    seguido de um merge, em vez de um INSERT por linha. Partidas com dados
+    já finais são puladas, a não ser com `force`.
+
+    Args:
+        league (int): O id da liga segundo a API.
+        season (int): A temporada (ex: 2023).
+
+    Returns:
+        dict: Relatório com partidas baixadas, puladas, com falha e linhas gravadas.
+    """
+    report = Counter(dict.fromkeys(REPORT_KEYS, 0))
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    async with async_session_factory() as session:
+        pending, report["final_skipped"] = await pending_fixtures(
+            session, league, season, FixturePlayerStat, min_rows=1, force=force
+        )
+
+    async def write_players(batch: list) -> int:
+        async with async_session_factory() as session:
+            written = await save_player_stats(session, batch)
+            await session.commit()
+        report["unknown_players"] += len(_unique(batch, PLAYER_KEY_COLUMNS)) - written
+        return written
+
+    async def write_lineups(batch: list) -> int:
+        async with async_session_factory() as session:
+            written = await save_lineups(session, batch)
+            await session.commit()
+        return written
+
+    player_writer = BatchWriter(
+        write_players, chunk_size, report, "jogadores de partidas", "player_rows"
+    )
+    lineup_writer = BatchWriter(
+        write_lineups, chunk_size, report, "escalações", "lineup_rows"
+    )
+
+    async def fetch(fixture_id: int) -> tuple:
+        params = {"fixture": fixture_id}
+        return await asyncio.gather(
+            api_scheduler.get_json("/fixtures/players", params=params, priority=BACKFILL),
+            api_scheduler.get_json("/fixtures/lineups", params=params, priority=BACKFILL),
+        )
+
+    async def handle(fixture_id: int, league_teams: dict, data: tuple):
+        players_data, lineups_data = data
+        lineup_rows, lineup_players = parse_lineups(
+            fixture_id, lineups_data, league_teams, now
+        )
+        await lineup_writer.add(lineup_rows)
+        await player_writer.add(
+            parse_player_stats(
+                fixture_id, players_data, league_teams, lineup_players, now
+            )
+        )
+
+    await fan_out(pending, fetch, handle, concurrency, report, "jogadores")
+    await lineup_writer.flush()
+    await player_writer.flush()
+
+    print(
+        f"Jogadores da liga {league}/{season}: {report['fetched']} partidas baixadas, "
+        f"{report['player_rows_written']} estatísticas e "
+        f"{report['lineup_rows_written']} escalações gravadas."
+    )
+    return {"league": league, "season": season, "fixtures": len(pending), **report}
@@ -0,0 +1,153 @@
+from collections import Counter
+from config import INGEST_CHUNK_SIZE, STATISTICS_CONCURRENCY
+from database.database import async_session_factory
+from datetime import datetime, timezone
+from integrations.fixture_fan_out import BatchWriter, fan_out, pending_fixtures
+from integrations.rate_limiter import api_scheduler, BACKFILL
+from models.fixture_statistic import FixtureStatistic
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+# Tipo da estatística na API -> coluna de FixtureStatistic
+STATISTIC_COLUMNS = {
+    "Shots on Goal": "shots_on_goal",
+    "Shots off Goal": "shots_off_goal",
+    "Total Shots": "total_shots",
+    "Blocked Shots": "blocked_shots",
+    "Shots insidebox": "shots_insidebox",
+    "Shots outsidebox": "shots_outsidebox",
+    "Fouls": "fouls",
+    "Corner Kicks": "corner_kicks",
+    "Offsides": "offsides",
+    "Ball Possession": "ball_possession",
+    "Yellow Cards": "yellow_cards",
+    "Red Cards": "red_cards",
+    "Goalkeeper Saves": "goalkeeper_saves",
+    "Total passes": "total_passes",
+    "Passes accurate": "passes_accurate",
+    "Passes %": "passes_percentage",
+}
+
+REPORT_KEYS = (
+    "fetched",
+    "empty",
+    "failed",
+    "not_fetched",
+    "final_skipped",
+    "rows_written",
+    "rows_failed",
+)
+
+
+def parse_statistic_value(value):
+    """Converte o valor da API em número: 7 -> 7, "55%" -> 55, None/"" -> None."""
+    if value is None or isinstance(value, int):
+        return value
+    try:
+        return int(round(float(str(value).strip().rstrip("%"))))
+    except ValueError:
+        return None
+
+
+def parse_fixture_statistics(fixture_id: int, data: dict, league_teams: dict, now):
+    """
+    Linhas de FixtureStatistic de uma resposta de /fixtures/statistics.
+
+    Args:
+        league_teams (dict): api_id da equipe -> league_team_id da partida.
+    """
+    rows = []
+    for item in data.get("response") or []:
+        league_team_id = league_teams.get((item.get("team") or {}).get("id"))
+        if league_team_id is None:
+            continue
+        row = {column: None for column in STATISTIC_COLUMNS.values()}
+        for statistic in item.get("statistics") or []:
+            column = STATISTIC_COLUMNS.get(statistic.get("type"))
+            if column is not None:
+                row[column] = parse_statistic_value(statistic.get("value"))
+        row.update(
+            {
+                "fixture_id": fixture_id,
+                "league_team_id": league_team_id,
+                "last_updated": now,
+            }
+        )
+        rows.append(row)
+    return rows
+
+
+def _statistics_upsert_statement():
+    """
+    Upsert na unique_fixture_team (fixture_id, league_team_id). O last_updated é sempre renovado: é ele
+    que marca as estatísticas como finais, e partidas finais não voltam a
+    ser baixadas.
+    """
+    stmt = pg_insert(FixtureStatistic)
+    return stmt.on_conflict_do_update(
+        index_elements=[FixtureStatistic.fixture_id, FixtureStatistic.league_team_id],
+        set_={
+            **{column: stmt.excluded[column] for column in STATISTIC_COLUMNS.values()},
+            "last_updated": stmt.excluded.last_updated,
+        },
+    )
+
+
+async def ingest_fixture_statistics(
+    league: int,
+    season: int,
+    force: bool = False,
+    concurrency: int = STATISTICS_CONCURRENCY,
+    chunk_size: int = INGEST_CHUNK_SIZE,
+):
+    """
+    Baixa /fixtures/statistics de todas as partidas encerradas de uma
+    liga-temporada e grava em fixture_statistics.
+
+    A API só serve uma partida por chamada, então os downloads são feitos em
+    paralelo, no máximo `concurrency` de cada vez, na faixa BACKFILL do
+    agendador (que aplica o limite de requisições e a cota). As linhas são
+    acumuladas e gravadas em upserts de até `chunk_size` linhas. Partidas
+    com estatísticas já finais são puladas, a não ser com `force`.
+
+    Args:
+        league (int): O id da liga segundo a API.
+        season (int): A temporada (ex: 2023).
+
+    Returns:
+        dict: Relatório com partidas baixadas, puladas, com falha e linhas gravadas.
+    """
+    report = Counter(dict.fromkeys(REPORT_KEYS, 0))
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    async with async_session_factory() as session:
+        pending, report["final_skipped"] = await pending_fixtures(
+            session, league, season, FixtureStatistic, min_rows=2, force=force
+        )
+
+    async def write(batch: list) -> int:
+        async with async_session_factory() as session:
+            await session.execute(_statistics_upsert_statement(), batch)
+            await session.commit()
+        return len(batch)
+
+    writer = BatchWriter(write, chunk_size, report, "estatísticas de partidas")
+
+    async def fetch(fixture_id: int) -> dict:
+        return await api_scheduler.get_json(
+            "/fixtures/statistics", params={"fixture": fixture_id}, priority=BACKFILL
+        )
+
+    async def handle(fixture_id: int, league_teams: dict, data: dict):
+        rows = parse_fixture_statistics(fixture_id, data, league_teams, now)
+        if not rows:
+            report["empty"] += 1
+        await writer.add(rows)
+
+    await fan_out(pending, fetch, handle, concurrency, report, "estatísticas")
+    await writer.flush()
+
+    print(
+        f"Estatísticas da liga {league}/{season}: {report['fetched']} partidas baixadas, "
+        f"{report['final_skipped']} já finais, {report['rows_written']} linhas gravadas."
+    )
+    return {"league": league, "season": season, "fixtures": len(pending), **report}
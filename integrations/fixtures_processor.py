@@ -1,291 +1,396 @@
 import json
 import os
+from collections import Counter
+from config import INGEST_CHUNK_SIZE
 from database.database import async_session_factory
 from datetime import datetime, timezone
+from integrations.json_stream import (
+    iter_response_chunks,
+    UnexpectedPayloadError,
+)
+from integrations.broker import broker, fixture_event
+from integrations.standings import affected_teams, refresh_standings
 from models.fixture import Fixture
 from models.league import League
 from models.venue import Venue
 from models.league_team import LeagueTeam
 from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import and_
+from sqlalchemy import insert, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from utils.feed_cache import feed_cache
+
+# Colunas que mudam durante e depois de uma partida e que o modo upsert atualiza
+FIXTURE_REFRESH_COLUMNS = (
+    "home_team_score_goals",
+    "away_team_score_goals",
+    "status",
+    "status_short",
+    "elapsed",
+    "referee",
+)
+
+
+def _parse_fixture(fixture_data_wrapper: dict):
+    """
+    Extrai de um item de `response` os campos usados pelo modelo Fixture.
 
+    Returns:
+        tuple: (dados, None) quando a partida é válida, ou (None, motivo)
+        quando ela deve ser pulada.
+    """
+    fixture_info = fixture_data_wrapper.get("fixture")
+    league_info = fixture_data_wrapper.get("league")
+    teams_info = fixture_data_wrapper.get("teams")
+    score_info = fixture_data_wrapper.get("score")
+
+    if not fixture_info or not league_info or not teams_info:
+        return None, "dados_incompletos"
+
+    venue_info = fixture_info.get("venue")  # Informação do estádio dentro de fixture
+    status_info = fixture_info.get("status")  # Informação do status da partida
+    home_team_info = teams_info.get("home")
+    away_team_info = teams_info.get("away")
+
+    fixture_id_from_api = fixture_info.get("id")
+    league_round = league_info.get("round")  # 'round' é NOT NULL no modelo
+    fixture_status_short = status_info.get("short") if status_info else None
+
+    if (
+        fixture_id_from_api is None
+        or league_info.get("id") is None
+        or league_info.get("season") is None
+        or league_round is None
+        or fixture_status_short is None
+        or not home_team_info
+        or not away_team_info
+    ):
+        return None, "dados_essenciais_faltando"
+
+    if home_team_info.get("id") is None or away_team_info.get("id") is None:
+        return None, "id_equipe_faltando"
+
+    # Converter a data para datetime sem fuso horário (TIMESTAMP WITHOUT TIME ZONE)
+    fixture_date = None
+    fixture_date_str = fixture_info.get("date")
+    if fixture_date_str:
+        try:
+            fixture_date = datetime.fromisoformat(
+                fixture_date_str.replace("Z", "+00:00")
+            ).replace(tzinfo=None)
+        except ValueError:
+            return None, "data_invalida"
+
+    # Durante a partida score.fulltime é null; `goals` traz o placar atual
+    goals_info = fixture_data_wrapper.get("goals") or {}
+    fulltime = (score_info or {}).get("fulltime") or {}
+
+    return {
+        "api_id": fixture_id_from_api,
+        "league_api_id": league_info.get("id"),
+        "season": league_info.get("season"),
+        "round": league_round,
+        "date": fixture_date,
+        "status": status_info.get("long"),
+        "status_short": fixture_status_short,
+        "elapsed": status_info.get("elapsed"),
+        "referee": fixture_info.get("referee"),
+        "timezone": fixture_info.get("timezone"),
+        "venue_api_id": venue_info.get("id") if venue_info else None,
+        "home_team_api_id": home_team_info.get("id"),
+        "away_team_api_id": away_team_info.get("id"),
+        "home_team_score_goals": (
+            goals_info.get("home")
+            if goals_info.get("home") is not None
+            else fulltime.get("home")
+        ),
+        "away_team_score_goals": (
+            goals_info.get("away")
+            if goals_info.get("away") is not None
+            else fulltime.get("away")
+        ),
+    }, None
+
+
+async def _load_lookups(session, parsed_fixtures: list):
+    """
+    Carrega em poucas consultas `IN (...)` as chaves de League, LeagueTeam,
+    Venue e as partidas já existentes necessárias para o lote.
+    """
+    league_api_ids = {f["league_api_id"] for f in parsed_fixtures}
+    seasons = {f["season"] for f in parsed_fixtures}
+
+    result_leagues = await session.execute(
+        select(League.id, League.api_id, League.season).where(
+            League.api_id.in_(league_api_ids), League.season.in_(seasons)
+        )
+    )
+    leagues = {
+        (api_id, season): league_id for league_id, api_id, season in result_leagues
+    }
+
+    team_api_ids = {f["home_team_api_id"] for f in parsed_fixtures} | {
+        f["away_team_api_id"] for f in parsed_fixtures
+    }
+    league_teams = {}
+    if leagues:
+        result_league_teams = await session.execute(
+            select(
+                LeagueTeam.id, LeagueTeam.league_id, LeagueTeam.base_team_api_id
+            ).where(
+                LeagueTeam.league_id.in_(set(leagues.values())),
+                LeagueTeam.base_team_api_id.in_(team_api_ids),
+            )
+        )
+        league_teams = {
+            (league_id, team_api_id): league_team_id
+            for league_team_id, league_id, team_api_id in result_league_teams
+        }
+
+    venue_api_ids = {
+        f["venue_api_id"] for f in parsed_fixtures if f["venue_api_id"] is not None
+    }
+    venues = set()
+    if venue_api_ids:
+        result_venues = await session.execute(
+            select(Venue.api_id).where(Venue.api_id.in_(venue_api_ids))
+        )
+        venues = set(result_venues.scalars())
+
+    result_existing = await session.execute(
+        select(Fixture.api_id).where(
+            Fixture.api_id.in_({f["api_id"] for f in parsed_fixtures})
+        )
+    )
+    existing_fixtures = set(result_existing.scalars())
+
+    return leagues, league_teams, venues, existing_fixtures
+
+
+def _fixtures_upsert_statement():
+    """
+    INSERT ... ON CONFLICT (api_id) DO UPDATE que só reescreve placar, status,
+    tempo decorrido e árbitro, e apenas quando algum deles mudou.
+    """
+    stmt = pg_insert(Fixture)
+    changed = or_(
+        *(
+            getattr(Fixture, column).is_distinct_from(stmt.excluded[column])
+            for column in FIXTURE_REFRESH_COLUMNS
+        )
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[Fixture.api_id],
+        set_={
+            **{column: stmt.excluded[column] for column in FIXTURE_REFRESH_COLUMNS},
+            "last_updated": stmt.excluded.last_updated,
+        },
+        where=changed,
+    ).returning(Fixture.api_id)
+
+
+async def _save_fixtures_chunk(
+    session, parsed_fixtures: list, upsert: bool, seen_ids: set, report, skip_reasons
+):
+    """
+    Resolve as chaves de um bloco de partidas já parseadas, grava o bloco
+    num único INSERT (ou upsert) e faz o commit, acumulando o relatório.
+    """
+    leagues, league_teams, venues, existing_fixtures = await _load_lookups(
+        session, parsed_fixtures
+    )
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    rows = []
+    team_api_ids = {}
+
+    for parsed in parsed_fixtures:
+        fixture_id_from_api = parsed["api_id"]
+        if fixture_id_from_api in seen_ids or (
+            fixture_id_from_api in existing_fixtures and not upsert
+        ):
+            skip_reasons["partida_duplicada"] += 1
+            continue
+
+        league_id = leagues.get((parsed["league_api_id"], parsed["season"]))
+        if league_id is None:
+            skip_reasons["liga_nao_encontrada"] += 1
+            continue
+
+        home_team_id = league_teams.get((league_id, parsed["home_team_api_id"]))
+        if home_team_id is None:
+            skip_reasons["equipe_local_nao_encontrada"] += 1
+            continue
+
+        away_team_id = league_teams.get((league_id, parsed["away_team_api_id"]))
+        if away_team_id is None:
+            skip_reasons["equipe_visitante_nao_encontrada"] += 1
+            continue
+
+        # O estádio é opcional: sem cadastro, venue_id fica NULL
+        venue_id = parsed["venue_api_id"]
+        if venue_id not in venues:
+            venue_id = None
+
+        seen_ids.add(fixture_id_from_api)
+        team_api_ids[fixture_id_from_api] = (
+            parsed["home_team_api_id"],
+            parsed["away_team_api_id"],
+        )
+        rows.append(
+            {
+                "api_id": fixture_id_from_api,
+                "league_id": league_id,
+                "season": parsed["season"],
+                "date": parsed["date"],
+                "status": parsed["status"],
+                "status_short": parsed["status_short"],
+                "venue_id": venue_id,
+                "referee": parsed["referee"],
+                "home_team_id": home_team_id,
+                "away_team_id": away_team_id,
+                "home_team_score_goals": parsed["home_team_score_goals"],
+                "away_team_score_goals": parsed["away_team_score_goals"],
+                "elapsed": parsed["elapsed"],
+                "timezone": parsed["timezone"],
+                "round": parsed["round"],
+                "last_updated": now,
+            }
+        )
+
+    if not rows:
+        return
 
-async def process_fixtures_json_and_save_to_db(file_name: str):
+    try:
+        if upsert:
+            result = await session.scalars(_fixtures_upsert_statement(), rows)
+            written = set(result.all())
+            inserted = len(written - existing_fixtures)
+            updated = len(written & existing_fixtures)
+            written_rows = [row for row in rows if row["api_id"] in written]
+        else:
+            await session.execute(insert(Fixture), rows)
+            written = set()
+            inserted, updated = len(rows), 0
+            written_rows = rows
+
+        # A classificação é atualizada na mesma transação das partidas
+        for league_id, league_team_ids in affected_teams(
+            written_rows, written & existing_fixtures
+        ).items():
+            await refresh_standings(session, league_id, league_team_ids)
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        skip_reasons["erro_de_integridade"] += len(rows)
+        print(
+            f"Erro de integridade ao salvar partidas: tentando salvar uma partida (api_id) duplicada."
+        )
+        return
+    except Exception as e:
+        await session.rollback()
+        skip_reasons["erro_no_commit"] += len(rows)
+        print(f"Erro durante o commit de Fixtures: {e}")
+        return
+
+    report["inserted"] += inserted
+    report["updated"] += updated
+    report["unchanged"] += len(rows) - inserted - updated
+
+    # Partidas novas não passam pelo broker; os feeds das ligas são descartados aqui
+    if inserted:
+        feed_cache.invalidate_leagues(
+            row["league_id"]
+            for row in written_rows
+            if row["api_id"] not in existing_fixtures
+        )
+
+    # Partidas já existentes que mudaram são enviadas aos clientes inscritos
+    await broker.publish(
+        [
+            fixture_event(row, *team_api_ids[row["api_id"]])
+            for row in written_rows
+            if row["api_id"] in existing_fixtures
+        ]
+    )
+
+
+async def process_fixtures_json_and_save_to_db(
+    file_name: str, upsert: bool = False, chunk_size: int = INGEST_CHUNK_SIZE
+):
     """
     Lê um arquivo JSON de partidas e salva os dados na tabela fixtures.
-    Busca os IDs de liga, equipes e estádios nas tabelas correspondentes
-    (incluindo league_teams para as equipes no contexto da liga),
-    baseando-se no modelo Fixture fornecido.
+
+    O arquivo é lido em streaming e gravado em blocos de `chunk_size`
+    partidas: para cada bloco as chaves de liga, equipes (league_teams) e
+    estádios são resolvidas em consultas em lote e as partidas são gravadas
+    num único INSERT de várias linhas, com commit por bloco. A classificação
+    das equipes de partidas encerradas ou alteradas é recalculada no mesmo
+    commit.
 
     Args:
         file_name (str): O nome do arquivo JSON de partidas (dentro da pasta json/).
+        upsert (bool): Se True, partidas já existentes têm placar, status,
+            tempo decorrido e árbitro atualizados em vez de serem puladas.
+        chunk_size (int): Quantidade de partidas por bloco/commit.
+
+    Returns:
+        dict: Relatório com as partidas inseridas, atualizadas, puladas (e os
+            motivos) e as que não foram gravadas por erro no commit.
     """
     json_dir = "json"
     file_path = os.path.join(json_dir, file_name)
+    report = {
+        "file": file_name,
+        "inserted": 0,
+        "updated": 0,
+        "unchanged": 0,
+        "skipped": 0,
+        "failed": 0,
+        "skip_reasons": {},
+    }
+    skip_reasons = Counter()
 
     try:
-        with open(file_path, "r") as json_file:
-            data = json.load(json_file)
-
-        if "response" in data and isinstance(data["response"], list):
-            async with async_session_factory() as session:
-                fixtures_to_add = []
-
-                for fixture_data_wrapper in data["response"]:
-                    fixture_info = fixture_data_wrapper.get("fixture")
-                    league_info = fixture_data_wrapper.get("league")
-                    teams_info = fixture_data_wrapper.get("teams")
-                    score_info = fixture_data_wrapper.get("score")
-
-                    if not fixture_info or not league_info or not teams_info:
-                        print(
-                            f"Dados incompletos para uma partida no wrapper: {fixture_data_wrapper.get('fixture', {}).get('id', 'N/A')}. Pulando."
-                        )
-                        continue
-
-                    # Extrair dados do JSON
-                    fixture_id_from_api = fixture_info.get("id")
-                    fixture_referee = fixture_info.get("referee")
-                    fixture_timezone = fixture_info.get("timezone")
-                    fixture_date_str = fixture_info.get("date")
-                    venue_info = fixture_info.get(
-                        "venue"
-                    )  # Informação do estádio dentro de fixture
-                    status_info = fixture_info.get(
-                        "status"
-                    )  # Informação do status da partida
-
-                    league_id_from_api = league_info.get("id")
-                    league_season = league_info.get(
-                        "season"
-                    )  # Campo 'season' do modelo Fixture
-                    league_round = league_info.get("round")
-
-                    home_team_info = teams_info.get("home")
-                    away_team_info = teams_info.get("away")
-
-                    # Extrair scores de tempo integral
-                    home_score_fulltime = (
-                        score_info.get("fulltime", {}).get("home")
-                        if score_info
-                        else None
-                    )
-                    away_score_fulltime = (
-                        score_info.get("fulltime", {}).get("away")
-                        if score_info
-                        else None
-                    )
-
-                    # Extrair informações de status
-                    fixture_status_long = (
-                        status_info.get("long") if status_info else None
-                    )  # Campo 'status' do modelo
-                    fixture_status_short = (
-                        status_info.get("short") if status_info else None
-                    )  # Campo 'status_short' do modelo
-                    fixture_elapsed = (
-                        status_info.get("elapsed") if status_info else None
-                    )  # Campo 'elapsed' do modelo
-
-                    venue_id_from_api = (
-                        venue_info.get("id") if venue_info else None
-                    )  # Pode ser None se não houver info de estádio
-
-                    # --- Validar dados essenciais antes de buscar no DB ---
-                    if (
-                        fixture_id_from_api is None
-                        or league_id_from_api is None
-                        or league_season is None
-                        or league_round is None  # 'round' é NOT NULL no modelo
-                        or fixture_status_short is None
-                        or not home_team_info
-                        or not away_team_info
-                    ):
-                        print(
-                            f"Dados essenciais faltando para a partida com ID API {fixture_id_from_api}. Pulando."
-                        )
+        async with async_session_factory() as session:
+            seen_ids = set()
+            # As partidas são decodificadas e extraídas fora do event loop
+            async for chunk in iter_response_chunks(
+                file_path, chunk_size, parse=_parse_fixture
+            ):
+                parsed_fixtures = []
+                for parsed, reason in chunk:
+                    if parsed is None:
+                        skip_reasons[reason] += 1
                         continue
+                    parsed_fixtures.append(parsed)
 
-                    home_team_id_from_api = home_team_info.get("id")
-                    away_team_id_from_api = away_team_info.get("id")
-
-                    if home_team_id_from_api is None or away_team_id_from_api is None:
-                        print(
-                            f"ID de equipe local ou visitante faltando no JSON para a partida ID API {fixture_id_from_api}. Pulando."
-                        )
-                        continue
-
-                    # Converter a data de string para datetime e remover zona horária para TIMESTAMP WITHOUT TIME ZONE
-                    fixture_date = None
-                    if fixture_date_str:
-                        try:
-                            # Tentar parsear com e sem fuso horário 'Z'
-                            dt_object = datetime.fromisoformat(
-                                fixture_date_str.replace("Z", "+00:00")
-                            )
-                            # Remover informação de fuso horário para a coluna TIMESTAMP WITHOUT TIME ZONE
-                            fixture_date = dt_object.replace(tzinfo=None)
-
-                        except ValueError:
-                            print(
-                                f"  Não foi possível parsear a data '{fixture_date_str}' para a partida ID API {fixture_id_from_api}. Pulando."
-                            )
-                            continue
-                    # Verificar se a data foi parseada com sucesso (se fixture_date_str não era None)
-                    elif (
-                        fixture_date_str is not None
-                    ):  # A API pode enviar null, mas se enviou string que não parseou
-                        print(
-                            f"  Data da partida não fornecida no JSON para a partida ID API {fixture_id_from_api}. Pulando."
-                        )
-                        continue
-
-                    print(
-                        f"Processando partida ID API: {fixture_id_from_api}, Liga ID API: {league_id_from_api}, Temporada: {league_season}, Rodada: {league_round}"
-                    )
-
-                    # --- Buscar os IDs correspondentes no banco de dados ---
-
-                    # 1. Buscar a Liga no banco de dados para obter seu ID do DB
-                    # Usamos api_id e season para encontrar a entrada correta da Liga no DB
-                    query_league = select(League).where(
-                        and_(
-                            League.api_id == league_id_from_api,
-                            League.season == league_season,
-                        )
+                if parsed_fixtures:
+                    await _save_fixtures_chunk(
+                        session, parsed_fixtures, upsert, seen_ids, report, skip_reasons
                     )
-                    result_league = await session.execute(query_league)
-                    db_league = result_league.scalar_one_or_none()
-
-                    if not db_league:
-                        print(
-                            f"  Liga (ID API: {league_id_from_api}, Temporada: {league_season}) não encontrada no banco de dados para a partida ID API {fixture_id_from_api}. Pulando."
-                        )
-                        continue  # Não podemos salvar a partida sem a liga
-
-                    # 2. Buscar o ID de LeagueTeam para a equipe Local
-                    # Precisamos do ID do LeagueTeam que vincula a liga e o time local (usando api_id do time)
-                    db_home_league_team_id = None
-                    if home_team_id_from_api is not None:
-                        query_home_league_team = select(LeagueTeam.id).where(
-                            and_(
-                                LeagueTeam.league_id
-                                == db_league.id,  # Usamos o ID da liga do DB
-                                LeagueTeam.base_team_api_id
-                                == home_team_id_from_api,  # Usamos o api_id da equipe
-                            )
-                        )
-                        result_home_league_team = await session.execute(
-                            query_home_league_team
-                        )
-                        db_home_league_team_id = (
-                            result_home_league_team.scalar_one_or_none()
-                        )
-
-                    if not db_home_league_team_id:
-                        print(
-                            f"  Entrada em LeagueTeam para Equipe Local (ID API: {home_team_id_from_api}) na Liga (ID DB: {db_league.id}) não encontrada. Pulando partida ID API {fixture_id_from_api}."
-                        )
-                        continue  # Não podemos salvar a partida sem o vínculo LeagueTeam para a equipe local
-
-                    # 3. Buscar o ID de LeagueTeam para a equipe Visitante
-                    # Precisamos do ID do LeagueTeam que vincula a liga e o time visitante (usando api_id do time)
-                    db_away_league_team_id = None
-                    if away_team_id_from_api is not None:
-                        query_away_league_team = select(LeagueTeam.id).where(
-                            and_(
-                                LeagueTeam.league_id
-                                == db_league.id,  # Usamos o ID da liga do DB
-                                LeagueTeam.base_team_api_id
-                                == away_team_id_from_api,  # Usamos o api_id da equipe
-                            )
-                        )
-                        result_away_league_team = await session.execute(
-                            query_away_league_team
-                        )
-                        db_away_league_team_id = (
-                            result_away_league_team.scalar_one_or_none()
-                        )
-
-                    if not db_away_league_team_id:
-                        print(
-                            f"  Entrada em LeagueTeam para Equipe Visitante (ID API: {away_team_id_from_api}) na Liga (ID DB: {db_league.id}) não encontrada. Pulando partida ID API {fixture_id_from_api}."
-                        )
-                        continue  # Não podemos salvar a partida sem o vínculo LeagueTeam para a equipe visitante
-
-                    # 4. Buscar o Estádio no banco de dados (pode ser None)
-                    db_venue = None
-                    db_venue_api_id = (
-                        None  # Usaremos o api_id do estádio do DB para o campo venue_id
-                    )
-                    if venue_id_from_api is not None:
-                        # Assumindo que Venue.api_id é o ID da API do estádio
-                        query_venue = select(Venue).where(
-                            Venue.api_id == venue_id_from_api
-                        )  # Busca por Venue.api_id
-                        result_venue = await session.execute(query_venue)
-                        db_venue = result_venue.scalar_one_or_none()
-
-                        if db_venue:
-                            db_venue_api_id = (
-                                db_venue.api_id
-                            )  # Usamos db_venue.api_id para o FK em Fixture
-                        else:
-                            print(
-                                f"  Estádio (ID API: {venue_id_from_api}) não encontrado no banco de dados Venue (buscando por api_id) para a partida ID API {fixture_id_from_api}. O campo venue_id será NULL."
-                            )
-
-                    # --- Criar o objeto Fixture se todos os IDs necessários foram encontrados ---
-                    # Se chegarmos aqui, db_league, db_home_league_team_id e db_away_league_team_id estão garantidos
-                    db_fixture = Fixture(
-                        api_id=fixture_id_from_api,
-                        league_id=db_league.id,  # ID da liga do DB
-                        season=league_season,  # Campo 'season'
-                        date=fixture_date,  # Objeto datetime sem fuso horário (match_DATE)
-                        status=fixture_status_long,  # Campo 'status' (status longo)
-                        status_short=fixture_status_short,  # Campo 'status_short' (status curto)
-                        venue_id=db_venue_api_id,  # ID do estádio do DB (api_id) (ou None)
-                        referee=fixture_referee,
-                        home_team_id=db_home_league_team_id,  # ID de LeagueTeam para a equipe local
-                        away_team_id=db_away_league_team_id,  # ID de LeagueTeam para a equipe visitante
-                        home_team_score_goals=home_score_fulltime,  # Placar local tempo integral
-                        away_team_score_goals=away_score_fulltime,  # Placar visitante tempo integral
-                        elapsed=fixture_elapsed,  # Tempo decorrido
-                        timezone=fixture_timezone,  # Fuso horário
-                        round=league_round,  # Rodada da liga
-                        last_updated=datetime.now(timezone.utc).replace(
-                            tzinfo=None
-                        ),  # Sem fuso horário
-                    )
-                    fixtures_to_add.append(db_fixture)
-                    # print(f"  Partida ID API {fixture_id_from_api} adicionada à sessão.")
-
-                # Adicionar todos os objetos Fixture à sessão de uma vez
-                session.add_all(fixtures_to_add)
-
-                try:
-                    await session.commit()
-                    print(
-                        f"Foram salvas {len(fixtures_to_add)} partidas no banco de dados."
-                    )
-                except IntegrityError:
-                    await session.rollback()
-                    print(
-                        f"Erro de integridade ao salvar partidas: tentando salvar uma partida (api_id) duplicada."
-                    )
-                except Exception as e:
-                    await session.rollback()
-                    print(f"Erro durante o commit de Fixtures: {e}")
-
-        else:
-            print(
-                "Formato JSON inesperado para partidas: 'response' não encontrado ou não é uma lista."
-            )
 
     except FileNotFoundError:
         print(f"Arquivo não encontrado: {file_path}")
+        raise
     except json.JSONDecodeError:
         print(f"Erro: Não foi possível decodificar o arquivo JSON {file_path}.")
+        raise
+    except UnexpectedPayloadError:
+        print(
+            "Formato JSON inesperado para partidas: 'response' não encontrado ou não é uma lista."
+        )
+        raise
     except Exception as e:
         print(f"Erro ao processar ou salvar os dados de partidas: {e}")
+        raise
+
+    report["skipped"] = sum(skip_reasons.values())
+    # Blocos perdidos no commit: o job e o pipeline tratam como falha
+    report["failed"] = (
+        skip_reasons["erro_de_integridade"] + skip_reasons["erro_no_commit"]
+    )
+    report["skip_reasons"] = dict(skip_reasons)
+    print(
+        f"Partidas do arquivo {file_name}: {report['inserted']} inseridas, {report['updated']} atualizadas, {report['skipped']} puladas {report['skip_reasons']}."
+    )
+    return report
@@ -0,0 +1,55 @@
+import httpx
+from config import (
+    API_BASE_URL,
+    HEADERS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_TIMEOUT,
+)
+from typing import Optional
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 só é habilitado se o pacote opcional `h2` estiver instalado."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Retorna o cliente HTTP assíncrono compartilhado por todas as rotas de fetch.
+
+    O cliente é criado na primeira chamada e reaproveita as conexões
+    (keep-alive) com a API entre downloads.
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=API_BASE_URL,
+            # Cabeçalhos sem valor (ex.: API_KEY ausente) são descartados
+            headers={key: value for key, value in HEADERS.items() if value},
+            http2=_http2_available(),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+            timeout=HTTP_TIMEOUT,
+        )
+    return _client
+
+
+async def close_http_client():
+    """Fecha o cliente compartilhado (chamado no shutdown da aplicação)."""
+    global _client
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
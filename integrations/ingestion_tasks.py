@@ -0,0 +1,59 @@
+from integrations.save_json import fetch_and_save_to_json
+from integrations.countries_processor import process_countries_json_and_save_to_db
+from integrations.venues_processor import process_venues_json_and_save_to_db
+from integrations.league_processor import process_league_json_and_save_to_db
+from integrations.teams_processor import process_teams_json_and_save_to_db
+from integrations.league_teams_processor import link_teams_to_league_and_venues
+from integrations.fixtures_processor import process_fixtures_json_and_save_to_db
+from integrations.fixture_statistics import ingest_fixture_statistics
+from integrations.fixture_players import ingest_fixture_players
+from integrations.profiles_processor import (
+    process_players_json_and_save_to_db,
+    process_coaches_json_and_save_to_db,
+    ingest_league_coaches,
+)
+from integrations.pipeline import ingest_league_season
+from integrations.standings import rebuild_league_standings
+from integrations.season_stats import rebuild_player_season_stats
+from integrations.leaderboards import refresh_leaderboards
+from typing import Optional
+
+
+async def fetch_and_process_leagues(
+    filename: Optional[str] = None, params: Optional[dict] = None
+):
+    """Baixa as ligas e só então processa o arquivo baixado."""
+    file_name = await fetch_and_save_to_json("/leagues", filename, params=params)
+    return await process_league_json_and_save_to_db(file_name)
+
+
+async def fetch_and_process_teams(
+    filename: Optional[str] = None, params: Optional[dict] = None
+):
+    """Baixa as equipes e só então processa o arquivo baixado."""
+    file_name = await fetch_and_save_to_json("/teams", filename, params=params)
+    return await process_teams_json_and_save_to_db(file_name)
+
+
+# Tarefas que podem ser enfileiradas como job, pelo nome gravado em ingestion_jobs.
+# Os parâmetros dos jobs precisam ser serializáveis em JSON.
+TASKS = {
+    "fetch": fetch_and_save_to_json,
+    "process_countries": process_countries_json_and_save_to_db,
+    "process_venues": process_venues_json_and_save_to_db,
+    "process_leagues": process_league_json_and_save_to_db,
+    "process_teams": process_teams_json_and_save_to_db,
+    "link_teams_to_league": link_teams_to_league_and_venues,
+    "process_fixtures": process_fixtures_json_and_save_to_db,
+    "fetch_and_process_leagues": fetch_and_process_leagues,
+    "fetch_and_process_teams": fetch_and_process_teams,
+    "ingest_league_season": ingest_league_season,
+    "rebuild_standings": rebuild_league_standings,
+    "ingest_fixture_statistics": ingest_fixture_statistics,
+    "ingest_fixture_players": ingest_fixture_players,
+    "process_players": process_players_json_and_save_to_db,
+    "process_coaches": process_coaches_json_and_save_to_db,
+    "ingest_league_coaches": ingest_league_coaches,
+    "rebuild_player_season_stats": rebuild_player_season_stats,
+    "refresh_leaderboards": refresh_leaderboards,
+}
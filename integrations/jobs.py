@@ -0,0 +1,152 @@
+import asyncio
+import time
+import traceback
+from config import INGEST_WORKERS
+from database.database import async_session_factory
+from datetime import datetime, timezone
+from integrations.ingestion_tasks import TASKS
+from integrations.pipeline import reported_failures
+from models.ingestion_job import IngestionJob
+from sqlalchemy import update
+from sqlalchemy.future import select
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+INTERRUPTED = "interrupted"
+
+
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _result_to_json(result):
+    """Normaliza o retorno da tarefa (contagem ou relatório) para a coluna JSON."""
+    if result is None or isinstance(result, dict):
+        return result
+    if isinstance(result, int):
+        return {"rows": result}
+    return {"result": str(result)}
+
+
+class JobRunner:
+    """
+    Fila de jobs de ingestão com um número fixo de workers no event loop.
+
+    Cada job é gravado em ingestion_jobs com estado, duração, contagens e
+    erro. Jobs ainda na fila quando a aplicação parou são reenfileirados na
+    inicialização; os que estavam rodando são marcados como interrompidos.
+    """
+
+    def __init__(self, max_workers: int = INGEST_WORKERS):
+        self.max_workers = max_workers
+        self._queue = None
+        self._workers = []
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+
+        async with async_session_factory() as session:
+            await session.execute(
+                update(IngestionJob)
+                .where(IngestionJob.status == RUNNING)
+                .values(status=INTERRUPTED, finished_at=_utcnow())
+            )
+            result = await session.execute(
+                select(IngestionJob.id)
+                .where(IngestionJob.status == QUEUED)
+                .order_by(IngestionJob.id)
+            )
+            pending_ids = list(result.scalars())
+            await session.commit()
+
+        for job_id in pending_ids:
+            self._queue.put_nowait(job_id)
+
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.max_workers)
+        ]
+        print(
+            f"Fila de ingestão iniciada com {self.max_workers} workers ({len(pending_ids)} jobs pendentes)."
+        )
+
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, task: str, **params) -> int:
+        """Grava o job como `queued` e o coloca na fila. Retorna o id do job."""
+        if task not in TASKS:
+            raise ValueError(f"Tarefa de ingestão desconhecida: {task}")
+
+        async with async_session_factory() as session:
+            job = IngestionJob(
+                task=task, params=params, status=QUEUED, created_at=_utcnow()
+            )
+            session.add(job)
+            await session.commit()
+            job_id = job.id
+
+        self._queue.put_nowait(job_id)
+        return job_id
+
+    def queue_size(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception as e:
+                # Falha ao gravar o estado do job não pode derrubar o worker
+                print(f"Erro ao executar o job {job_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: int):
+        async with async_session_factory() as session:
+            job = await session.get(IngestionJob, job_id)
+            if job is None or job.status != QUEUED:
+                return
+            job.status = RUNNING
+            job.started_at = _utcnow()
+            await session.commit()
+            task, params = job.task, job.params or {}
+
+        start = time.perf_counter()
+        values = {}
+        try:
+            result = await TASKS[task](**params)
+            values.update(result=_result_to_json(result))
+            failures = reported_failures(result)
+            if failures:
+                raise RuntimeError(
+                    f"A tarefa registrou {failures} falhas no relatório"
+                )
+            values.update(status=SUCCEEDED)
+        except asyncio.CancelledError:
+            values.update(status=INTERRUPTED)
+            raise
+        except Exception:
+            values.update(status=FAILED, error=traceback.format_exc())
+        finally:
+            values.update(
+                finished_at=_utcnow(),
+                duration_ms=int((time.perf_counter() - start) * 1000),
+            )
+            async with async_session_factory() as session:
+                await session.execute(
+                    update(IngestionJob)
+                    .where(IngestionJob.id == job_id)
+                    .values(**values)
+                )
+                await session.commit()
+
+        print(f"Job {job_id} ({task}) terminou com status {values['status']}.")
+
+
+job_runner = JobRunner()
@@ -0,0 +1,181 @@
+import asyncio
+import json
+from integrations.payload_storage import open_payload
+from itertools import islice
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+
+
+class UnexpectedPayloadError(ValueError):
+    """O arquivo não tem a chave `response` com uma lista no nível raiz."""
+
+
+class _BufferedJsonReader:
+    """
+    Lê um documento JSON em blocos de `read_size` caracteres, mantendo em
+    memória apenas o valor que está sendo decodificado.
+    """
+
+    def __init__(self, json_file, read_size: int):
+        self._file = json_file
+        self._read_size = read_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(self._read_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _skip_whitespace(self):
+        while True:
+            while (
+                self._pos < len(self._buffer)
+                and self._buffer[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return
+            if not self._fill():
+                raise json.JSONDecodeError(
+                    "Fim inesperado do arquivo", self._buffer, self._pos
+                )
+
+    def next_char(self) -> str:
+        self._skip_whitespace()
+        char = self._buffer[self._pos]
+        self._pos += 1
+        return char
+
+    def peek_char(self) -> str:
+        self._skip_whitespace()
+        return self._buffer[self._pos]
+
+    def expect(self, expected: str):
+        char = self.next_char()
+        if char != expected:
+            raise json.JSONDecodeError(
+                f"Esperado '{expected}', encontrado '{char}'",
+                self._buffer,
+                self._pos - 1,
+            )
+
+    def value(self):
+        """Decodifica o próximo valor JSON completo, lendo mais blocos se preciso."""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # Um valor que não é seguido de um delimitador pode estar truncado
+            # (ex.: o número 2 de um 2.5 cujo resto ainda não foi lido)
+            if (
+                end == len(self._buffer) or self._buffer[end] not in _DELIMITERS
+            ) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_response_items(file_path: str, read_size: int = 64 * 1024) -> Iterator:
+    """
+    Percorre um payload da API (`{"get": ..., "response": [...]}`) e devolve
+    os itens de `response` um a um, sem carregar o arquivo inteiro. Arquivos
+    comprimidos (gzip/zstd) são descomprimidos em streaming.
+
+    Raises:
+        UnexpectedPayloadError: se `response` não existir ou não for uma lista.
+        json.JSONDecodeError: se o arquivo não for um JSON válido.
+    """
+    with open_payload(file_path) as json_file:
+        reader = _BufferedJsonReader(json_file, read_size)
+        reader.expect("{")
+        if reader.peek_char() == "}":
+            raise UnexpectedPayloadError("'response' não encontrado")
+
+        while True:
+            key = reader.value()
+            reader.expect(":")
+
+            if key == "response":
+                if reader.peek_char() != "[":
+                    raise UnexpectedPayloadError("'response' não é uma lista")
+                reader.expect("[")
+                if reader.peek_char() == "]":
+                    return
+                while True:
+                    yield reader.value()
+                    separator = reader.next_char()
+                    if separator == "]":
+                        return
+                    if separator != ",":
+                        raise json.JSONDecodeError(
+                            f"Esperado ',' ou ']', encontrado '{separator}'",
+                            "",
+                            0,
+                        )
+
+            # As demais chaves (get, parameters, errors, paging...) são pequenas
+            reader.value()
+            separator = reader.next_char()
+            if separator == "}":
+                raise UnexpectedPayloadError("'response' não encontrado")
+            if separator != ",":
+                raise json.JSONDecodeError(
+                    f"Esperado ',' ou '}}', encontrado '{separator}'", "", 0
+                )
+
+
+def iter_chunks(items: Iterable, size: int) -> Iterator[list]:
+    """Agrupa um iterável em listas de até `size` elementos."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+async def iter_response_chunks(
+    file_path: str,
+    size: int,
+    parse: Optional[Callable] = None,
+    read_size: int = 64 * 1024,
+) -> AsyncIterator[list]:
+    """
+    Versão assíncrona de `iter_chunks(iter_response_items(file_path), size)`.
+
+    Leitura, descompressão e decodificação de cada bloco rodam numa thread
+    (`asyncio.to_thread`), assim como `parse`, aplicado a cada item quando
+    informado; no event loop ficam só as esperas do banco de quem consome.
+    """
+
+    def next_chunk():
+        chunk = next(chunks, None)
+        if chunk is not None and parse is not None:
+            chunk = [parse(item) for item in chunk]
+        return chunk
+
+    items = iter_response_items(file_path, read_size)
+    chunks = iter_chunks(items, size)
+    try:
+        while (chunk := await asyncio.to_thread(next_chunk)) is not None:
+            yield chunk
+    finally:
+        # Fecha o arquivo mesmo se quem consome parar no meio. Numa task
+        # cancelada a thread ainda pode estar lendo: o arquivo é fechado
+        # quando o gerador for coletado.
+        try:
+            items.close()
+        except ValueError:
+            pass
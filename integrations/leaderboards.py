@@ -0,0 +1,270 @@
+import asyncio
+import time
+from config import (
+    LEADERBOARD_CACHE_MAX_ENTRIES,
+    LEADERBOARD_CACHE_TTL,
+    LEADERBOARD_MIN_RATED_APPEARANCES,
+    LEADERBOARD_REFRESH_INTERVAL,
+    LEADERBOARD_SIZE,
+)
+from database.database import async_session_factory, replica_router
+from datetime import datetime, timezone
+from models.base_player import BasePlayer
+from models.base_team import BaseTeam
+from models.league_team import LeagueTeam
+from models.player_leaderboard import PlayerLeaderboard
+from models.player_season_stat import PlayerSeasonStat
+from sqlalchemy import delete, func, insert
+from sqlalchemy.future import select
+from utils.feed_cache import FeedCache
+
+# Métrica -> coluna de players_season_stats usada para ordenar
+LEADERBOARD_METRICS = {
+    "goals": PlayerSeasonStat.goals,
+    "assists": PlayerSeasonStat.assists,
+    "rating": PlayerSeasonStat.rating,
+    "yellow_cards": PlayerSeasonStat.cards_yellow,
+    "red_cards": PlayerSeasonStat.cards_red,
+    "clean_sheets": PlayerSeasonStat.clean_sheets,
+}
+
+# Mesma estrutura do cache de feeds: entradas (league_id, métrica) dependem
+# da liga e são substituídas a cada recálculo dela
+leaderboard_cache = FeedCache(
+    ttl=LEADERBOARD_CACHE_TTL, max_entries=LEADERBOARD_CACHE_MAX_ENTRIES
+)
+
+
+def rank_entries(entries: list) -> list:
+    """
+    Numera as entradas já ordenadas por valor: `position` é a ordem na
+    lista e `rank` é igual para valores empatados (1, 2, 2, 4).
+    """
+    for position, entry in enumerate(entries, start=1):
+        previous = entries[position - 2] if position > 1 else None
+        if previous is not None and previous["value"] == entry["value"]:
+            entry["rank"] = previous["rank"]
+        else:
+            entry["rank"] = position
+        entry["position"] = position
+    return entries
+
+
+async def compute_leaderboard(session, league_id: int, metric: str, size: int) -> list:
+    """
+    As `size` primeiras entradas de uma métrica na liga, direto de
+    players_season_stats. Em caso de empate fica na frente quem jogou menos
+    minutos. Na nota média só entram jogadores com ao menos
+    LEADERBOARD_MIN_RATED_APPEARANCES partidas com nota.
+    """
+    value = LEADERBOARD_METRICS[metric]
+    filters = [LeagueTeam.league_id == league_id, value > 0]
+    if metric == "rating":
+        filters.append(
+            PlayerSeasonStat.rated_appearances >= LEADERBOARD_MIN_RATED_APPEARANCES
+        )
+    result = await session.execute(
+        select(
+            PlayerSeasonStat.base_player_api_id,
+            PlayerSeasonStat.league_team_id,
+            value.label("value"),
+            PlayerSeasonStat.appearances,
+            PlayerSeasonStat.minutes,
+            BasePlayer.name.label("player_name"),
+            BasePlayer.photo_url.label("player_photo_url"),
+            BaseTeam.name.label("team_name"),
+            BaseTeam.logo_url.label("team_logo_url"),
+        )
+        .join(LeagueTeam, LeagueTeam.id == PlayerSeasonStat.league_team_id)
+        .join(BasePlayer, BasePlayer.api_id == PlayerSeasonStat.base_player_api_id)
+        .join(BaseTeam, BaseTeam.api_id == LeagueTeam.base_team_api_id)
+        .where(*filters)
+        .order_by(
+            value.desc(),
+            func.coalesce(PlayerSeasonStat.minutes, 0),
+            PlayerSeasonStat.base_player_api_id,
+        )
+        .limit(size)
+    )
+    return rank_entries([dict(row) for row in result.mappings()])
+
+
+def _board(league_id: int, metric: str, refreshed_at, entries: list) -> dict:
+    """Ranking no formato de LeaderboardResponse, como guardado no cache."""
+    return {
+        "league_id": league_id,
+        "metric": metric,
+        "refreshed_at": refreshed_at,
+        "entries": [
+            {
+                **{key: value for key, value in entry.items() if key != "position"},
+                "value": float(entry["value"]),
+            }
+            for entry in entries
+        ],
+    }
+
+
+async def refresh_leaderboards(league_id: int, size: int = LEADERBOARD_SIZE):
+    """
+    Recalcula todos os rankings de uma liga, substitui as linhas de
+    player_leaderboards numa única transação e coloca o resultado no cache.
+
+    Returns:
+        dict: Relatório com a quantidade de entradas por métrica.
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    boards = {}
+    async with async_session_factory() as session:
+        for metric in LEADERBOARD_METRICS:
+            boards[metric] = await compute_leaderboard(session, league_id, metric, size)
+
+        await session.execute(
+            delete(PlayerLeaderboard).where(PlayerLeaderboard.league_id == league_id)
+        )
+        rows = [
+            {**entry, "league_id": league_id, "metric": metric, "refreshed_at": now}
+            for metric, entries in boards.items()
+            for entry in entries
+        ]
+        if rows:
+            await session.execute(insert(PlayerLeaderboard), rows)
+        await session.commit()
+
+    leaderboard_cache.invalidate_leagues([league_id])
+    for metric, entries in boards.items():
+        leaderboard_cache.put(
+            (league_id, metric), _board(league_id, metric, now, entries), [league_id]
+        )
+    print(f"Rankings da liga {league_id} recalculados ({len(rows)} entradas).")
+    return {
+        "league_id": league_id,
+        "metrics": {metric: len(entries) for metric, entries in boards.items()},
+    }
+
+
+async def load_leaderboard(league_id: int, metric: str):
+    """
+    Lê um ranking pré-calculado pelo índice (league_id, metric, position),
+    que inclui todas as colunas exibidas. Usado pelo cache em caso de falta.
+
+    Returns:
+        tuple: (ranking, [league_id]) no formato de FeedCache.get.
+    """
+    async with replica_router.reader_factory()() as session:
+        result = await session.execute(
+            select(
+                PlayerLeaderboard.rank,
+                PlayerLeaderboard.base_player_api_id,
+                PlayerLeaderboard.league_team_id,
+                PlayerLeaderboard.value,
+                PlayerLeaderboard.appearances,
+                PlayerLeaderboard.minutes,
+                PlayerLeaderboard.player_name,
+                PlayerLeaderboard.player_photo_url,
+                PlayerLeaderboard.team_name,
+                PlayerLeaderboard.team_logo_url,
+                PlayerLeaderboard.refreshed_at,
+            )
+            .where(
+                PlayerLeaderboard.league_id == league_id,
+                PlayerLeaderboard.metric == metric,
+            )
+            .order_by(PlayerLeaderboard.position)
+        )
+        entries = [dict(row) for row in result.mappings()]
+    refreshed_at = entries[0]["refreshed_at"] if entries else None
+    for entry in entries:
+        del entry["refreshed_at"]
+    return _board(league_id, metric, refreshed_at, entries), [league_id]
+
+
+async def get_leaderboard(league_id: int, metric: str) -> dict:
+    return await leaderboard_cache.get(
+        (league_id, metric), lambda: load_leaderboard(league_id, metric)
+    )
+
+
+class LeaderboardRefresher:
+    """
+    Recalcula em segundo plano, a cada `interval` segundos, os rankings das
+    ligas cujas estatísticas de temporada mudaram desde o último ciclo.
+
+    Quem grava players_season_stats só marca as equipes (ou ligas)
+    alteradas; várias gravações seguidas na mesma liga resultam num único
+    recálculo.
+    """
+
+    def __init__(self, interval: float = LEADERBOARD_REFRESH_INTERVAL):
+        self.interval = interval
+        self._league_team_ids = set()
+        self._league_ids = set()
+        self.refreshes = 0
+        self.errors = 0
+        self.last_refresh_at = None
+        self._task = None
+
+    def mark_league_teams(self, league_team_ids):
+        self._league_team_ids.update(league_team_ids)
+
+    def mark_leagues(self, league_ids):
+        self._league_ids.update(league_ids)
+
+    async def refresh_pending(self):
+        """Recalcula as ligas marcadas até agora."""
+        league_team_ids, self._league_team_ids = self._league_team_ids, set()
+        league_ids, self._league_ids = self._league_ids, set()
+        try:
+            if league_team_ids:
+                async with async_session_factory() as session:
+                    result = await session.execute(
+                        select(LeagueTeam.league_id)
+                        .where(LeagueTeam.id.in_(league_team_ids))
+                        .distinct()
+                    )
+                    league_ids.update(result.scalars())
+        except Exception as e:
+            self._league_team_ids.update(league_team_ids)
+            self._league_ids.update(league_ids)
+            self.errors += 1
+            print(f"Erro ao buscar as ligas dos rankings alterados: {e}")
+            return
+
+        for league_id in sorted(league_ids):
+            try:
+                await refresh_leaderboards(league_id)
+                self.refreshes += 1
+            except Exception as e:
+                # Tenta de novo no próximo ciclo
+                self._league_ids.add(league_id)
+                self.errors += 1
+                print(f"Erro ao recalcular os rankings da liga {league_id}: {e}")
+        if league_ids:
+            self.last_refresh_at = time.time()
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.refresh_pending()
+
+    def metrics(self) -> dict:
+        return {
+            "pending_leagues": len(self._league_ids),
+            "pending_league_teams": len(self._league_team_ids),
+            "refreshes": self.refreshes,
+            "errors": self.errors,
+            "last_refresh_at": self.last_refresh_at,
+        }
+
+
+leaderboard_refresher = LeaderboardRefresher()
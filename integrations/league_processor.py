@@ -1,25 +1,30 @@
 import json
 import os
-from config import API_HOST, HEADERS
+from config import API_HOST, HEADERS, INGEST_CHUNK_SIZE
 from database.database import async_session_factory
 from datetime import datetime, timezone
+from integrations.json_stream import (
+    iter_response_chunks,
+    UnexpectedPayloadError,
+)
+from integrations.reference_cache import country_cache
 from models.league import League
-from models.country import Country
-from sqlalchemy.future import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 
-async def process_league_json_and_save_to_db(file_name):
+async def process_league_json_and_save_to_db(
+    file_name, chunk_size: int = INGEST_CHUNK_SIZE
+):
     json_dir = "json"
     file_path = os.path.join(json_dir, file_name)
+    saved_count = 0
 
     try:
-        with open(file_path, "r") as json_file:
-            data = json.load(json_file)
-
-        if "response" in data and isinstance(data["response"], list):
-            async with async_session_factory() as session:
-                for league_data in data["response"]:
+        async with async_session_factory() as session:
+            async for chunk in iter_response_chunks(file_path, chunk_size):
+                # Uma mesma liga-temporada repetida no bloco: vale a última
+                rows = {}
+                for league_data in chunk:
                     league_info = league_data.get("league")
                     country_info = league_data.get("country")
                     seasons_list = league_data.get("seasons")
@@ -35,35 +40,34 @@ async def process_league_json_and_save_to_db(file_name):
                     country_name = country_info.get("name")
 
                     if country_name:
-                        query = select(Country).where(Country.name == country_name)
-                        result = await session.execute(query)
-                        country = result.scalar_one_or_none()
+                        country_id = await country_cache.get_id(
+                            session, country_name
+                        )
 
-                        if country:
+                        if country_id is not None:
                             for season_data in seasons_list:
                                 season_year = season_data.get("year")
                                 season_start = season_data.get("start")
                                 season_end = season_data.get("end")
 
                                 if season_year and season_start and season_end:
-                                    db_league = League(
-                                        name=league_name,
-                                        country_id=country.id,
-                                        api_id=league_id_from_api,
-                                        season=season_year,
-                                        type=league_type,
-                                        logo_url=league_logo,
-                                        start_date=datetime.strptime(
+                                    rows[(league_id_from_api, season_year)] = {
+                                        "name": league_name,
+                                        "country_id": country_id,
+                                        "api_id": league_id_from_api,
+                                        "season": season_year,
+                                        "type": league_type,
+                                        "logo_url": league_logo,
+                                        "start_date": datetime.strptime(
                                             season_start, "%Y-%m-%d"
-                                        ).replace(tzinfo=timezone.utc),
-                                        end_date=datetime.strptime(
+                                        ).date(),
+                                        "end_date": datetime.strptime(
                                             season_end, "%Y-%m-%d"
-                                        ).replace(tzinfo=timezone.utc),
-                                        last_updated=datetime.now(timezone.utc).replace(
-                                            tzinfo=None
-                                        ),
-                                    )
-                                    session.add(db_league)
+                                        ).date(),
+                                        "last_updated": datetime.now(
+                                            timezone.utc
+                                        ).replace(tzinfo=None),
+                                    }
                                 else:
                                     print(
                                         f"Dados incompletos para o campeonato {league_name} com o ID API: {league_id_from_api}"
@@ -79,22 +83,39 @@ async def process_league_json_and_save_to_db(file_name):
                             f"Nome do pais não encontrado para o campeonato {league_name}"
                         )
 
+                if not rows:
+                    continue
+
+                # Temporadas já gravadas são atualizadas em vez de descartar o bloco
+                stmt = pg_insert(League).values(list(rows.values()))
+                await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[League.api_id, League.season],
+                        set_={
+                            column: stmt.excluded[column]
+                            for column in next(iter(rows.values()))
+                            if column not in ("api_id", "season")
+                        },
+                    )
+                )
                 await session.commit()
-                print(f"Campeonatos salvos com sucesso no banco de dados")
+                saved_count += len(rows)
 
-        else:
-            print(
-                "Formato JSON inesperado para campeonatos: 'response' não encontrado ou não é uma lista"
-            )
+            print(f"Campeonatos salvos com sucesso no banco de dados")
 
     except FileNotFoundError:
         print(f"Arquivo JSON não encontrado: {file_path}")
+        raise
     except json.JSONDecodeError as e:
         print(f"Erro ao decodificar JSON: {e}")
-    except IntegrityError:
-        await session.rollback()
+        raise
+    except UnexpectedPayloadError:
         print(
-            f"Erro de integridade ao salvar no banco de dados: Tentando guardar um campeonato (api_id, season) duplicada"
+            "Formato JSON inesperado para campeonatos: 'response' não encontrado ou não é uma lista"
         )
+        raise
     except Exception as e:
         print(f"Erro ao processar o arquivo JSON: {e}")
+        raise
+
+    return saved_count
@@ -0,0 +1,199 @@
+import asyncio
+import time
+from config import LIVE_POLL_INTERVAL, LIVE_LEAGUES
+from database.database import async_session_factory
+from datetime import datetime, timezone
+from integrations.broker import broker, fixture_event
+from integrations.fixtures_processor import _parse_fixture
+from integrations.rate_limiter import api_scheduler, LIVE
+from integrations.standings import FINISHED_STATUSES, refresh_standings
+from models.fixture import Fixture
+from models.league_team import LeagueTeam
+from sqlalchemy import update
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+
+# Campos comparados a cada ciclo; só partidas com alguma diferença são gravadas
+LIVE_COLUMNS = (
+    "home_team_score_goals",
+    "away_team_score_goals",
+    "status",
+    "status_short",
+    "elapsed",
+)
+
+# Quantidade máxima de ids por chamada de /fixtures?ids=
+_IDS_PER_REQUEST = 20
+
+
+class LiveUpdater:
+    """
+    Acompanha as partidas ao vivo consultando `/fixtures?live=...` a cada
+    `interval` segundos na faixa LIVE do agendador da API.
+
+    Cada resposta é comparada com o último estado conhecido em memória
+    (placar, status e tempo decorrido) e apenas as partidas que mudaram são
+    gravadas, num único UPDATE em lote por ciclo. Partidas que saem da lista
+    ao vivo são consultadas uma última vez por id para gravar o resultado
+    final e atualizar a classificação.
+    """
+
+    def __init__(
+        self, interval: float = LIVE_POLL_INTERVAL, leagues: str = LIVE_LEAGUES
+    ):
+        self.interval = interval
+        self.leagues = leagues
+        self._state = {}  # api_id -> último estado conhecido (colunas LIVE_COLUMNS)
+        # api_id -> (league_id, home_team_id, away_team_id,
+        #            api_id do mandante, api_id do visitante)
+        self._keys = {}
+        self._task = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            print(
+                f"Atualização ao vivo iniciada (live={self.leagues}, a cada {self.interval}s)."
+            )
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def tracked_count(self) -> int:
+        return len(self._state)
+
+    async def _run(self):
+        while True:
+            start = time.monotonic()
+            try:
+                await self.tick()
+            except Exception as e:
+                print(f"Erro na atualização de partidas ao vivo: {e}")
+            await asyncio.sleep(max(0, self.interval - (time.monotonic() - start)))
+
+    async def tick(self) -> list:
+        """Executa um ciclo de consulta e gravação. Retorna as partidas alteradas."""
+        data = await api_scheduler.get_json(
+            "/fixtures", params={"live": self.leagues}, priority=LIVE
+        )
+        live = self._parse(data)
+
+        # Partidas que saíram da lista ao vivo terminaram (ou foram suspensas)
+        gone = [api_id for api_id in self._state if api_id not in live]
+        for start in range(0, len(gone), _IDS_PER_REQUEST):
+            batch = gone[start : start + _IDS_PER_REQUEST]
+            ids = "-".join(str(api_id) for api_id in batch)
+            final = await api_scheduler.get_json(
+                "/fixtures", params={"ids": ids}, priority=LIVE
+            )
+            live.update(self._parse(final))
+
+        async with async_session_factory() as session:
+            await self._load_new(session, live)
+            changes = self._diff(live)
+            if changes:
+                await session.execute(update(Fixture), changes)
+                await self._refresh_standings(session, changes)
+                await session.commit()
+
+        for change in changes:
+            self._state[change["api_id"]] = {
+                column: change[column] for column in LIVE_COLUMNS
+            }
+        if changes:
+            print(f"Partidas ao vivo: {len(changes)} de {len(live)} atualizadas.")
+            # Uma gravação por mudança, entregue a todos os clientes inscritos
+            await broker.publish([self._event(change) for change in changes])
+
+        for api_id in gone:
+            self._forget(api_id)
+        return changes
+
+    def _event(self, change: dict) -> dict:
+        league_id, _, _, home_team_api_id, away_team_api_id = self._keys[
+            change["api_id"]
+        ]
+        return fixture_event(
+            {**change, "league_id": league_id}, home_team_api_id, away_team_api_id
+        )
+
+    def _parse(self, data: dict) -> dict:
+        fixtures = {}
+        for item in data.get("response") or []:
+            parsed, _ = _parse_fixture(item)
+            if parsed is not None:
+                fixtures[parsed["api_id"]] = parsed
+        return fixtures
+
+    async def _load_new(self, session, live: dict):
+        """
+        Carrega do banco, numa única consulta, o estado das partidas vistas
+        pela primeira vez.
+        """
+        new_ids = [api_id for api_id in live if api_id not in self._state]
+        if not new_ids:
+            return
+
+        home_team = aliased(LeagueTeam)
+        away_team = aliased(LeagueTeam)
+        result = await session.execute(
+            select(
+                Fixture.api_id,
+                Fixture.league_id,
+                Fixture.home_team_id,
+                Fixture.away_team_id,
+                home_team.base_team_api_id.label("home_team_api_id"),
+                away_team.base_team_api_id.label("away_team_api_id"),
+                *(getattr(Fixture, column) for column in LIVE_COLUMNS),
+            )
+            .join(home_team, home_team.id == Fixture.home_team_id)
+            .join(away_team, away_team.id == Fixture.away_team_id)
+            .where(Fixture.api_id.in_(new_ids))
+        )
+        for row in result:
+            self._keys[row.api_id] = (
+                row.league_id,
+                row.home_team_id,
+                row.away_team_id,
+                row.home_team_api_id,
+                row.away_team_api_id,
+            )
+            self._state[row.api_id] = {
+                column: getattr(row, column) for column in LIVE_COLUMNS
+            }
+
+        for api_id in new_ids:
+            if api_id not in self._state:
+                # Partida ainda não ingerida: a ingestão normal a cria e o
+                # próximo ciclo volta a procurá-la no banco
+                del live[api_id]
+
+    def _diff(self, live: dict) -> list:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        changes = []
+        for api_id, parsed in live.items():
+            current = {column: parsed[column] for column in LIVE_COLUMNS}
+            if current != self._state[api_id]:
+                changes.append({"api_id": api_id, **current, "last_updated": now})
+        return changes
+
+    async def _refresh_standings(self, session, changes: list):
+        teams = {}
+        for change in changes:
+            if change["status_short"] in FINISHED_STATUSES:
+                league_id, home_team_id, away_team_id, _, _ = self._keys[
+                    change["api_id"]
+                ]
+                teams.setdefault(league_id, set()).update((home_team_id, away_team_id))
+        for league_id, league_team_ids in teams.items():
+            await refresh_standings(session, league_id, league_team_ids)
+
+    def _forget(self, api_id: int):
+        self._state.pop(api_id, None)
+        self._keys.pop(api_id, None)
+
+
+live_updater = LiveUpdater()
@@ -0,0 +1,251 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from config import PAYLOAD_CACHE_EVICTION_GRACE, PAYLOAD_CACHE_MAX_BYTES
+from integrations.payload_storage import EXTENSIONS, storage_format, write_payload
+from typing import Optional
+
+CACHE_DIR = "cache"  # dentro da pasta json/
+INDEX_FILE = "index.json"
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Validade (segundos) dos payloads por endpoint
+ENDPOINT_TTLS = {
+    "/countries": 28 * DAY,
+    "/venues": 7 * DAY,
+    "/leagues": DAY,
+    "/teams": DAY,
+    "/players": DAY,
+    "/fixtures": 10 * MINUTE,
+}
+DEFAULT_TTL = HOUR
+LIVE_TTL = 15  # partidas ao vivo (/fixtures?live=...)
+
+
+def canonical_params(params: Optional[dict]) -> dict:
+    """Parâmetros sem valores None, com valores em texto e chaves ordenadas."""
+    return {
+        key: str(value)
+        for key, value in sorted((params or {}).items())
+        if value is not None
+    }
+
+
+def cache_key(endpoint: str, params: Optional[dict] = None) -> str:
+    """Hash SHA-256 do endpoint com os parâmetros canônicos."""
+    canonical = json.dumps(
+        [endpoint, canonical_params(params)], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def cache_file_name(endpoint: str, params: Optional[dict] = None) -> str:
+    """
+    Nome do arquivo do payload (relativo à pasta json/). O prefixo com o
+    endpoint só facilita a leitura; a identidade é o hash.
+    """
+    prefix = endpoint.strip("/").replace("/", "_") or "root"
+    extension = EXTENSIONS[storage_format()]
+    return f"{CACHE_DIR}/{prefix}_{cache_key(endpoint, params)[:20]}{extension}"
+
+
+def ttl_for(endpoint: str, params: Optional[dict] = None) -> int:
+    if endpoint == "/fixtures" and (params or {}).get("live") is not None:
+        return LIVE_TTL
+    return ENDPOINT_TTLS.get(endpoint, DEFAULT_TTL)
+
+
+class PayloadCache:
+    """
+    Cache em disco das respostas brutas da API, endereçado pelo hash do
+    endpoint com os parâmetros.
+
+    Um payload dentro da validade é servido do disco. Um payload vencido é
+    revalidado com If-None-Match/If-Modified-Since quando a API enviou
+    ETag/Last-Modified (um 304 só renova a validade) e baixado de novo caso
+    contrário. Quando a pasta passa de `max_bytes`, os payloads acessados há
+    mais tempo são apagados; os servidos nos últimos `eviction_grace`
+    segundos ficam, para que quem recebeu o nome do arquivo ainda o encontre
+    ao abri-lo (a pasta pode passar do limite enquanto isso).
+    """
+
+    def __init__(
+        self,
+        json_dir: str = "json",
+        max_bytes: int = PAYLOAD_CACHE_MAX_BYTES,
+        clock=time.time,
+        eviction_grace: int = PAYLOAD_CACHE_EVICTION_GRACE,
+    ):
+        self.json_dir = json_dir
+        self.max_bytes = max_bytes
+        self.eviction_grace = eviction_grace
+        self._clock = clock
+        self._index = None
+        self._inflight = {}
+        # O índice só é alterado no event loop, sob este lock; as threads
+        # recebem apenas os arquivos a apagar e o índice já serializado
+        self._lock = asyncio.Lock()
+
+    @property
+    def _index_path(self) -> str:
+        return os.path.join(self.json_dir, CACHE_DIR, INDEX_FILE)
+
+    def _load_index(self) -> dict:
+        if self._index is None:
+            try:
+                with open(self._index_path, "r") as index_file:
+                    self._index = json.load(index_file)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._index = {}
+            # Descarta entradas cujo arquivo foi apagado fora do cache
+            self._index = {
+                key: entry
+                for key, entry in self._index.items()
+                if os.path.exists(os.path.join(self.json_dir, entry["file"]))
+            }
+        return self._index
+
+    def _write_index(self, serialized: str):
+        os.makedirs(os.path.dirname(self._index_path), exist_ok=True)
+        temp_path = self._index_path + ".tmp"
+        with open(temp_path, "w") as index_file:
+            index_file.write(serialized)
+        os.replace(temp_path, self._index_path)
+
+    def is_fresh(self, endpoint: str, params: Optional[dict] = None) -> bool:
+        entry = self._load_index().get(cache_key(endpoint, params))
+        return (
+            entry is not None
+            and self._clock() - entry["fetched_at"] < entry["ttl"]
+        )
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[dict],
+        download,
+        max_age: Optional[int] = None,
+    ) -> str:
+        """
+        Garante um payload válido para (endpoint, params) e devolve o nome do
+        arquivo (relativo à pasta json/).
+
+        `download(validators)` é chamado quando o payload está vencido; recebe
+        os cabeçalhos condicionais e devolve (dados, validadores), com dados
+        None quando a API respondeu 304. Pedidos simultâneos da mesma chave
+        compartilham um único download.
+        """
+        key = cache_key(endpoint, params)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        task = asyncio.ensure_future(
+            self._get(key, endpoint, params, download, max_age)
+        )
+        self._inflight[key] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done():
+                self._inflight.pop(key, None)
+            else:
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+    async def _get(self, key, endpoint, params, download, max_age) -> str:
+        index = self._load_index()
+        entry = index.get(key)
+        now = self._clock()
+        ttl = ttl_for(endpoint, params) if max_age is None else max_age
+        file_name = cache_file_name(endpoint, params)
+
+        # Uma entrada gravada em outro formato (ex.: antes de mudar
+        # PAYLOAD_STORAGE_FORMAT) é baixada de novo no formato atual
+        if entry is not None and entry["file"] != file_name:
+            await asyncio.to_thread(self._delete_files, [index.pop(key)])
+            entry = None
+
+        if entry is not None and now - entry["fetched_at"] < ttl:
+            entry["last_access"] = now
+            return entry["file"]
+
+        validators = {}
+        if entry is not None:
+            if entry.get("etag"):
+                validators["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                validators["If-Modified-Since"] = entry["last_modified"]
+
+        data, response_validators = await download(validators)
+
+        if data is None:
+            if entry is None:
+                raise ValueError(f"Resposta 304 sem payload em cache para {endpoint}")
+            print(f"Payload de {endpoint} não mudou na API (304); validade renovada.")
+        else:
+            size = await asyncio.to_thread(
+                write_payload, os.path.join(self.json_dir, file_name), data
+            )
+            entry = {
+                "file": file_name,
+                "endpoint": endpoint,
+                "params": canonical_params(params),
+                "size": size,
+                "etag": response_validators.get("etag"),
+                "last_modified": response_validators.get("last_modified"),
+            }
+            index[key] = entry
+
+        entry["fetched_at"] = entry["last_access"] = now
+        entry["ttl"] = ttl
+        async with self._lock:
+            evicted = self._evict(keep=set(self._inflight) | {key}, now=now)
+            serialized = json.dumps(self._index)
+            # Gravado ainda sob o lock: um índice mais antigo não sobrescreve
+            # um mais novo
+            await asyncio.to_thread(self._delete_files, evicted)
+            await asyncio.to_thread(self._write_index, serialized)
+        return entry["file"]
+
+    def _evict(self, keep: set, now: float) -> list:
+        """
+        Tira do índice os payloads menos usados até a pasta caber em
+        `max_bytes` e devolve as entradas removidas, cujos arquivos ainda
+        precisam ser apagados. Payloads sendo baixados agora (`keep`) ou
+        servidos há menos de `eviction_grace` segundos ficam.
+        """
+        index = self._load_index()
+        total = sum(entry["size"] for entry in index.values())
+        by_last_access = sorted(index.items(), key=lambda item: item[1]["last_access"])
+
+        evicted = []
+        for key, entry in by_last_access:
+            if total <= self.max_bytes:
+                break
+            if key in keep or now - entry["last_access"] < self.eviction_grace:
+                continue
+            evicted.append(index.pop(key))
+            total -= entry["size"]
+            print(f"Payload {entry['file']} removido do cache (limite de tamanho).")
+        return evicted
+
+    def _delete_files(self, entries: list):
+        for entry in entries:
+            try:
+                os.remove(os.path.join(self.json_dir, entry["file"]))
+            except FileNotFoundError:
+                pass
+
+    def invalidate(self, endpoint: str, params: Optional[dict] = None):
+        """Marca o payload como vencido; o próximo acesso baixa de novo."""
+        entry = self._load_index().get(cache_key(endpoint, params))
+        if entry is not None:
+            entry["fetched_at"] = 0
+
+
+payload_cache = PayloadCache()
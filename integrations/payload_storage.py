@@ -0,0 +1,99 @@
+import gzip
+import io
+import json
+import os
+from config import PAYLOAD_STORAGE_FORMAT, PAYLOAD_COMPRESSION_LEVEL
+
+try:
+    import zstandard
+except ImportError:  # zstd é opcional; sem ele os payloads usam gzip
+    zstandard = None
+
+JSON = "json"
+GZIP = "gzip"
+ZSTD = "zstd"
+
+EXTENSIONS = {JSON: ".json", GZIP: ".json.gz", ZSTD: ".json.zst"}
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def storage_format(requested: str = PAYLOAD_STORAGE_FORMAT) -> str:
+    """Formato de gravação efetivo: zstd cai para gzip se o pacote não existir."""
+    if requested == ZSTD and zstandard is None:
+        return GZIP
+    if requested not in EXTENSIONS:
+        raise ValueError(f"Formato de payload desconhecido: {requested}")
+    return requested
+
+
+def write_payload(file_path: str, data, fmt: str = None) -> int:
+    """
+    Grava o payload no formato configurado e devolve o tamanho em bytes.
+
+    `json` mantém o formato legível (indent=4); `gzip` e `zstd` gravam JSON
+    compacto comprimido. O cabeçalho gzip não leva data nem nome de arquivo,
+    para que o mesmo conteúdo gere sempre os mesmos bytes (o pipeline compara
+    os arquivos pelo hash). O conteúdo é gravado em `<arquivo>.tmp` e só
+    então substitui o arquivo, então um leitor nunca vê um payload pela metade.
+    """
+    fmt = storage_format(fmt or PAYLOAD_STORAGE_FORMAT)
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    temp_path = file_path + ".tmp"
+
+    try:
+        if fmt == JSON:
+            with open(temp_path, "w") as json_file:
+                json.dump(data, json_file, indent=4)
+        else:
+            with open(temp_path, "wb") as raw_file:
+                if fmt == GZIP:
+                    compressed = gzip.GzipFile(
+                        filename="",
+                        mode="wb",
+                        fileobj=raw_file,
+                        compresslevel=PAYLOAD_COMPRESSION_LEVEL,
+                        mtime=0,
+                    )
+                else:
+                    compressed = zstandard.ZstdCompressor(
+                        level=PAYLOAD_COMPRESSION_LEVEL
+                    ).stream_writer(raw_file, closefd=False)
+                with io.TextIOWrapper(compressed, encoding="utf-8") as text_file:
+                    json.dump(data, text_file, separators=(",", ":"))
+        size = os.path.getsize(temp_path)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return size
+
+
+def open_payload(file_path: str):
+    """
+    Abre um payload para leitura em texto, descomprimindo em streaming.
+
+    O formato é detectado pelos primeiros bytes do arquivo, então arquivos
+    antigos (JSON puro) e comprimidos são lidos da mesma forma.
+    """
+    with open(file_path, "rb") as raw_file:
+        magic = raw_file.read(4)
+
+    if magic.startswith(_GZIP_MAGIC):
+        return gzip.open(file_path, "rt", encoding="utf-8")
+    if magic == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise RuntimeError(
+                f"{file_path} está comprimido com zstd, mas o pacote zstandard não está instalado"
+            )
+        return io.TextIOWrapper(
+            zstandard.ZstdDecompressor().stream_reader(
+                open(file_path, "rb"), closefd=True
+            ),
+            encoding="utf-8",
+        )
+    return open(file_path, "r", encoding="utf-8")
@@ -0,0 +1,271 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from integrations.payload_cache import cache_file_name
+from integrations.rate_limiter import BACKFILL
+from integrations.save_json import fetch_and_save_to_json
+from integrations.countries_processor import process_countries_json_and_save_to_db
+from integrations.venues_processor import process_venues_json_and_save_to_db
+from integrations.league_processor import process_league_json_and_save_to_db
+from integrations.teams_processor import process_teams_json_and_save_to_db
+from integrations.league_teams_processor import link_teams_to_league_and_venues
+from integrations.fixtures_processor import process_fixtures_json_and_save_to_db
+from integrations.fixture_statistics import ingest_fixture_statistics
+from integrations.fixture_players import ingest_fixture_players
+from integrations.profiles_processor import (
+    process_players_json_and_save_to_db,
+    ingest_league_coaches,
+)
+
+STATE_FILE = os.path.join("json", ".pipeline_state.json")
+
+RAN = "ran"
+SKIPPED = "skipped"
+FAILED = "failed"
+BLOCKED = "blocked"
+
+
+class Stage:
+    """
+    Etapa do pipeline: baixa (opcionalmente) um arquivo da API e o processa.
+
+    A etapa só roda depois de todas as etapas em `depends_on`. O processamento
+    é pulado quando o hash do arquivo de entrada é igual ao da última execução
+    bem-sucedida e nenhuma dependência foi reprocessada. Etapas sem arquivo
+    (`process()` sem argumentos) sempre rodam e decidem sozinhas o que pular.
+    """
+
+    def __init__(self, name, process, file_name=None, depends_on=(), fetch=None):
+        self.name = name
+        self.process = process
+        self.depends_on = tuple(depends_on)
+        self.fetch = fetch  # (endpoint, params) ou None
+        # Sem nome explícito, a etapa lê o payload do cache da API
+        if file_name is None and fetch is not None:
+            file_name = cache_file_name(*fetch)
+        self.file_name = file_name
+
+
+def reported_failures(result) -> int:
+    """
+    Falhas que uma tarefa registrou no relatório em vez de levantar: o
+    campo `failed` e os contadores `<tipo>_failed` (linhas que não foram
+    gravadas). Retornos que não são relatórios não têm falhas.
+    """
+    if not isinstance(result, dict):
+        return 0
+    return sum(
+        value
+        for key, value in result.items()
+        if (key == "failed" or key.endswith("_failed")) and isinstance(value, int)
+    )
+
+
+def _file_sha256(file_path: str):
+    if not os.path.exists(file_path):
+        return None
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as input_file:
+        for block in iter(lambda: input_file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _load_state() -> dict:
+    try:
+        with open(STATE_FILE, "r") as state_file:
+            return json.load(state_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_state(state: dict):
+    with open(STATE_FILE, "w") as state_file:
+        json.dump(state, state_file, indent=4)
+
+
+async def run_pipeline(stages: list, force: bool = False) -> dict:
+    """
+    Executa as etapas respeitando as dependências; etapas independentes rodam
+    em paralelo. Retorna um relatório por etapa (status, duração, resultado).
+    """
+    stages_by_name = {stage.name: stage for stage in stages}
+    for stage in stages:
+        for dependency in stage.depends_on:
+            if dependency not in stages_by_name:
+                raise ValueError(
+                    f"Etapa '{stage.name}' depende de '{dependency}', que não existe"
+                )
+
+    state = _load_state()
+    updated_state = {}
+    report = {}
+    tasks = {}
+
+    async def run_stage(stage: Stage):
+        dependencies = [await tasks[name] for name in stage.depends_on]
+        if any(status in (FAILED, BLOCKED) for status in dependencies):
+            report[stage.name] = {"status": BLOCKED}
+            return BLOCKED
+
+        start = time.perf_counter()
+        state_key, result = None, None
+        try:
+            if stage.file_name is None:
+                result = await stage.process()
+            else:
+                if stage.fetch is not None:
+                    endpoint, params = stage.fetch
+                    fetched = await fetch_and_save_to_json(
+                        endpoint, params=params, priority=BACKFILL
+                    )
+                    # Sem download, o arquivo em disco pode ser de outra execução
+                    if fetched is None:
+                        raise RuntimeError(f"Falha ao baixar {endpoint}")
+
+                file_hash = await asyncio.to_thread(
+                    _file_sha256, os.path.join("json", stage.file_name)
+                )
+                if file_hash is None:
+                    raise FileNotFoundError(f"Arquivo {stage.file_name} não encontrado")
+
+                state_key = f"{stage.name}:{stage.file_name}"
+                unchanged = (
+                    not force
+                    and state.get(state_key) == file_hash
+                    and all(status == SKIPPED for status in dependencies)
+                )
+                if unchanged:
+                    report[stage.name] = {"status": SKIPPED}
+                    return SKIPPED
+
+                result = await stage.process(stage.file_name)
+
+            failures = reported_failures(result)
+            if failures:
+                raise RuntimeError(
+                    f"A etapa registrou {failures} falhas no relatório"
+                )
+            if state_key is not None:
+                # Só uma execução bem-sucedida permite pular o arquivo depois
+                updated_state[state_key] = file_hash
+
+            report[stage.name] = {
+                "status": RAN,
+                "result": result,
+                "duration_ms": int((time.perf_counter() - start) * 1000),
+            }
+            return RAN
+        except Exception as e:
+            print(f"Erro na etapa '{stage.name}' do pipeline: {e}")
+            if state_key is not None:
+                # Descarta o hash da última execução: a próxima não pula a etapa
+                updated_state[state_key] = None
+            report[stage.name] = {"status": FAILED, "error": str(e)}
+            if result is not None:
+                report[stage.name]["result"] = result
+            return FAILED
+
+    def schedule(name: str, path=()):
+        # Cria as tasks das dependências antes da própria etapa
+        if name in path:
+            raise ValueError(f"Ciclo de dependências no pipeline: {' -> '.join(path + (name,))}")
+        if name not in tasks:
+            for dependency in stages_by_name[name].depends_on:
+                schedule(dependency, path + (name,))
+            tasks[name] = asyncio.ensure_future(run_stage(stages_by_name[name]))
+
+    for stage in stages:
+        schedule(stage.name)
+    await asyncio.gather(*tasks.values())
+
+    # Relê o estado para não sobrescrever pipelines que rodaram em paralelo
+    state = _load_state()
+    state.update(updated_state)
+    _save_state(state)
+    return report
+
+
+def league_season_stages(league: int, season: int, country: str) -> list:
+    """
+    Grafo de onboarding de uma liga-temporada:
+    countries -> (venues, teams, league) -> league_teams -> fixtures -> statistics.
+    """
+    league_params = {"league": league, "season": season}
+    teams_fetch = ("/teams", league_params)
+
+    async def link_league_teams(file_name):
+        return await link_teams_to_league_and_venues(file_name, league, season)
+
+    async def upsert_fixtures(file_name):
+        return await process_fixtures_json_and_save_to_db(file_name, upsert=True)
+
+    async def fixture_statistics():
+        return await ingest_fixture_statistics(league, season)
+
+    async def league_coaches():
+        return await ingest_league_coaches(league, season)
+
+    async def fixture_players():
+        return await ingest_fixture_players(league, season)
+
+    return [
+        Stage(
+            "countries",
+            process_countries_json_and_save_to_db,
+            fetch=("/countries", None),
+        ),
+        Stage(
+            "venues",
+            process_venues_json_and_save_to_db,
+            depends_on=["countries"],
+            fetch=("/venues", {"country": country}),
+        ),
+        Stage(
+            "teams",
+            process_teams_json_and_save_to_db,
+            depends_on=["countries"],
+            fetch=teams_fetch,
+        ),
+        Stage(
+            "league",
+            process_league_json_and_save_to_db,
+            depends_on=["countries"],
+            fetch=("/leagues", {"id": league, "season": season}),
+        ),
+        Stage(
+            "league_teams",
+            link_league_teams,
+            cache_file_name(*teams_fetch),
+            depends_on=["venues", "teams", "league"],
+        ),
+        Stage(
+            "fixtures",
+            upsert_fixtures,
+            depends_on=["league_teams"],
+            fetch=("/fixtures", league_params),
+        ),
+        Stage("statistics", fixture_statistics, depends_on=["fixtures"]),
+        Stage(
+            "player_profiles",
+            process_players_json_and_save_to_db,
+            depends_on=["countries"],
+            fetch=("/players", league_params),
+        ),
+        Stage("coaches", league_coaches, depends_on=["countries", "league_teams"]),
+        # Estatísticas e escalações só gravam jogadores e técnicos já cadastrados
+        Stage(
+            "players",
+            fixture_players,
+            depends_on=["fixtures", "player_profiles", "coaches"],
+        ),
+    ]
+
+
+async def ingest_league_season(
+    league: int, season: int, country: str, force: bool = False
+) -> dict:
+    """Executa o pipeline completo de uma liga-temporada."""
+    return await run_pipeline(league_season_stages(league, season, country), force)
@@ -0,0 +1,299 @@
+import asyncio
+import hashlib
+import json
+import os
+from collections import Counter
+from config import INGEST_CHUNK_SIZE
+from database.database import async_session_factory
+from datetime import date, datetime, timezone
+from integrations.json_stream import (
+    iter_response_chunks,
+    UnexpectedPayloadError,
+)
+from integrations.rate_limiter import BACKFILL, QuotaExhaustedError
+from integrations.reference_cache import country_cache
+from integrations.save_json import fetch_and_save_to_json
+from models.base_coach import Coach
+from models.base_player import BasePlayer
+from models.league import League
+from models.league_team import LeagueTeam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.future import select
+
+REPORT_KEYS = ("inserted", "updated", "unchanged", "skipped", "failed")
+
+
+def _parse_birth_date(value):
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def content_hash(profile: dict) -> str:
+    """
+    Hash estável do perfil (já com os ids de país resolvidos), usado para
+    pular perfis que não mudaram desde a última gravação.
+    """
+    canonical = json.dumps(profile, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+async def _resolve_country(session, country_name):
+    if not country_name:
+        return None
+    return await country_cache.get_id(session, country_name)
+
+
+async def _parse_player(session, item: dict):
+    """Perfil de BasePlayer a partir de um item de /players, ou None."""
+    player = item.get("player") or {}
+    if player.get("id") is None or not player.get("name"):
+        return None
+    birth = player.get("birth") or {}
+    return {
+        "api_id": player["id"],
+        "name": player["name"],
+        # firstname é NOT NULL, mas a API às vezes o traz vazio
+        "firstname": player.get("firstname") or player["name"],
+        "lastname": player.get("lastname"),
+        "age": player.get("age"),
+        "birth_date": _parse_birth_date(birth.get("date")),
+        "birth_place": birth.get("place"),
+        "birth_country_id": await _resolve_country(session, birth.get("country")),
+        "nationality_id": await _resolve_country(session, player.get("nationality")),
+        "height": player.get("height"),
+        "weight": player.get("weight"),
+        "injured": player.get("injured"),
+        "photo_url": player.get("photo"),
+    }
+
+
+async def _parse_coach(session, item: dict):
+    """Perfil de Coach a partir de um item de /coachs, ou None."""
+    if item.get("id") is None or not item.get("name"):
+        return None
+    birth = item.get("birth") or {}
+    return {
+        "api_id": item["id"],
+        "name": item["name"],
+        "first_name": item.get("firstname") or item["name"],
+        "last_name": item.get("lastname"),
+        "age": item.get("age"),
+        "birth_date": _parse_birth_date(birth.get("date")),
+        "birth_place": birth.get("place"),
+        "birth_country_id": await _resolve_country(session, birth.get("country")),
+        "nationality_id": await _resolve_country(session, item.get("nationality")),
+        "height": item.get("height"),
+        "weight": item.get("weight"),
+        "photo_url": item.get("photo"),
+    }
+
+
+async def _save_profiles_chunk(session, model, profiles: list, seen: dict, report):
+    """
+    Grava os perfis novos ou alterados de um bloco.
+
+    Os api_ids do bloco são resolvidos numa única consulta `IN (...)` que
+    traz o content_hash gravado; perfis com o mesmo hash (no banco ou já
+    vistos nesta execução, em `seen`) são pulados e os demais vão num único
+    INSERT ... ON CONFLICT DO UPDATE.
+    """
+    # Um mesmo api_id pode aparecer mais de uma vez no bloco: vale o último
+    by_id = {}
+    for profile in profiles:
+        profile["content_hash"] = content_hash(profile)
+        by_id[profile["api_id"]] = profile
+
+    pending = {}
+    for api_id, profile in by_id.items():
+        if seen.get(api_id) == profile["content_hash"]:
+            report["unchanged"] += 1
+        else:
+            pending[api_id] = profile
+    if not pending:
+        return
+
+    result = await session.execute(
+        select(model.api_id, model.content_hash).where(
+            model.api_id.in_(pending.keys())
+        )
+    )
+    stored = dict(result.all())
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    rows = []
+    for api_id, profile in pending.items():
+        seen[api_id] = profile["content_hash"]
+        if stored.get(api_id) == profile["content_hash"]:
+            report["unchanged"] += 1
+            continue
+        rows.append({**profile, "last_updated": now})
+    if not rows:
+        return
+
+    stmt = pg_insert(model).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[model.api_id],
+        set_={
+            column: stmt.excluded[column] for column in rows[0] if column != "api_id"
+        },
+    )
+    try:
+        await session.execute(stmt)
+        await session.commit()
+    except Exception as e:
+        # O bloco perdido conta em `failed`: o job e o pipeline tratam o
+        # relatório como falha e o arquivo é reprocessado na próxima execução
+        await session.rollback()
+        for row in rows:
+            seen.pop(row["api_id"], None)
+        report["failed"] += len(rows)
+        print(f"Erro ao gravar {len(rows)} perfis em {model.__tablename__}: {e}")
+        return
+
+    inserted = sum(1 for row in rows if row["api_id"] not in stored)
+    report["inserted"] += inserted
+    report["updated"] += len(rows) - inserted
+
+
+async def _process_profiles_file(
+    session, file_name: str, model, parse, label: str, chunk_size: int, seen, report
+):
+    file_path = os.path.join("json", file_name)
+    try:
+        async for chunk in iter_response_chunks(file_path, chunk_size):
+            profiles = []
+            for item in chunk:
+                profile = await parse(session, item)
+                if profile is None:
+                    report["skipped"] += 1
+                    continue
+                profiles.append(profile)
+            if profiles:
+                await _save_profiles_chunk(session, model, profiles, seen, report)
+    except FileNotFoundError:
+        print(f"Arquivo não encontrado: {file_path}")
+        raise
+    except json.JSONDecodeError:
+        print(f"Erro: Não foi possível decodificar o arquivo JSON {file_path}.")
+        raise
+    except UnexpectedPayloadError:
+        print(
+            f"Formato JSON inesperado para {label}: 'response' não encontrado ou não é uma lista."
+        )
+        raise
+    except Exception as e:
+        print(f"Erro ao processar os dados de {label}: {e}")
+        raise
+
+
+async def process_players_json_and_save_to_db(
+    file_name: str, chunk_size: int = INGEST_CHUNK_SIZE
+):
+    """
+    Lê um arquivo de /players e grava os perfis em base_players.
+
+    O arquivo é lido em streaming e gravado em blocos de `chunk_size`
+    jogadores; país de nascimento e nacionalidade vêm do cache de países e
+    só perfis novos ou com content_hash diferente do gravado são escritos.
+
+    Returns:
+        dict: Relatório com os perfis inseridos, atualizados, inalterados e
+            pulados e os que não foram gravados por erro no banco (`failed`).
+    """
+    report = Counter(dict.fromkeys(REPORT_KEYS, 0))
+    async with async_session_factory() as session:
+        await _process_profiles_file(
+            session,
+            file_name,
+            BasePlayer,
+            _parse_player,
+            "jogadores",
+            chunk_size,
+            {},
+            report,
+        )
+    print(
+        f"Jogadores do arquivo {file_name}: {report['inserted']} inseridos, "
+        f"{report['updated']} atualizados, {report['unchanged']} inalterados."
+    )
+    return {"file": file_name, **report}
+
+
+async def process_coaches_json_and_save_to_db(
+    file_name: str, chunk_size: int = INGEST_CHUNK_SIZE
+):
+    """
+    Lê um arquivo de /coachs e grava os perfis em base_coaches, como
+    process_players_json_and_save_to_db.
+    """
+    report = Counter(dict.fromkeys(REPORT_KEYS, 0))
+    async with async_session_factory() as session:
+        await _process_profiles_file(
+            session, file_name, Coach, _parse_coach, "técnicos", chunk_size, {}, report
+        )
+    print(
+        f"Técnicos do arquivo {file_name}: {report['inserted']} inseridos, "
+        f"{report['updated']} atualizados, {report['unchanged']} inalterados."
+    )
+    return {"file": file_name, **report}
+
+
+async def ingest_league_coaches(
+    league: int, season: int, chunk_size: int = INGEST_CHUNK_SIZE
+):
+    """
+    Baixa /coachs de cada equipe de uma liga-temporada e grava os perfis.
+
+    Um técnico que passou por várias equipes da liga aparece em vários
+    arquivos; os hashes já gravados nesta execução evitam consultá-lo e
+    gravá-lo de novo. Equipes cujo download falhou contam em `failed`; as
+    que ficaram sem download por falta de cota, em `not_fetched`.
+    """
+    report = Counter(dict.fromkeys((*REPORT_KEYS, "not_fetched"), 0))
+    seen = {}
+    async with async_session_factory() as session:
+        result = await session.execute(
+            select(LeagueTeam.base_team_api_id)
+            .join(League, League.id == LeagueTeam.league_id)
+            .where(League.api_id == league, League.season == season)
+        )
+        team_api_ids = result.scalars().all()
+
+    # Os downloads podem demorar na faixa BACKFILL: nenhuma conexão fica presa
+    file_names = await asyncio.gather(
+        *(
+            fetch_and_save_to_json(
+                "/coachs", params={"team": team_api_id}, priority=BACKFILL
+            )
+            for team_api_id in team_api_ids
+        ),
+        return_exceptions=True,
+    )
+
+    async with async_session_factory() as session:
+        for file_name in file_names:
+            if isinstance(file_name, QuotaExhaustedError):
+                report["not_fetched"] += 1
+                continue
+            if isinstance(file_name, Exception):
+                report["failed"] += 1
+                continue
+            await _process_profiles_file(
+                session,
+                file_name,
+                Coach,
+                _parse_coach,
+                "técnicos",
+                chunk_size,
+                seen,
+                report,
+            )
+    print(
+        f"Técnicos da liga {league}/{season}: {report['inserted']} inseridos, "
+        f"{report['updated']} atualizados, {report['unchanged']} inalterados."
+    )
+    return {"league": league, "season": season, "teams": len(team_api_ids), **report}
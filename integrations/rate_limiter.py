@@ -0,0 +1,242 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+import httpx
+from config import (
+    API_RATE_PER_MINUTE,
+    API_BURST,
+    API_MAX_RETRIES,
+    API_BACKOFF_BASE,
+    API_BACKOFF_MAX,
+    API_DAILY_RESERVE,
+)
+from integrations.http_client import get_http_client
+from typing import Optional
+
+DAY = 24 * 60 * 60
+
+# Prioridades (menor valor é atendido primeiro)
+LIVE = 0
+DEFAULT = 1
+BACKFILL = 2
+
+
+class QuotaExhaustedError(Exception):
+    """A cota diária restante está reservada para partidas ao vivo."""
+
+
+class RateLimitExceededError(Exception):
+    """A API continuou limitando as requisições depois de todas as tentativas."""
+
+
+class TokenBucket:
+    """Balde de tokens: `rate` tokens por segundo, acumulando até `capacity`."""
+
+    def __init__(self, rate: float, capacity: float, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._updated_at = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def time_until_available(self) -> float:
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self):
+        self._refill()
+        self.tokens -= 1
+
+    def drain(self):
+        """Zera os tokens (ex.: depois de um 429)."""
+        self._refill()
+        self.tokens = min(self.tokens, 0)
+
+
+class ApiScheduler:
+    """
+    Agenda as chamadas à API respeitando um balde de tokens com faixas de
+    prioridade: quando não há token, o próximo pedido atendido é o de menor
+    prioridade, e não o mais antigo.
+
+    O ritmo é ajustado pelos cabeçalhos de cota da api-sports
+    (`x-ratelimit-limit`/`x-ratelimit-remaining` por minuto e
+    `x-ratelimit-requests-remaining` por dia). Respostas 429, 5xx, erros de
+    rede e o erro `rateLimit` no corpo são repetidos com backoff exponencial
+    com jitter.
+
+    A cota diária restante vale só para o dia (UTC) em que foi lida: a
+    api-sports zera o contador à meia-noite UTC, e a partir daí os pedidos
+    voltam a passar até a próxima resposta informar a cota do novo dia.
+    """
+
+    def __init__(
+        self,
+        client_factory=get_http_client,
+        rate_per_minute: int = API_RATE_PER_MINUTE,
+        burst: int = API_BURST,
+        max_retries: int = API_MAX_RETRIES,
+        backoff_base: float = API_BACKOFF_BASE,
+        backoff_max: float = API_BACKOFF_MAX,
+        daily_reserve: int = API_DAILY_RESERVE,
+        clock=time.time,
+    ):
+        self._client_factory = client_factory
+        self._bucket = TokenBucket(rate_per_minute / 60, burst)
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.daily_reserve = daily_reserve
+        self.minute_remaining = None
+        self.daily_remaining = None
+        self._clock = clock
+        self._daily_observed_at = None
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._dispatcher = None
+
+    async def _acquire(self, priority: int):
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (priority, next(self._sequence), future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        await future
+
+    async def _dispatch(self):
+        while self._waiting:
+            wait = self._bucket.time_until_available()
+            if wait > 0:
+                # Reavalia o topo da fila depois da espera: um pedido mais
+                # prioritário pode ter chegado nesse meio tempo
+                await asyncio.sleep(wait)
+                continue
+            _, _, future = heapq.heappop(self._waiting)
+            if future.done():
+                continue
+            self._bucket.take()
+            future.set_result(None)
+
+    def _update_from_headers(self, headers):
+        minute_limit = headers.get("x-ratelimit-limit")
+        minute_remaining = headers.get("x-ratelimit-remaining")
+        daily_remaining = headers.get("x-ratelimit-requests-remaining")
+
+        if minute_limit and minute_limit.isdigit() and int(minute_limit) > 0:
+            self._bucket.rate = int(minute_limit) / 60
+            self._bucket.capacity = min(self.burst, int(minute_limit))
+        if minute_remaining and minute_remaining.isdigit():
+            self.minute_remaining = int(minute_remaining)
+            if self.minute_remaining == 0:
+                self._bucket.drain()
+        if daily_remaining and daily_remaining.isdigit():
+            self.daily_remaining = int(daily_remaining)
+            self._daily_observed_at = self._clock()
+
+    def current_daily_remaining(self) -> Optional[int]:
+        """Cota diária lida hoje (UTC), ou None se ainda não há leitura do dia."""
+        if self.daily_remaining is None:
+            return None
+        if self._clock() // DAY != self._daily_observed_at // DAY:
+            # O contador da API foi zerado desde a última leitura
+            self.daily_remaining = None
+            self._daily_observed_at = None
+        return self.daily_remaining
+
+    def _backoff(self, attempt: int) -> float:
+        # "Full jitter": espera aleatória entre 0 e o teto exponencial
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * (2**attempt))
+        )
+
+    async def get_json(
+        self, endpoint: str, params: Optional[dict] = None, priority: int = DEFAULT
+    ) -> dict:
+        """Faz um GET na API respeitando a cota e devolve o corpo em JSON."""
+        _, data = await self.request(endpoint, params=params, priority=priority)
+        return data
+
+    async def request(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        priority: int = DEFAULT,
+        headers: Optional[dict] = None,
+    ):
+        """
+        Faz um GET na API respeitando a cota.
+
+        Returns:
+            tuple: (resposta httpx, corpo em JSON). O corpo é None quando a
+            API responde 304 a uma requisição condicional.
+        """
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            daily_remaining = self.current_daily_remaining()
+            if (
+                priority != LIVE
+                and daily_remaining is not None
+                and daily_remaining <= self.daily_reserve
+            ):
+                raise QuotaExhaustedError(
+                    f"Cota diária restante ({daily_remaining}) reservada para partidas ao vivo"
+                )
+
+            await self._acquire(priority)
+
+            try:
+                response = await self._client_factory().get(
+                    endpoint, params=params, headers=headers
+                )
+            except httpx.TransportError as e:
+                last_error = e
+            else:
+                self._update_from_headers(response.headers)
+
+                if response.status_code == 429:
+                    self._bucket.drain()
+                    last_error = RateLimitExceededError(
+                        f"429 recebido para {endpoint}"
+                    )
+                elif response.status_code >= 500:
+                    last_error = httpx.HTTPStatusError(
+                        f"Erro {response.status_code} para {endpoint}",
+                        request=response.request,
+                        response=response,
+                    )
+                elif response.status_code == 304:
+                    return response, None
+                else:
+                    response.raise_for_status()
+                    data = response.json()
+                    errors = data.get("errors") if isinstance(data, dict) else None
+                    # A api-sports responde 200 com errors.rateLimit quando limita
+                    if isinstance(errors, dict) and "rateLimit" in errors:
+                        self._bucket.drain()
+                        last_error = RateLimitExceededError(errors["rateLimit"])
+                    else:
+                        return response, data
+
+            if attempt < self.max_retries:
+                delay = self._backoff(attempt)
+                print(
+                    f"Tentativa {attempt + 1} para {endpoint} falhou ({last_error}). Nova tentativa em {delay:.1f}s."
+                )
+                await asyncio.sleep(delay)
+
+        raise last_error
+
+
+api_scheduler = ApiScheduler()
@@ -0,0 +1,52 @@
+import asyncio
+import time
+from config import COUNTRY_CACHE_TTL
+from database.database import async_session_factory
+from models.country import Country
+from sqlalchemy.future import select
+from typing import Optional
+
+
+class CountryCache:
+    """
+    Cache em memória nome -> id da tabela countries, compartilhado pelos
+    processadores. A tabela inteira é carregada numa única consulta e
+    recarregada quando o TTL expira ou quando `invalidate()` é chamado.
+    """
+
+    def __init__(self, ttl_seconds: int = COUNTRY_CACHE_TTL):
+        self.ttl_seconds = ttl_seconds
+        self._ids_by_name = {}
+        self._loaded_at = None
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+
+    async def refresh(self, session=None):
+        """Recarrega todos os países do banco de dados."""
+        async with self._lock:
+            if session is None:
+                async with async_session_factory() as own_session:
+                    result = await own_session.execute(select(Country.id, Country.name))
+            else:
+                result = await session.execute(select(Country.id, Country.name))
+            self._ids_by_name = {name: country_id for country_id, name in result}
+            self._loaded_at = time.monotonic()
+        print(f"Cache de países carregado com {len(self._ids_by_name)} países.")
+
+    def invalidate(self):
+        """Força a recarga na próxima consulta (ex.: após inserir países)."""
+        self._loaded_at = None
+
+    async def get_id(self, session, country_name: str) -> Optional[int]:
+        """Retorna o id do país pelo nome, ou None se ele não existir."""
+        if not self._is_fresh():
+            await self.refresh(session)
+        return self._ids_by_name.get(country_name)
+
+
+country_cache = CountryCache()
@@ -1,34 +1,128 @@
-import requests
-import json
+import asyncio
+import httpx
 import os
-from config import API_HOST, HEADERS
+import shutil
+from config import API_PAGE_CONCURRENCY
+from integrations.payload_cache import payload_cache
+from integrations.rate_limiter import (
+    api_scheduler,
+    DEFAULT,
+    QuotaExhaustedError,
+    RateLimitExceededError,
+)
 from typing import Optional
 
 
-def fetch_and_save_to_json(endpoint: str, filename: str, params: Optional[dict] = None):
-    url = f"https://{API_HOST}{endpoint}"
-    json_dir = "json"
+async def fetch_all_pages(
+    endpoint: str,
+    params: Optional[dict] = None,
+    priority: int = DEFAULT,
+    concurrency: int = API_PAGE_CONCURRENCY,
+) -> dict:
+    """
+    Busca a primeira página, lê `paging.total` e busca as demais páginas em
+    paralelo (limitadas por `concurrency` e pela cota da API), juntando
+    todos os itens num único `response`.
+    """
+    first_page = await api_scheduler.get_json(endpoint, params=params, priority=priority)
+    return await _fetch_remaining_pages(
+        endpoint, params, priority, first_page, concurrency
+    )
 
-    if not os.path.exists(json_dir):
-        os.makedirs(json_dir)
 
-    file_path = os.path.join(json_dir, filename)
+async def _fetch_remaining_pages(
+    endpoint: str, params: Optional[dict], priority: int, first_page: dict, concurrency: int
+) -> dict:
+    params = dict(params or {})
+    paging = first_page.get("paging") or {}
+    total_pages = paging.get("total") or 1
+    if total_pages <= 1 or not isinstance(first_page.get("response"), list):
+        return first_page
 
-    if os.path.exists(file_path):
-        print(f"Arquivo {file_path} já existe. Pulando chamada da API para {endpoint}.")
-        return
+    semaphore = asyncio.Semaphore(concurrency)
 
-    try:
-        response = requests.get(url, headers=HEADERS, params=params)
-        response.raise_for_status()
+    async def fetch_page(page: int):
+        async with semaphore:
+            data = await api_scheduler.get_json(
+                endpoint, params={**params, "page": page}, priority=priority
+            )
+            return data.get("response") or []
+
+    pages = await asyncio.gather(
+        *(fetch_page(page) for page in range(2, total_pages + 1))
+    )
+
+    merged = dict(first_page)
+    merged["response"] = list(first_page["response"])
+    for page_items in pages:
+        merged["response"].extend(page_items)
+    merged["results"] = len(merged["response"])
+    merged["paging"] = {"current": total_pages, "total": total_pages}
+    print(f"{total_pages} páginas de {endpoint} unidas em um único arquivo.")
+    return merged
+
+
+async def fetch_and_save_to_json(
+    endpoint: str,
+    filename: Optional[str] = None,
+    params: Optional[dict] = None,
+    priority: int = DEFAULT,
+    max_age: Optional[int] = None,
+):
+    """
+    Garante no cache de payloads uma resposta válida de `endpoint` com
+    `params` e devolve o nome do arquivo (relativo à pasta json/).
 
-        data = response.json()
+    Respostas dentro da validade (ver payload_cache.ENDPOINT_TTLS, ou
+    `max_age` em segundos) são servidas do disco; as vencidas são
+    revalidadas ou baixadas de novo. Se `filename` for informado, uma cópia
+    do payload também é gravada em json/<filename>.
 
-        with open(file_path, "w") as json_file:
-            json.dump(data, json_file, indent=4)
+    Returns:
+        str: O nome do arquivo do payload.
+
+    Raises:
+        Exception: O erro do download (HTTP, cota esgotada etc.), depois de
+            registrado, para que o job ou a etapa do pipeline falhe.
+    """
+
+    async def download(validators: dict):
+        # As chamadas passam pelo agendador que respeita a cota da API
+        response, first_page = await api_scheduler.request(
+            endpoint, params=params, priority=priority, headers=validators or None
+        )
+        if first_page is None:
+            return None, {}
+        data = await _fetch_remaining_pages(
+            endpoint, params, priority, first_page, API_PAGE_CONCURRENCY
+        )
+        if data is not first_page:
+            # O ETag da primeira página não valida as demais
+            return data, {}
+        return data, {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+        }
+
+    try:
+        cached_file = await payload_cache.get(endpoint, params, download, max_age)
+        print(f"Payload de {endpoint} disponível em: json/{cached_file}")
 
-        print(f"Dados salvos com sucesso de {endpoint} em: {file_path}")
-    except requests.exceptions.RequestException as e:
+        if filename is not None:
+            # A cópia em disco roda numa thread para não bloquear o event loop
+            await asyncio.to_thread(
+                shutil.copyfile,
+                os.path.join("json", cached_file),
+                os.path.join("json", filename),
+            )
+            print(f"Dados salvos com sucesso de {endpoint} em: json/{filename}")
+        return cached_file
+    except (httpx.HTTPError, RateLimitExceededError) as e:
         print(f"Erro na solicitação para {endpoint} com parâmetros {params}: {e}")
+        raise
+    except QuotaExhaustedError as e:
+        print(f"Cota da API esgotada para {endpoint}: {e}")
+        raise
     except Exception as e:
         print(f"Erro ao processar os dados de {endpoint}: {e}")
+        raise
@@ -0,0 +1,278 @@
+from database.database import async_session_factory
+from datetime import datetime, timezone
+from decimal import Decimal, ROUND_HALF_UP
+from integrations.leaderboards import leaderboard_refresher
+from models.fixture import Fixture
+from models.fixture_player_stat import FixturePlayerStat
+from models.league_team import LeagueTeam
+from models.player_season_stat import PlayerSeasonStat
+from sqlalchemy import and_, case, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.future import select
+
+# Contadores de FixturePlayerStat somados com o mesmo nome em PlayerSeasonStat
+SUMMED_COLUMNS = (
+    "shots_total",
+    "shots_on",
+    "goals",
+    "goals_conceded",
+    "assists",
+    "goals_saves",
+    "passes_total",
+    "passes_key",
+    "tackles_total",
+    "tackles_blocks",
+    "tackles_interceptions",
+    "duels_total",
+    "duels_won",
+    "dribbles_attempts",
+    "dribbles_success",
+    "dribbles_completed",
+    "fouls_drawn",
+    "fouls_committed",
+    "cards_yellow",
+    "cards_red",
+    "penalty_won",
+    "penalty_commited",
+    "penalty_scored",
+    "penalty_missed",
+    "penalty_saved",
+)
+
+
+def _count(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+def _played():
+    return func.coalesce(FixturePlayerStat.game_minute, 0) > 0
+
+
+# Coluna de PlayerSeasonStat -> agregado sobre as linhas de FixturePlayerStat.
+# As mesmas expressões calculam os deltas por partida e a reconstrução
+# completa, então as duas não divergem. A nota da temporada é a média
+# rating_sum / rated_appearances, que pode ser mantida por soma.
+SEASON_AGGREGATES = {
+    "appearances": _count(_played()),
+    "lineups": _count(FixturePlayerStat.is_starter.is_(True)),
+    "substitute_in": _count(and_(FixturePlayerStat.is_starter.is_(False), _played())),
+    "substitutes_bench": _count(
+        and_(FixturePlayerStat.is_starter.is_(False), ~_played())
+    ),
+    "clean_sheets": _count(
+        and_(
+            FixturePlayerStat.position == "G",
+            _played(),
+            func.coalesce(FixturePlayerStat.goals_conceded, 0) == 0,
+        )
+    ),
+    "minutes": func.sum(func.coalesce(FixturePlayerStat.game_minute, 0)),
+    "rated_appearances": func.count(FixturePlayerStat.game_position),
+    "rating_sum": func.coalesce(func.sum(FixturePlayerStat.game_position), 0),
+    **{
+        column: func.sum(func.coalesce(getattr(FixturePlayerStat, column), 0))
+        for column in SUMMED_COLUMNS
+    },
+}
+
+SEASON_KEY_COLUMNS = ("base_player_api_id", "league_team_id")
+
+
+def _aggregate_query():
+    return select(
+        FixturePlayerStat.base_player_api_id,
+        FixturePlayerStat.league_team_id,
+        *(expression.label(column) for column, expression in SEASON_AGGREGATES.items()),
+    ).group_by(FixturePlayerStat.base_player_api_id, FixturePlayerStat.league_team_id)
+
+
+def _totals(result) -> dict:
+    totals = {}
+    for row in result.mappings():
+        key = (row["base_player_api_id"], row["league_team_id"])
+        totals[key] = {
+            column: Decimal(str(row[column])) if column == "rating_sum" else row[column]
+            for column in SEASON_AGGREGATES
+        }
+    return totals
+
+
+def season_rating(rating_sum, rated_appearances):
+    """Média das notas, no formato de PlayerSeasonStat.rating (DECIMAL(3, 2))."""
+    if not rated_appearances:
+        return None
+    # Arredonda como o Postgres ao gravar numa coluna numeric(3, 2)
+    average = Decimal(rating_sum) / rated_appearances
+    return average.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+async def fixture_totals(session, fixture_ids: set, lock: bool = False) -> dict:
+    """
+    Agregados de temporada restritos às partidas `fixture_ids`, por
+    (base_player_api_id, league_team_id).
+
+    Com `lock`, as partidas são bloqueadas (SELECT ... FOR UPDATE) até o fim
+    da transação, para que duas gravações das mesmas partidas não calculem
+    deltas a partir do mesmo estado.
+    """
+    if not fixture_ids:
+        return {}
+    if lock:
+        await session.execute(
+            select(Fixture.api_id)
+            .where(Fixture.api_id.in_(fixture_ids))
+            # Ordem fixa: duas gravações com partidas em comum não se travam
+            .order_by(Fixture.api_id)
+            .with_for_update()
+        )
+    result = await session.execute(
+        _aggregate_query().where(FixturePlayerStat.fixture_id.in_(fixture_ids))
+    )
+    return _totals(result)
+
+
+def season_deltas(before: dict, after: dict) -> list:
+    """
+    Diferença coluna a coluna entre os agregados depois e antes de gravar um
+    lote. Regravar as mesmas estatísticas gera delta zero, que é descartado.
+    """
+    deltas = []
+    for key in before.keys() | after.keys():
+        old, new = before.get(key, {}), after.get(key, {})
+        delta = {
+            column: (new.get(column) or 0) - (old.get(column) or 0)
+            for column in SEASON_AGGREGATES
+        }
+        if any(delta.values()):
+            deltas.append(dict(zip(SEASON_KEY_COLUMNS, key), **delta))
+    return deltas
+
+
+async def apply_season_deltas(session, deltas: list) -> set:
+    """
+    Soma os deltas em players_season_stats num único INSERT ... ON CONFLICT
+    DO UPDATE e recalcula a nota média. Não faz commit: roda na transação de
+    quem gravou as estatísticas por partida.
+
+    Returns:
+        set: league_team_ids cujos agregados mudaram.
+    """
+    if not deltas:
+        return set()
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    values = [
+        {
+            **delta,
+            "rating": season_rating(delta["rating_sum"], delta["rated_appearances"]),
+            "last_updated": now,
+        }
+        for delta in deltas
+    ]
+    table = PlayerSeasonStat.__table__
+    stmt = pg_insert(PlayerSeasonStat)
+    set_ = {
+        column: func.coalesce(table.c[column], 0) + stmt.excluded[column]
+        for column in SEASON_AGGREGATES
+    }
+    set_["rating"] = set_["rating_sum"] / func.nullif(set_["rated_appearances"], 0)
+    set_["last_updated"] = stmt.excluded.last_updated
+    await session.execute(
+        stmt.on_conflict_do_update(index_elements=list(SEASON_KEY_COLUMNS), set_=set_),
+        values,
+    )
+    return {delta["league_team_id"] for delta in deltas}
+
+
+def _matches(current, totals: dict, rating) -> bool:
+    return current["rating"] == rating and all(
+        (current[column] or 0) == totals[column] for column in SEASON_AGGREGATES
+    )
+
+
+async def rebuild_player_season_stats(league_id: int, dry_run: bool = False):
+    """
+    Recalcula do zero os agregados de temporada das equipes de uma liga com
+    um GROUP BY sobre fixture_player_stats e os compara com os mantidos
+    pelos deltas.
+
+    Linhas de players_season_stats sem nenhuma estatística por partida têm
+    os agregados zerados. Com `dry_run` nada é gravado: o relatório só diz
+    quantas linhas divergem.
+
+    Returns:
+        dict: Relatório com as linhas recalculadas e as divergentes.
+    """
+    async with async_session_factory() as session:
+        result = await session.execute(
+            select(LeagueTeam.id).where(LeagueTeam.league_id == league_id)
+        )
+        league_team_ids = set(result.scalars())
+
+        result = await session.execute(
+            _aggregate_query().where(
+                FixturePlayerStat.league_team_id.in_(league_team_ids)
+            )
+        )
+        rebuilt = _totals(result)
+
+        result = await session.execute(
+            select(
+                *(getattr(PlayerSeasonStat, column) for column in SEASON_KEY_COLUMNS),
+                *(getattr(PlayerSeasonStat, column) for column in SEASON_AGGREGATES),
+                PlayerSeasonStat.rating,
+            ).where(PlayerSeasonStat.league_team_id.in_(league_team_ids))
+        )
+        stored = {
+            (row["base_player_api_id"], row["league_team_id"]): row
+            for row in result.mappings()
+        }
+
+        zero = dict.fromkeys(SEASON_AGGREGATES, 0)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        values, drifted = [], 0
+        for key in rebuilt.keys() | stored.keys():
+            totals = rebuilt.get(key, zero)
+            rating = season_rating(totals["rating_sum"], totals["rated_appearances"])
+            current = stored.get(key)
+            if current is not None:
+                if _matches(current, totals, rating):
+                    continue
+                drifted += 1
+            values.append(
+                {
+                    **dict(zip(SEASON_KEY_COLUMNS, key)),
+                    **totals,
+                    "rating": rating,
+                    "last_updated": now,
+                }
+            )
+
+        if values and not dry_run:
+            stmt = pg_insert(PlayerSeasonStat)
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=list(SEASON_KEY_COLUMNS),
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in values[0]
+                        if column not in SEASON_KEY_COLUMNS
+                    },
+                ),
+                values,
+            )
+            await session.commit()
+            leaderboard_refresher.mark_leagues([league_id])
+
+    report = {
+        "league_id": league_id,
+        "rows": len(rebuilt),
+        "drifted": drifted,
+        "written": 0 if dry_run else len(values),
+        "dry_run": dry_run,
+    }
+    print(
+        f"Estatísticas de temporada da liga {league_id}: {report['rows']} linhas "
+        f"recalculadas, {drifted} divergentes, {report['written']} gravadas."
+    )
+    return report
@@ -0,0 +1,204 @@
+from collections import defaultdict
+from database.database import async_session_factory
+from datetime import datetime, timezone
+from models.fixture import Fixture
+from models.league_classification import LeagueClassification
+from models.league_team import LeagueTeam
+from sqlalchemy import or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.future import select
+from utils.feed_cache import feed_cache
+
+# Status curtos da API de partidas encerradas (tempo normal, prorrogação, pênaltis)
+FINISHED_STATUSES = ("FT", "AET", "PEN")
+FORM_LENGTH = 5
+
+_SCOPES = ("all", "home", "away")
+_COUNTERS = ("played", "win", "draw", "lose", "goals_for", "goals_against")
+
+
+def _empty_row() -> dict:
+    row = {f"{scope}_{counter}": 0 for scope in _SCOPES for counter in _COUNTERS}
+    row["results"] = []
+    return row
+
+
+def _add_result(row: dict, scope: str, goals_for: int, goals_against: int):
+    for prefix in ("all", scope):
+        row[f"{prefix}_played"] += 1
+        row[f"{prefix}_goals_for"] += goals_for
+        row[f"{prefix}_goals_against"] += goals_against
+        if goals_for > goals_against:
+            row[f"{prefix}_win"] += 1
+        elif goals_for == goals_against:
+            row[f"{prefix}_draw"] += 1
+        else:
+            row[f"{prefix}_lose"] += 1
+
+
+def compute_team_rows(fixtures, league_team_ids: set) -> dict:
+    """
+    Soma os resultados das partidas encerradas para cada equipe de
+    `league_team_ids`.
+
+    Args:
+        fixtures: Partidas como tuplas (home_team_id, away_team_id,
+            gols do mandante, gols do visitante), em ordem cronológica.
+
+    Returns:
+        dict: league_team_id -> colunas de LeagueClassification (sem rank).
+    """
+    rows = {league_team_id: _empty_row() for league_team_id in league_team_ids}
+
+    for home_team_id, away_team_id, home_goals, away_goals in fixtures:
+        if home_goals is None or away_goals is None:
+            continue
+        for team_id, scope, goals_for, goals_against in (
+            (home_team_id, "home", home_goals, away_goals),
+            (away_team_id, "away", away_goals, home_goals),
+        ):
+            if team_id not in rows:
+                continue
+            _add_result(rows[team_id], scope, goals_for, goals_against)
+            if goals_for > goals_against:
+                rows[team_id]["results"].append("W")
+            elif goals_for == goals_against:
+                rows[team_id]["results"].append("D")
+            else:
+                rows[team_id]["results"].append("L")
+
+    for row in rows.values():
+        row["points"] = 3 * row["all_win"] + row["all_draw"]
+        row["goals_difference"] = row["all_goals_for"] - row["all_goals_against"]
+        # Últimos resultados, o mais recente no fim
+        row["form"] = "".join(row.pop("results")[-FORM_LENGTH:]) or None
+    return rows
+
+
+def rank_key(row) -> tuple:
+    """Critério de desempate: pontos, saldo, gols pró e, por fim, o id da equipe."""
+    return (
+        -(row.points or 0),
+        -(row.goals_difference or 0),
+        -(row.all_goals_for or 0),
+        row.base_team_api_id,
+    )
+
+
+async def refresh_standings(session, league_id: int, league_team_ids: set):
+    """
+    Recalcula a classificação apenas das equipes em `league_team_ids` e
+    reordena a tabela da liga. Não faz commit: roda na transação de quem
+    gravou as partidas.
+
+    Cada equipe é recalculada a partir das suas partidas encerradas (lidas
+    pelos índices de equipe + data), então reprocessar o mesmo arquivo não
+    conta um resultado duas vezes.
+    """
+    if not league_team_ids:
+        return
+
+    result_teams = await session.execute(
+        select(LeagueTeam.id, LeagueTeam.base_team_api_id).where(
+            LeagueTeam.id.in_(league_team_ids)
+        )
+    )
+    base_team_ids = dict(result_teams.all())
+
+    result_fixtures = await session.execute(
+        select(
+            Fixture.home_team_id,
+            Fixture.away_team_id,
+            Fixture.home_team_score_goals,
+            Fixture.away_team_score_goals,
+        )
+        .where(
+            or_(
+                Fixture.home_team_id.in_(league_team_ids),
+                Fixture.away_team_id.in_(league_team_ids),
+            ),
+            Fixture.status_short.in_(FINISHED_STATUSES),
+        )
+        .order_by(Fixture.date, Fixture.api_id)
+    )
+    team_rows = compute_team_rows(result_fixtures.all(), set(base_team_ids))
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    values = [
+        {
+            **row,
+            "league_id": league_id,
+            "base_team_api_id": base_team_ids[league_team_id],
+            "last_updated": now,
+        }
+        for league_team_id, row in team_rows.items()
+    ]
+    stmt = pg_insert(LeagueClassification)
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[
+                LeagueClassification.league_id,
+                LeagueClassification.base_team_api_id,
+            ],
+            set_={
+                column: stmt.excluded[column]
+                for column in values[0]
+                if column not in ("league_id", "base_team_api_id")
+            },
+        ),
+        values,
+    )
+    await _rerank(session, league_id)
+
+
+async def _rerank(session, league_id: int):
+    """Regrava o rank apenas das linhas da liga cuja posição mudou."""
+    result = await session.execute(
+        select(
+            LeagueClassification.id,
+            LeagueClassification.rank,
+            LeagueClassification.points,
+            LeagueClassification.goals_difference,
+            LeagueClassification.all_goals_for,
+            LeagueClassification.base_team_api_id,
+        ).where(LeagueClassification.league_id == league_id)
+    )
+    changes = [
+        {"id": row.id, "rank": position}
+        for position, row in enumerate(sorted(result.all(), key=rank_key), start=1)
+        if row.rank != position
+    ]
+    if changes:
+        await session.execute(update(LeagueClassification), changes)
+
+
+def affected_teams(rows: list, updated_ids: set) -> dict:
+    """
+    Equipes cuja classificação precisa ser recalculada depois de gravar
+    `rows` (linhas de Fixture): as das partidas encerradas e as das partidas
+    que já existiam e foram alteradas.
+
+    Returns:
+        dict: league_id -> conjunto de league_team_ids.
+    """
+    teams = defaultdict(set)
+    for row in rows:
+        if row["status_short"] in FINISHED_STATUSES or row["api_id"] in updated_ids:
+            teams[row["league_id"]].update((row["home_team_id"], row["away_team_id"]))
+    return teams
+
+
+async def rebuild_league_standings(league_id: int):
+    """Recalcula a classificação de todas as equipes de uma liga."""
+    async with async_session_factory() as session:
+        result = await session.execute(
+            select(LeagueTeam.id).where(LeagueTeam.league_id == league_id)
+        )
+        league_team_ids = set(result.scalars())
+        await refresh_standings(session, league_id, league_team_ids)
+        await session.commit()
+    feed_cache.invalidate_leagues([league_id])
+    print(
+        f"Classificação da liga {league_id} recalculada para {len(league_team_ids)} equipes."
+    )
+    return len(league_team_ids)
@@ -1,25 +1,29 @@
 import json
 import os
-from config import API_HOST, HEADERS
+from config import API_HOST, HEADERS, INGEST_CHUNK_SIZE
 from database.database import async_session_factory
 from datetime import datetime, timezone
+from integrations.json_stream import (
+    iter_response_chunks,
+    UnexpectedPayloadError,
+)
+from integrations.reference_cache import country_cache
 from models.base_team import BaseTeam
-from models.country import Country
-from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
 
 
-async def process_teams_json_and_save_to_db(file_name):
+async def process_teams_json_and_save_to_db(
+    file_name, chunk_size: int = INGEST_CHUNK_SIZE
+):
     json_dir = "json"
     file_path = os.path.join(json_dir, file_name)
+    saved_count = 0
 
     try:
-        with open(file_path, "r") as json_file:
-            data = json.load(json_file)
-
-        if "response" in data and isinstance(data["response"], list):
-            async with async_session_factory() as session:
-                for team_data_wrapper in data["response"]:
+        async with async_session_factory() as session:
+            async for chunk in iter_response_chunks(file_path, chunk_size):
+                chunk_count = 0
+                for team_data_wrapper in chunk:
                     team_info = team_data_wrapper.get("team")
                     # venue_info = team_data_wrapper.get("venue")
 
@@ -40,11 +44,11 @@ async def process_teams_json_and_save_to_db(file_name):
                     )
 
                     if country_name:
-                        query = select(Country).where(Country.name == country_name)
-                        result = await session.execute(query)
-                        country = result.scalar_one_or_none()
+                        country_id = await country_cache.get_id(
+                            session, country_name
+                        )
 
-                        if country and team_id_from_api is not None:
+                        if country_id is not None and team_id_from_api is not None:
                             # Verificar se o time já existe para evitar duplicados
                             existing_team = await session.get(
                                 BaseTeam, team_id_from_api
@@ -61,16 +65,17 @@ async def process_teams_json_and_save_to_db(file_name):
                                     last_updated=datetime.now(timezone.utc).replace(
                                         tzinfo=None
                                     ),
-                                    country_id=country.id,
+                                    country_id=country_id,
                                 )
                                 session.add(db_team)
+                                chunk_count += 1
                                 print(f"  Time '{team_name}' agregado.")
                             else:
                                 print(
                                     f"  Time '{team_name}' (ID API: {team_id_from_api}) já existe na base de dados. Pulando para o próximo"
                                 )
 
-                        elif not country:
+                        elif country_id is None:
                             print(
                                 f"  País '{country_name}' não encontrado na base de dados para o time '{team_name}'."
                             )
@@ -83,20 +88,29 @@ async def process_teams_json_and_save_to_db(file_name):
                             f"  Nome do país não encontrado para o time equipo '{team_name}'."
                         )
 
-                await session.commit()
-                print(f"Processo de guardado dos times completado.")
+                # Commit por bloco: um erro de integridade só descarta o bloco atual
+                try:
+                    await session.commit()
+                    saved_count += chunk_count
+                except IntegrityError as e:
+                    await session.rollback()
+                    print(f"Error na integridade para guardar os times: {e}")
 
-        else:
-            print(
-                "Formato JSON inesperado para os times: 'response' não encontrado o não é uma lista."
-            )
+            print(f"Processo de guardado dos times completado.")
 
     except FileNotFoundError:
         print(f"Arquivo não encontrado: {file_path}")
+        raise
     except json.JSONDecodeError:
         print(f"Erro: Não foi possível decodificar o arquivo JSON {file_path}.")
-    except IntegrityError as e:
-        await session.rollback()
-        print(f"Error na integridade para guardar os times: {e}")
+        raise
+    except UnexpectedPayloadError:
+        print(
+            "Formato JSON inesperado para os times: 'response' não encontrado o não é uma lista."
+        )
+        raise
     except Exception as e:
         print(f"Erro ao processar os dados dos times: {e}")
+        raise
+
+    return saved_count
@@ -1,22 +1,30 @@
 import json
 import os
+from config import INGEST_CHUNK_SIZE
 from database.database import async_session_factory
 from datetime import datetime, timezone
+from integrations.json_stream import (
+    iter_response_chunks,
+    UnexpectedPayloadError,
+)
+from integrations.reference_cache import country_cache
 from models.venue import Venue
-from models.country import Country
-from sqlalchemy.future import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 
-async def process_venues_json_and_save_to_db(file_name):
+async def process_venues_json_and_save_to_db(
+    file_name, chunk_size: int = INGEST_CHUNK_SIZE
+):
     json_dir = "json"
     file_path = os.path.join(json_dir, file_name)
+    saved_count = 0
 
     try:
-        with open(file_path, "r") as json_file:
-            data = json.load(json_file)
-        if "response" in data and isinstance(data["response"], list):
-            async with async_session_factory() as session:
-                for venue_data in data["response"]:
+        async with async_session_factory() as session:
+            async for chunk in iter_response_chunks(file_path, chunk_size):
+                # Um mesmo estádio repetido no bloco: vale o último
+                rows = {}
+                for venue_data in chunk:
                     venue_id_from_api = venue_data.get("id")
                     venue_name = venue_data.get("name")
                     venue_address = venue_data.get("address")
@@ -27,26 +35,25 @@ async def process_venues_json_and_save_to_db(file_name):
                     country_name = venue_data.get("country")
 
                     if country_name:
-                        query = select(Country).where(Country.name == country_name)
-                        result = await session.execute(query)
-                        country = result.scalar_one_or_none()
+                        country_id = await country_cache.get_id(
+                            session, country_name
+                        )
 
-                        if country and venue_id_from_api is not None:
-                            venue = Venue(
-                                api_id=venue_id_from_api,
-                                name=venue_name,
-                                address=venue_address,
-                                city=venue_city,
-                                capacity=venue_capacity,
-                                surface=venue_surface,
-                                image_url=venue_image,
-                                last_updated=datetime.now(timezone.utc).replace(
+                        if country_id is not None and venue_id_from_api is not None:
+                            rows[venue_id_from_api] = {
+                                "api_id": venue_id_from_api,
+                                "name": venue_name,
+                                "address": venue_address,
+                                "city": venue_city,
+                                "capacity": venue_capacity,
+                                "surface": venue_surface,
+                                "image_url": venue_image,
+                                "last_updated": datetime.now(timezone.utc).replace(
                                     tzinfo=None
                                 ),
-                                country_id=country.id,
-                            )
-                            session.add(venue)
-                        elif not country:
+                                "country_id": country_id,
+                            }
+                        elif country_id is None:
                             print(
                                 f"  País '{country_name}' não encontrado na base de dados para o estadio '{venue_name}'."
                             )
@@ -58,16 +65,38 @@ async def process_venues_json_and_save_to_db(file_name):
                         print(
                             f"  Nome do país não encontrado para o estadio '{venue_name}'."
                         )
-                await session.commit()
-                print(
-                    f"Foram salvos {len(data['response'])} estadios na base de dados."
+
+                if not rows:
+                    continue
+
+                # Estádios já gravados são atualizados no lugar
+                stmt = pg_insert(Venue).values(list(rows.values()))
+                await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[Venue.api_id],
+                        set_={
+                            column: stmt.excluded[column]
+                            for column in next(iter(rows.values()))
+                            if column != "api_id"
+                        },
+                    )
                 )
-        else:
-            print(
-                "Formato JSON inesperado para estadios: 'response' não encontrado ou não é uma lista."
-            )
+                # Commit por bloco: a memória não cresce com o tamanho do arquivo
+                await session.commit()
+                saved_count += len(rows)
+
+        print(f"Foram salvos {saved_count} estadios na base de dados.")
 
     except FileNotFoundError:
         print(f"Arquivo não encontrado: {file_path}")
+        raise
+    except UnexpectedPayloadError:
+        print(
+            "Formato JSON inesperado para estadios: 'response' não encontrado ou não é uma lista."
+        )
+        raise
     except Exception as e:
         print(f"Erro ao processar os dados: {e}")
+        raise
+
+    return saved_count
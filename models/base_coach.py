@@ -20,6 +20,8 @@ class Coach(Base):
     weight = Column(String(10))
     photo_url = Column(String(255))
     last_updated = Column(DateTime)
+    # sha256 do perfil gravado; o processador pula perfis que não mudaram
+    content_hash = Column(String(64))
 
     birth_country = relationship(
         "Country", foreign_keys=[birth_country_id], back_populates="birth_coaches"
@@ -1,4 +1,12 @@
-from sqlalchemy import Column, Integer, DateTime, String, ForeignKey, SmallInteger
+from sqlalchemy import (
+    Column,
+    Integer,
+    DateTime,
+    String,
+    ForeignKey,
+    SmallInteger,
+    Index,
+)
 from sqlalchemy.orm import relationship
 from database.database import Base
 from models.fixture_lineup import FixtureLineup
@@ -48,3 +56,18 @@ class Fixture(Base):
     player_stats = relationship("FixturePlayerStat", back_populates="fixture")
     venue = relationship("Venue", back_populates="fixtures")
     statistics = relationship("FixtureStatistic", back_populates="fixture")
+
+    # Índices da listagem paginada por (match_DATE, api_id): o api_id no fim
+    # desempata partidas no mesmo horário sem precisar ordenar em memória
+    __table_args__ = (
+        Index("ix_fixtures_date_api_id", "match_DATE", "api_id"),
+        Index(
+            "ix_fixtures_league_season_date",
+            "league_id",
+            "season",
+            "match_DATE",
+            "api_id",
+        ),
+        Index("ix_fixtures_home_team_date", "home_team_id", "match_DATE", "api_id"),
+        Index("ix_fixtures_away_team_date", "away_team_id", "match_DATE", "api_id"),
+    )
@@ -3,7 +3,6 @@ from sqlalchemy import (
     Integer,
     ForeignKey,
     SmallInteger,
-    String,
     DateTime,
     UniqueConstraint,
 )
@@ -34,13 +33,14 @@ class FixtureStatistic(Base):
     fouls = Column(SmallInteger)
     corner_kicks = Column(SmallInteger)
     offsides = Column(SmallInteger)
-    ball_possession = Column(String(10))
+    # Percentuais guardados como número (a API envia "55%")
+    ball_possession = Column(SmallInteger)
     yellow_cards = Column(SmallInteger)
     red_cards = Column(SmallInteger)
     goalkeeper_saves = Column(SmallInteger)
     total_passes = Column(SmallInteger)
     passes_accurate = Column(SmallInteger)
-    passes_percentage = Column(String(10))
+    passes_percentage = Column(SmallInteger)
     last_updated = Column(DateTime)
 
     fixture = relationship("Fixture", back_populates="statistics")
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, JSON
+from database.database import Base
+
+
+class IngestionJob(Base):
+    __tablename__ = "ingestion_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    task = Column(String(100), nullable=False, index=True)
+    params = Column(JSON)
+    # queued, running, succeeded, failed ou interrupted
+    status = Column(String(20), nullable=False, index=True)
+    result = Column(JSON)
+    error = Column(Text)
+    created_at = Column(DateTime, nullable=False)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+    duration_ms = Column(Integer)
@@ -0,0 +1,67 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    ForeignKey,
+    SmallInteger,
+    String,
+    DateTime,
+    DECIMAL,
+    Index,
+)
+from database.database import Base
+
+# Colunas exibidas no ranking, incluídas no índice para que a leitura do
+# top-N seja um index-only scan
+LEADERBOARD_INCLUDE = (
+    "rank",
+    "base_player_api_id",
+    "league_team_id",
+    "value",
+    "appearances",
+    "minutes",
+    "player_name",
+    "player_photo_url",
+    "team_name",
+    "team_logo_url",
+    "refreshed_at",
+)
+
+
+class PlayerLeaderboard(Base):
+    """
+    Ranking pré-calculado de uma métrica (gols, assistências, ...) numa liga,
+    recalculado a partir de players_season_stats quando ela muda. Nome e
+    foto do jogador e da equipe são copiados para não precisar de joins na
+    leitura.
+    """
+
+    __tablename__ = "player_leaderboards"
+
+    id = Column(Integer, primary_key=True)
+    league_id = Column(Integer, ForeignKey("leagues.id"), nullable=False)
+    metric = Column(String(20), nullable=False)
+    position = Column(SmallInteger, nullable=False)  # ordem na lista, sem empates
+    rank = Column(SmallInteger, nullable=False)  # empatados dividem o rank
+    base_player_api_id = Column(
+        Integer, ForeignKey("base_players.api_id"), nullable=False
+    )
+    league_team_id = Column(Integer, ForeignKey("league_teams.id"), nullable=False)
+    value = Column(DECIMAL(7, 2), nullable=False)
+    appearances = Column(SmallInteger)
+    minutes = Column(SmallInteger)
+    player_name = Column(String(255))
+    player_photo_url = Column(String(255))
+    team_name = Column(String)
+    team_logo_url = Column(String(255))
+    refreshed_at = Column(DateTime)
+
+    __table_args__ = (
+        Index(
+            "ix_player_leaderboards_league_metric_position",
+            "league_id",
+            "metric",
+            "position",
+            unique=True,
+            postgresql_include=list(LEADERBOARD_INCLUDE),
+        ),
+    )
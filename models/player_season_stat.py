@@ -58,6 +58,11 @@ class PlayerSeasonStat(Base):
     penalty_scored = Column(SmallInteger)
     penalty_missed = Column(SmallInteger)
     penalty_saved = Column(SmallInteger)
+    # Soma das notas e partidas com nota: rating é a média e é mantida por deltas
+    rating_sum = Column(DECIMAL(7, 2))
+    rated_appearances = Column(SmallInteger)
+    # Partidas do goleiro sem sofrer gols
+    clean_sheets = Column(SmallInteger)
     last_updated = Column(DateTime)
 
     player = relationship("BasePlayer", back_populates="player_season_stats")
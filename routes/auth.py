@@ -2,9 +2,18 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, or_
 from models.user import User 
-from schemas import UserCreate, UserResponse, UserLogin
+from schemas import UserCreate, UserResponse, UserLogin, TokenRefresh, LogoutRequest, CurrentUserResponse
 from database.database import get_db_session
-from utils.security import hash_password, verify_password
+from utils.security import password_hasher, PasswordHasherBusyError
+from utils.tokens import (
+    REFRESH,
+    CurrentUser,
+    InvalidTokenError,
+    decode_token,
+    get_current_user,
+    issue_token_pair,
+    revocation_list,
+)
 
 router = APIRouter()
 
@@ -20,7 +29,11 @@ async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_db_sessio
     if existing_user:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Username or email already exists")
 
-    hashed_pw = hash_password(user_data.password)
+    # O bcrypt roda no pool dedicado para não travar o event loop
+    try:
+        hashed_pw = await password_hasher.hash(user_data.password)
+    except PasswordHasherBusyError:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Server busy, try again")
 
     new_user = User(
         username=user_data.username,
@@ -44,7 +57,55 @@ async def signin(user_data: UserLogin, db: AsyncSession = Depends(get_db_session
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(user_data.password, user.password):
+    try:
+        valid = user is not None and await password_hasher.verify(user_data.password, user.password)
+    except PasswordHasherBusyError:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Server busy, try again")
+
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
 
-    return {"message": f"Welcome back, {user.username}!"}
+    # Depois do login as rotas protegidas só conferem a assinatura do token
+    return {"message": f"Welcome back, {user.username}!", **issue_token_pair(user)}
+
+
+@router.post("/refresh")
+async def refresh(token_data: TokenRefresh, db: AsyncSession = Depends(get_db_session)):
+    try:
+        claims = decode_token(token_data.refresh_token, REFRESH)
+    except InvalidTokenError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired refresh token")
+
+    # Cada refresh token vale uma única vez: só o pedido que conseguiu
+    # revogá-lo recebe tokens novos, mesmo com renovações simultâneas
+    if not revocation_list.revoke(claims["jti"], claims["exp"]):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired refresh token")
+
+    # Uma consulta por renovação mantém as favoritas das claims atualizadas
+    user = await db.get(User, int(claims["sub"]))
+    if user is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired refresh token")
+
+    return issue_token_pair(user)
+
+
+@router.post("/logout")
+async def logout(logout_data: LogoutRequest = None, current_user: CurrentUser = Depends(get_current_user)):
+    revocation_list.revoke(current_user.token_id, current_user.expires_at)
+    if logout_data is not None and logout_data.refresh_token:
+        try:
+            claims = decode_token(logout_data.refresh_token, REFRESH)
+            revocation_list.revoke(claims["jti"], claims["exp"])
+        except InvalidTokenError:
+            pass
+    return {"message": "Logged out"}
+
+
+@router.get("/me", response_model=CurrentUserResponse)
+async def me(current_user: CurrentUser = Depends(get_current_user)):
+    return {
+        "id": current_user.id,
+        "username": current_user.username,
+        "favorite_team": current_user.favorite_team,
+        "favorite_leagues": sorted(current_user.favorite_leagues),
+    }
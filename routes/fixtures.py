@@ -0,0 +1,112 @@
+import base64
+from datetime import date, datetime, time
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, or_, tuple_
+from typing import Optional
+from models.fixture import Fixture
+from models.league import League
+from models.league_team import LeagueTeam
+from schemas import FixturePage
+from database.database import get_read_session
+
+router = APIRouter()
+
+
+def encode_cursor(fixture: Fixture) -> str:
+    raw = f"{fixture.date.isoformat()}|{fixture.api_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        match_date, api_id = raw.split("|")
+        return datetime.fromisoformat(match_date), int(api_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+@router.get("", response_model=FixturePage)
+async def list_fixtures(
+    league: Optional[int] = Query(None, description="O id da liga segundo a API"),
+    season: Optional[int] = Query(None, description="A temporada da liga (ex: 2023)"),
+    round: Optional[str] = Query(None, description="A rodada da partida"),
+    team: Optional[int] = Query(
+        None, description="O id da equipe segundo a API (mandante ou visitante)"
+    ),
+    from_date: Optional[date] = Query(
+        None, alias="from", description="Data inicial (YYYY-MM-DD)"
+    ),
+    to_date: Optional[date] = Query(
+        None, alias="to", description="Data final, inclusiva (YYYY-MM-DD)"
+    ),
+    status_filter: Optional[str] = Query(
+        None, alias="status", description='Um ou mais status curtos (ex: "NS", "FT-AET")'
+    ),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
+    cursor: Optional[str] = Query(
+        None, description="O next_cursor devolvido pela página anterior"
+    ),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_read_session),
+):
+    """
+    Lista partidas ordenadas por (data, api_id) com paginação por cursor.
+
+    O cursor guarda a chave da última partida da página, então cada página é
+    uma busca no índice a partir dela, com custo que não cresce com o número
+    de páginas já percorridas (ao contrário de OFFSET).
+    """
+    stmt = select(Fixture).where(Fixture.date.isnot(None))
+
+    if league is not None or season is not None:
+        league_ids = select(League.id)
+        if league is not None:
+            league_ids = league_ids.where(League.api_id == league)
+        if season is not None:
+            league_ids = league_ids.where(League.season == season)
+        stmt = stmt.where(Fixture.league_id.in_(league_ids))
+    if season is not None:
+        stmt = stmt.where(Fixture.season == season)
+    if round is not None:
+        stmt = stmt.where(Fixture.round == round)
+    if team is not None:
+        league_team_ids = select(LeagueTeam.id).where(
+            LeagueTeam.base_team_api_id == team
+        )
+        stmt = stmt.where(
+            or_(
+                Fixture.home_team_id.in_(league_team_ids),
+                Fixture.away_team_id.in_(league_team_ids),
+            )
+        )
+    if from_date is not None:
+        stmt = stmt.where(Fixture.date >= datetime.combine(from_date, time.min))
+    if to_date is not None:
+        stmt = stmt.where(Fixture.date <= datetime.combine(to_date, time.max))
+    if status_filter is not None:
+        stmt = stmt.where(Fixture.status_short.in_(status_filter.split("-")))
+
+    key = tuple_(Fixture.date, Fixture.api_id)
+    if cursor is not None:
+        cursor_key = tuple_(*decode_cursor(cursor))
+        stmt = stmt.where(key > cursor_key if order == "asc" else key < cursor_key)
+
+    if order == "asc":
+        stmt = stmt.order_by(Fixture.date, Fixture.api_id)
+    else:
+        stmt = stmt.order_by(Fixture.date.desc(), Fixture.api_id.desc())
+
+    # Uma linha a mais indica se existe próxima página
+    result = await db.execute(stmt.limit(limit + 1))
+    fixtures = result.scalars().all()
+
+    next_cursor = None
+    if len(fixtures) > limit:
+        fixtures = fixtures[:limit]
+        next_cursor = encode_cursor(fixtures[-1])
+
+    return {"items": fixtures, "next_cursor": next_cursor}
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import List, Optional
+from models.ingestion_job import IngestionJob
+from schemas import JobResponse
+from database.database import get_db_session
+
+router = APIRouter()
+
+
+@router.get("", response_model=List[JobResponse])
+async def list_jobs(
+    status_filter: Optional[str] = Query(
+        None, alias="status", description="queued, running, succeeded, failed, interrupted"
+    ),
+    task: Optional[str] = Query(None, description="Nome da tarefa de ingestão"),
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_db_session),
+):
+    stmt = select(IngestionJob).order_by(IngestionJob.id.desc()).limit(limit)
+    if status_filter is not None:
+        stmt = stmt.where(IngestionJob.status == status_filter)
+    if task is not None:
+        stmt = stmt.where(IngestionJob.task == task)
+
+    result = await db.execute(stmt)
+    return result.scalars().all()
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: int, db: AsyncSession = Depends(get_db_session)):
+    job = await db.get(IngestionJob, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return job
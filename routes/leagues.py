@@ -0,0 +1,55 @@
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import List
+from config import LEADERBOARD_SIZE
+from integrations.leaderboards import LEADERBOARD_METRICS, get_leaderboard
+from models.league_classification import LeagueClassification
+from schemas import LeaderboardResponse, StandingResponse
+from database.database import get_read_session
+
+router = APIRouter()
+
+
+@router.get("/{league_id}/standings", response_model=List[StandingResponse])
+async def get_standings(league_id: int, db: AsyncSession = Depends(get_read_session)):
+    """
+    Classificação da liga, mantida pela ingestão de partidas: uma leitura
+    pelo índice de league_id, sem agregar partidas.
+    """
+    result = await db.execute(
+        select(LeagueClassification)
+        .where(LeagueClassification.league_id == league_id)
+        .order_by(LeagueClassification.rank)
+    )
+    return result.scalars().all()
+
+
+def _top(board: dict, limit: int) -> dict:
+    return {**board, "entries": board["entries"][:limit]}
+
+
+@router.get("/{league_id}/leaderboards", response_model=List[LeaderboardResponse])
+async def get_leaderboards(
+    league_id: int, limit: int = Query(5, ge=1, le=LEADERBOARD_SIZE)
+):
+    """Os primeiros `limit` jogadores de cada ranking da liga."""
+    boards = await asyncio.gather(
+        *(get_leaderboard(league_id, metric) for metric in LEADERBOARD_METRICS)
+    )
+    return [_top(board, limit) for board in boards]
+
+
+@router.get("/{league_id}/leaderboards/{metric}", response_model=LeaderboardResponse)
+async def get_metric_leaderboard(
+    league_id: int, metric: str, limit: int = Query(20, ge=1, le=LEADERBOARD_SIZE)
+):
+    """
+    Ranking de uma métrica (goals, assists, rating, yellow_cards, red_cards,
+    clean_sheets), servido do cache em memória ou da tabela pré-calculada
+    player_leaderboards; nunca agrega as estatísticas na leitura.
+    """
+    if metric not in LEADERBOARD_METRICS:
+        raise HTTPException(status_code=404, detail="Unknown leaderboard metric")
+    return _top(await get_leaderboard(league_id, metric), limit)
@@ -0,0 +1,117 @@
+import asyncio
+import json
+from config import SSE_HEARTBEAT_INTERVAL
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from integrations.broker import broker
+from typing import Optional
+
+router = APIRouter()
+
+
+def _topics(
+    fixture: Optional[str], league: Optional[str], team: Optional[str]
+) -> list:
+    """Converte os filtros ("1-2-3") em tópicos do broker."""
+    topics = []
+    try:
+        for prefix, ids in (("fixture", fixture), ("league", league), ("team", team)):
+            if ids:
+                topics.extend(f"{prefix}:{int(value)}" for value in ids.split("-"))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid subscription ids"
+        )
+    if not topics:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Subscribe to at least one fixture, league or team",
+        )
+    return topics
+
+
+@router.get("/stream")
+async def stream_updates(
+    request: Request,
+    fixture: Optional[str] = Query(None, description="Ids de partidas (ex: 123-456)"),
+    league: Optional[str] = Query(None, description="Ids internos de ligas (ex: 1-2)"),
+    team: Optional[str] = Query(
+        None, description="Ids de equipes segundo a API (ex: 121)"
+    ),
+):
+    """
+    Server-Sent Events com as atualizações de placar, status e tempo das
+    partidas inscritas. Os eventos vêm do broker em memória, sem consultas
+    ao banco por cliente.
+    """
+    subscription = broker.subscribe(_topics(fixture, league, team))
+
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.get(), timeout=SSE_HEARTBEAT_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    # Comentário de keep-alive para proxies não fecharem a conexão
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: fixture\ndata: {json.dumps(event)}\n\n"
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/ws")
+async def websocket_updates(
+    websocket: WebSocket,
+    fixture: Optional[str] = None,
+    league: Optional[str] = None,
+    team: Optional[str] = None,
+):
+    """WebSocket com as mesmas atualizações do /live/stream, em JSON."""
+    try:
+        topics = _topics(fixture, league, team)
+    except HTTPException as e:
+        await websocket.close(code=1008, reason=e.detail)
+        return
+
+    await websocket.accept()
+    subscription = broker.subscribe(topics)
+    # O recebimento corre junto com a fila: um cliente que sai de um tópico
+    # sem eventos é notado na hora, não só no próximo envio
+    receive = asyncio.ensure_future(websocket.receive())
+    update = asyncio.ensure_future(subscription.get())
+    try:
+        while True:
+            await asyncio.wait(
+                {receive, update}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if update.done():
+                await websocket.send_json(update.result())
+                update = asyncio.ensure_future(subscription.get())
+            if receive.done():
+                if receive.result()["type"] == "websocket.disconnect":
+                    break
+                # Mensagens do cliente são ignoradas
+                receive = asyncio.ensure_future(websocket.receive())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receive.cancel()
+        update.cancel()
+        subscription.close()
@@ -0,0 +1,131 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select, or_
+from database.database import replica_router
+from integrations.standings import FINISHED_STATUSES
+from models.fixture import Fixture
+from models.league_classification import LeagueClassification
+from models.league_team import LeagueTeam
+from schemas import FeedResponse, FixtureResponse, StandingResponse
+from utils.feed_cache import feed_cache, feed_key
+from utils.tokens import CurrentUser, get_current_user
+
+router = APIRouter()
+
+# Status curtos de partidas ainda não iniciadas (agendada, horário a definir)
+UPCOMING_STATUSES = ("NS", "TBD")
+FEED_LIMIT = 10
+
+
+def _dump(schema, rows) -> list:
+    return [schema.model_validate(row, from_attributes=True).model_dump() for row in rows]
+
+
+async def build_feed(favorite_team, favorite_leagues: frozenset, limit: int):
+    """
+    Monta o feed dos favoritos com consultas em lote: as participações da
+    equipe favorita, as próximas partidas, os últimos resultados e a
+    classificação, cada uma numa única consulta para todas as ligas.
+
+    Só leitura: vai para a réplica quando ela está em dia.
+
+    Returns:
+        tuple: (feed, league_ids das quais o feed depende).
+    """
+    async with replica_router.reader_factory()() as session:
+        team_league_ids = set()
+        league_team_ids = []
+        if favorite_team is not None:
+            result = await session.execute(
+                select(LeagueTeam.id, LeagueTeam.league_id).where(
+                    LeagueTeam.base_team_api_id == favorite_team
+                )
+            )
+            for league_team_id, league_id in result:
+                league_team_ids.append(league_team_id)
+                team_league_ids.add(league_id)
+
+        filters = []
+        if favorite_leagues:
+            filters.append(Fixture.league_id.in_(favorite_leagues))
+        if league_team_ids:
+            filters.append(Fixture.home_team_id.in_(league_team_ids))
+            filters.append(Fixture.away_team_id.in_(league_team_ids))
+
+        upcoming, results, standings = [], [], {}
+        if filters:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            followed = or_(*filters)
+            result = await session.execute(
+                select(Fixture)
+                .where(
+                    followed,
+                    Fixture.status_short.in_(UPCOMING_STATUSES),
+                    Fixture.date >= now,
+                )
+                .order_by(Fixture.date, Fixture.api_id)
+                .limit(limit)
+            )
+            upcoming = result.scalars().all()
+
+            result = await session.execute(
+                select(Fixture)
+                .where(followed, Fixture.status_short.in_(FINISHED_STATUSES))
+                .order_by(Fixture.date.desc(), Fixture.api_id.desc())
+                .limit(limit)
+            )
+            results = result.scalars().all()
+
+            # Tabela completa das ligas favoritas e a linha da equipe favorita
+            # nas demais ligas em que ela joga
+            standing_filters = []
+            if favorite_leagues:
+                standing_filters.append(
+                    LeagueClassification.league_id.in_(favorite_leagues)
+                )
+            if favorite_team is not None:
+                standing_filters.append(
+                    LeagueClassification.base_team_api_id == favorite_team
+                )
+            result = await session.execute(
+                select(LeagueClassification)
+                .where(or_(*standing_filters))
+                .order_by(LeagueClassification.league_id, LeagueClassification.rank)
+            )
+            standings = defaultdict(list)
+            for row in result.scalars():
+                standings[row.league_id].append(row)
+
+    feed = {
+        "favorite_team": favorite_team,
+        "favorite_leagues": sorted(favorite_leagues),
+        "upcoming": _dump(FixtureResponse, upcoming),
+        "results": _dump(FixtureResponse, results),
+        "standings": [
+            {"league_id": league_id, "rows": _dump(StandingResponse, rows)}
+            for league_id, rows in standings.items()
+        ],
+    }
+    return feed, set(favorite_leagues) | team_league_ids
+
+
+@router.get("/feed", response_model=FeedResponse)
+async def get_feed(
+    limit: int = Query(FEED_LIMIT, ge=1, le=50),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    """
+    Próximas partidas, últimos resultados e classificação da equipe e das
+    ligas favoritas do usuário (lidas do token).
+
+    O feed fica em cache por (equipe, ligas, limite), compartilhado entre os
+    usuários com os mesmos favoritos, e é descartado quando partidas ou a
+    classificação dessas ligas mudam.
+    """
+    favorite_team = current_user.favorite_team
+    favorite_leagues = current_user.favorite_leagues
+    key = (*feed_key(favorite_team, favorite_leagues), limit)
+    return await feed_cache.get(
+        key, lambda: build_feed(favorite_team, favorite_leagues, limit)
+    )
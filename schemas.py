@@ -1,5 +1,6 @@
+from datetime import datetime
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import List, Optional
 
 class UserCreate(BaseModel):
     username: str
@@ -19,4 +20,113 @@ class UserResponse(BaseModel):
 class UserLogin(BaseModel):
     username: Optional[str] = None
     email: Optional[EmailStr] = None
-    password: str
\ No newline at end of file
+    password: str
+
+class TokenRefresh(BaseModel):
+    refresh_token: str
+
+class LogoutRequest(BaseModel):
+    refresh_token: Optional[str] = None
+
+class CurrentUserResponse(BaseModel):
+    id: int
+    username: Optional[str] = None
+    favorite_team: Optional[int] = None
+    favorite_leagues: List[int] = []
+
+class JobResponse(BaseModel):
+    id: int
+    task: str
+    params: Optional[dict] = None
+    status: str
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    duration_ms: Optional[int] = None
+
+    class Config:
+        orm_mode = True
+
+class FixtureResponse(BaseModel):
+    api_id: int
+    league_id: int
+    season: Optional[int] = None
+    round: str
+    date: Optional[datetime] = None
+    status: Optional[str] = None
+    status_short: Optional[str] = None
+    elapsed: Optional[int] = None
+    venue_id: Optional[int] = None
+    referee: Optional[str] = None
+    timezone: Optional[str] = None
+    home_team_id: int
+    away_team_id: int
+    home_team_score_goals: Optional[int] = None
+    away_team_score_goals: Optional[int] = None
+
+    class Config:
+        orm_mode = True
+
+class FixturePage(BaseModel):
+    items: List[FixtureResponse]
+    next_cursor: Optional[str] = None
+
+class StandingResponse(BaseModel):
+    rank: Optional[int] = None
+    base_team_api_id: int
+    points: Optional[int] = None
+    goals_difference: Optional[int] = None
+    form: Optional[str] = None
+    all_played: Optional[int] = None
+    all_win: Optional[int] = None
+    all_draw: Optional[int] = None
+    all_lose: Optional[int] = None
+    all_goals_for: Optional[int] = None
+    all_goals_against: Optional[int] = None
+    home_played: Optional[int] = None
+    home_win: Optional[int] = None
+    home_draw: Optional[int] = None
+    home_lose: Optional[int] = None
+    home_goals_for: Optional[int] = None
+    home_goals_against: Optional[int] = None
+    away_played: Optional[int] = None
+    away_win: Optional[int] = None
+    away_draw: Optional[int] = None
+    away_lose: Optional[int] = None
+    away_goals_for: Optional[int] = None
+    away_goals_against: Optional[int] = None
+    last_updated: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+
+class LeagueStandings(BaseModel):
+    league_id: int
+    rows: List[StandingResponse]
+
+class FeedResponse(BaseModel):
+    favorite_team: Optional[int] = None
+    favorite_leagues: List[int]
+    upcoming: List[FixtureResponse]
+    results: List[FixtureResponse]
+    standings: List[LeagueStandings]
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    base_player_api_id: int
+    player_name: Optional[str] = None
+    player_photo_url: Optional[str] = None
+    league_team_id: int
+    team_name: Optional[str] = None
+    team_logo_url: Optional[str] = None
+    value: float
+    appearances: Optional[int] = None
+    minutes: Optional[int] = None
+
+class LeaderboardResponse(BaseModel):
+    league_id: int
+    metric: str
+    refreshed_at: Optional[datetime] = None
+    entries: List[LeaderboardEntry]
@@ -0,0 +1,57 @@
+import asyncio
+import unittest
+
+from integrations.broker import Broker, fixture_event
+
+
+def event(api_id, league_id, home, away):
+    row = {
+        "api_id": api_id,
+        "league_id": league_id,
+        "status": "First Half",
+        "status_short": "1H",
+        "elapsed": 10,
+        "home_team_score_goals": 1,
+        "away_team_score_goals": 0,
+    }
+    return fixture_event(row, home, away)
+
+
+class TestBroker(unittest.TestCase):
+
+    def test_fan_out_by_topic_without_duplicates(self):
+        def drain(subscription):
+            items = []
+            while not subscription._queue.empty():
+                items.append(subscription._queue.get_nowait()["api_id"])
+            return items
+
+        async def run():
+            broker = Broker(backend="local", queue_size=10)
+            league_and_team = broker.subscribe(["league:1", "team:121"])
+            fixture = broker.subscribe(["fixture:6"])
+            await broker.publish([event(5, 1, 121, 130), event(6, 2, 7, 8)])
+            return drain(league_and_team), drain(fixture)
+
+        self.assertEqual(asyncio.run(run()), ([5], [6]))
+
+    def test_slow_subscriber_drops_oldest_events(self):
+        async def run():
+            broker = Broker(backend="local", queue_size=2)
+            subscription = broker.subscribe(["league:1"])
+            await broker.publish([event(i, 1, 10, 11) for i in range(5)])
+            received = [(await subscription.get())["api_id"] for _ in range(2)]
+            return received, subscription.dropped
+
+        self.assertEqual(asyncio.run(run()), ([3, 4], 3))
+
+    def test_close_unsubscribes(self):
+        broker = Broker(backend="local")
+        subscription = broker.subscribe(["fixture:1", "team:2"])
+        self.assertEqual(broker.subscriber_count(), 1)
+        subscription.close()
+        self.assertEqual(broker.subscriber_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
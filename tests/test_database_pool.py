@@ -0,0 +1,62 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from database.pool import InstrumentedPool, pool_metrics
+
+
+class TestInstrumentedPool(unittest.TestCase):
+    """Usa um SQLite em arquivo (aiosqlite) no lugar do Postgres."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.url = f"sqlite+aiosqlite:///{os.path.join(self.tmpdir.name, 'pool.db')}"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _engine(self, **options):
+        return create_async_engine(self.url, poolclass=InstrumentedPool, **options)
+
+    def test_counts_in_use_connections_and_checkouts(self):
+        engine = self._engine(pool_size=2, max_overflow=0)
+
+        async def run():
+            async with engine.connect() as first, engine.connect() as second:
+                await first.execute(text("SELECT 1"))
+                await second.execute(text("SELECT 1"))
+                during = pool_metrics(engine.pool)
+            after = pool_metrics(engine.pool)
+            await engine.dispose()
+            return during, after
+
+        during, after = asyncio.run(run())
+        self.assertEqual(during["in_use"], 2)
+        self.assertEqual(after["in_use"], 0)
+        self.assertEqual(after["idle"], 2)
+        self.assertEqual(after["checkouts"], 2)
+
+    def test_measures_wait_and_timeouts(self):
+        engine = self._engine(pool_size=1, max_overflow=0, pool_timeout=0.1)
+
+        async def run():
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+                with self.assertRaises(exc.TimeoutError):
+                    async with engine.connect():
+                        pass
+            metrics = pool_metrics(engine.pool)
+            await engine.dispose()
+            return metrics
+
+        metrics = asyncio.run(run())
+        self.assertEqual(metrics["timeouts"], 1)
+        self.assertGreaterEqual(metrics["max_wait_ms"], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
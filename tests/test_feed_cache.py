@@ -0,0 +1,218 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from database.database import Base
+from database.replica import ReplicaRouter
+from routes import me
+from routes.me import build_feed
+from utils.feed_cache import FeedCache, feed_key
+
+# Todas as tabelas são criadas no SQLite, como no app
+from models import (  # noqa: F401
+    base_coach,
+    base_player,
+    base_team,
+    country,
+    fixture,
+    fixture_lineup,
+    fixture_player_stat,
+    fixture_statistic,
+    ingestion_job,
+    league,
+    league_classification,
+    league_team,
+    player_leaderboard,
+    player_season_stat,
+    user,
+    venue,
+)
+from models.base_team import BaseTeam
+from models.country import Country
+from models.fixture import Fixture
+from models.league import League
+from models.league_team import LeagueTeam
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeBuild:
+    """Montagem falsa: conta as chamadas e depende das ligas informadas."""
+
+    def __init__(self, league_ids, delay: float = 0):
+        self.league_ids = league_ids
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"version": self.calls}, self.league_ids
+
+
+class TestFeedCache(unittest.TestCase):
+    def test_same_favorites_share_entry(self):
+        cache = FeedCache(ttl=60)
+        build = FakeBuild({1, 2})
+
+        async def run():
+            first = await cache.get(feed_key(10, [2, 1]), build)
+            second = await cache.get(feed_key(10, [1, 2]), build)
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual(build.calls, 1)
+        self.assertIs(first, second)
+
+    def test_invalidation_only_hits_dependent_leagues(self):
+        cache = FeedCache(ttl=60)
+        build_a = FakeBuild({1})
+        build_b = FakeBuild({2})
+
+        async def run():
+            await cache.get(feed_key(None, [1]), build_a)
+            await cache.get(feed_key(None, [2]), build_b)
+            cache.on_fixture_events([{"league_id": 1}])
+            await cache.get(feed_key(None, [1]), build_a)
+            await cache.get(feed_key(None, [2]), build_b)
+
+        asyncio.run(run())
+        self.assertEqual(build_a.calls, 2)
+        self.assertEqual(build_b.calls, 1)
+
+    def test_expires_after_ttl(self):
+        clock = FakeClock()
+        cache = FeedCache(ttl=60, clock=clock)
+        build = FakeBuild({1})
+
+        async def run():
+            await cache.get(feed_key(None, [1]), build)
+            clock.now += 61
+            await cache.get(feed_key(None, [1]), build)
+
+        asyncio.run(run())
+        self.assertEqual(build.calls, 2)
+
+    def test_concurrent_requests_share_build(self):
+        cache = FeedCache(ttl=60)
+        build = FakeBuild({1}, delay=0.01)
+
+        async def run():
+            return await asyncio.gather(
+                *(cache.get(feed_key(None, [1]), build) for _ in range(5))
+            )
+
+        results = asyncio.run(run())
+        self.assertEqual(build.calls, 1)
+        self.assertEqual(len({id(result) for result in results}), 1)
+
+    def test_build_overlapping_invalidation_is_not_stored(self):
+        cache = FeedCache(ttl=60)
+        build = FakeBuild({1}, delay=0.01)
+
+        async def run():
+            pending = asyncio.ensure_future(cache.get(feed_key(None, [1]), build))
+            await asyncio.sleep(0)
+            cache.invalidate_leagues([1])
+            await pending
+            await cache.get(feed_key(None, [1]), build)
+
+        asyncio.run(run())
+        self.assertEqual(build.calls, 2)
+
+    def test_evicts_least_recently_used(self):
+        cache = FeedCache(ttl=60, max_entries=2)
+
+        async def run():
+            for league_id in (1, 2, 3):
+                await cache.get(feed_key(None, [league_id]), FakeBuild({league_id}))
+
+        asyncio.run(run())
+        self.assertEqual(cache.metrics()["entries"], 2)
+        self.assertNotIn(feed_key(None, [1]), cache._entries)
+
+
+
+class TestBuildFeed(unittest.IsolatedAsyncioTestCase):
+    """O feed é lido pelo roteador de réplica, nunca direto do primário."""
+
+    async def asyncSetUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.engines, factories = [], []
+        for name in ("primary.db", "replica.db"):
+            path = os.path.join(self.tmpdir.name, name)
+            engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            self.engines.append(engine)
+            factories.append(async_sessionmaker(engine, class_=AsyncSession))
+        primary_factory, replica_factory = factories
+
+        # Só a réplica tem a partida: o feed mostra de qual banco leu
+        async with replica_factory() as session:
+            session.add_all(
+                [
+                    Country(id=1, name="Brazil"),
+                    League(id=1, api_id=71, season=2023, name="Serie A", country_id=1),
+                    BaseTeam(api_id=121, name="Palmeiras", country_id=1),
+                    BaseTeam(api_id=127, name="Flamengo", country_id=1),
+                    LeagueTeam(id=1, league_id=1, base_team_api_id=121),
+                    LeagueTeam(id=2, league_id=1, base_team_api_id=127),
+                    Fixture(
+                        api_id=1001,
+                        league_id=1,
+                        season=2023,
+                        date=datetime(2099, 4, 15, 19, 0),
+                        status_short="NS",
+                        round="Regular Season - 1",
+                        home_team_id=1,
+                        away_team_id=2,
+                    ),
+                ]
+            )
+            await session.commit()
+
+        self.router = ReplicaRouter(
+            primary_factory, self.engines[1], replica_factory, max_lag=5
+        )
+        patch = mock.patch.object(me, "replica_router", self.router)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    async def asyncTearDown(self):
+        for engine in self.engines:
+            await engine.dispose()
+        self.tmpdir.cleanup()
+
+    async def upcoming(self):
+        feed, league_ids = await build_feed(None, frozenset({1}), 10)
+        self.assertEqual(league_ids, {1})
+        return [fixture["api_id"] for fixture in feed["upcoming"]]
+
+    async def test_reads_from_replica_when_healthy(self):
+        self.router.lag = 0.5
+
+        self.assertEqual(await self.upcoming(), [1001])
+        self.assertEqual(self.router.replica_reads, 1)
+        self.assertEqual(self.router.primary_reads, 0)
+
+    async def test_falls_back_to_primary_when_replica_lags(self):
+        self.router.lag = 60
+
+        self.assertEqual(await self.upcoming(), [])
+        self.assertEqual(self.router.primary_reads, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
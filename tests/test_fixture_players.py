@@ -0,0 +1,83 @@
+import unittest
+from datetime import datetime
+from decimal import Decimal
+
+from integrations.fixture_players import parse_lineups, parse_player_stats
+
+
+class TestParseFixturePlayers(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime(2023, 5, 1)
+        self.league_teams = {121: 5, 130: 6}
+
+    def test_parse_lineups(self):
+        data = {
+            "response": [
+                {
+                    "team": {"id": 121},
+                    "coach": {"id": 40},
+                    "formation": "4-3-3",
+                    "startXI": [{"player": {"id": 10, "number": 9, "grid": "4:2"}}],
+                    "substitutes": [{"player": {"id": 11, "number": 21, "grid": None}}],
+                },
+                {"team": {"id": 999}, "formation": "4-4-2"},
+            ]
+        }
+
+        rows, players = parse_lineups(1001, data, self.league_teams, self.now)
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["league_team_id"], 5)
+        self.assertEqual(rows[0]["coach_api_id"], 40)
+        self.assertEqual(rows[0]["formation"], "4-3-3")
+        self.assertEqual(
+            players[(5, 10)],
+            {"jersey_number": 9, "formation_grid": "4:2", "is_starter": True},
+        )
+        self.assertFalse(players[(5, 11)]["is_starter"])
+
+    def test_parse_player_stats(self):
+        data = {
+            "response": [
+                {
+                    "team": {"id": 130},
+                    "players": [
+                        {
+                            "player": {"id": 10},
+                            "statistics": [
+                                {
+                                    "games": {"minutes": 90, "rating": "10"},
+                                    "passes": {"accuracy": "88%"},
+                                    "cards": {"yellow": 1},
+                                }
+                            ],
+                        },
+                        {"player": {"id": None}, "statistics": [{}]},
+                    ],
+                }
+            ]
+        }
+        lineup_players = {
+            (6, 10): {"jersey_number": 7, "formation_grid": "3:1", "is_starter": True}
+        }
+
+        rows = parse_player_stats(
+            1001, data, self.league_teams, lineup_players, self.now
+        )
+
+        self.assertEqual(len(rows), 1)
+        row = rows[0]
+        self.assertEqual(row["league_team_id"], 6)
+        self.assertEqual(row["base_player_api_id"], 10)
+        self.assertEqual(row["game_minute"], 90)
+        self.assertEqual(row["game_position"], Decimal("9.99"))
+        self.assertEqual(row["passes_accuracy"], "88%")
+        self.assertEqual(row["cards_yellow"], 1)
+        self.assertIsNone(row["shots_total"])
+        self.assertEqual(row["jersey_number"], 7)
+        self.assertTrue(row["is_starter"])
+        self.assertEqual(row["last_updated"], self.now)
+
+
+if __name__ == "__main__":
+    unittest.main()
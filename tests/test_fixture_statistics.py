@@ -0,0 +1,54 @@
+import unittest
+from datetime import datetime
+
+from integrations.fixture_statistics import (
+    parse_fixture_statistics,
+    parse_statistic_value,
+)
+
+
+class TestParseStatistics(unittest.TestCase):
+    def test_parse_statistic_value(self):
+        self.assertEqual(parse_statistic_value(7), 7)
+        self.assertEqual(parse_statistic_value("55%"), 55)
+        self.assertEqual(parse_statistic_value(" 81.6% "), 82)
+        self.assertIsNone(parse_statistic_value(None))
+        self.assertIsNone(parse_statistic_value(""))
+        self.assertIsNone(parse_statistic_value("n/a"))
+
+    def test_parse_fixture_statistics(self):
+        now = datetime(2023, 5, 1)
+        data = {
+            "response": [
+                {
+                    "team": {"id": 121},
+                    "statistics": [
+                        {"type": "Ball Possession", "value": "61%"},
+                        {"type": "Total Shots", "value": 14},
+                        {"type": "Passes %", "value": "88%"},
+                        {"type": "expected_goals", "value": "1.42"},
+                    ],
+                },
+                {"team": {"id": 130}, "statistics": []},
+                {"team": {"id": 999}, "statistics": []},
+            ]
+        }
+
+        rows = parse_fixture_statistics(1001, data, {121: 5, 130: 6}, now)
+
+        self.assertEqual(len(rows), 2)
+        home, away = rows
+        self.assertEqual(home["fixture_id"], 1001)
+        self.assertEqual(home["league_team_id"], 5)
+        self.assertEqual(home["ball_possession"], 61)
+        self.assertEqual(home["total_shots"], 14)
+        self.assertEqual(home["passes_percentage"], 88)
+        self.assertIsNone(home["red_cards"])
+        self.assertNotIn("expected_goals", home)
+        self.assertEqual(away["league_team_id"], 6)
+        self.assertIsNone(away["ball_possession"])
+        self.assertEqual(away["last_updated"], now)
+
+
+if __name__ == "__main__":
+    unittest.main()
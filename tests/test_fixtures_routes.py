@@ -0,0 +1,285 @@
+import base64
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+import httpx
+from fastapi import FastAPI, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from database.database import Base, get_read_session
+from routes import fixtures
+from routes.fixtures import decode_cursor, encode_cursor
+
+# Todas as tabelas são criadas no SQLite, como no app
+from models import (  # noqa: F401
+    base_coach,
+    base_player,
+    base_team,
+    country,
+    fixture,
+    fixture_lineup,
+    fixture_player_stat,
+    fixture_statistic,
+    ingestion_job,
+    league,
+    league_classification,
+    league_team,
+    player_leaderboard,
+    player_season_stat,
+    user,
+    venue,
+)
+from models.base_team import BaseTeam
+from models.country import Country
+from models.fixture import Fixture
+from models.league import League
+from models.league_team import LeagueTeam
+
+START = datetime(2023, 4, 1, 19, 0)
+
+
+def seed():
+    """
+    Liga 71/2023 com 12 partidas, duas por dia (mesma data e hora), e as
+    equipes 101 e 103 (mandante e visitante nos índices pares) e 102 e 104
+    (nos ímpares); liga 71/2022 com 2 partidas e liga 72/2023 com 1.
+    """
+    rows = [
+        Country(id=1, name="Brazil"),
+        League(id=1, api_id=71, season=2023, name="Serie A", country_id=1),
+        League(id=2, api_id=71, season=2022, name="Serie A", country_id=1),
+        League(id=3, api_id=72, season=2023, name="Serie B", country_id=1),
+    ]
+    rows += [
+        BaseTeam(api_id=api_id, name=f"T{api_id}", country_id=1)
+        for api_id in range(101, 107)
+    ]
+    rows += [
+        LeagueTeam(id=league_team_id, league_id=league_id, base_team_api_id=api_id)
+        for league_team_id, league_id, api_id in (
+            (1, 1, 101),
+            (2, 1, 102),
+            (3, 1, 103),
+            (4, 1, 104),
+            (5, 2, 101),
+            (6, 2, 102),
+            (7, 3, 105),
+            (8, 3, 106),
+        )
+    ]
+    rows += [
+        Fixture(
+            api_id=1000 + i,
+            league_id=1,
+            season=2023,
+            date=START + timedelta(days=i // 2),
+            status_short="FT" if i < 8 else "NS",
+            round=f"Regular Season - {i // 4 + 1}",
+            home_team_id=1 + i % 2,
+            away_team_id=3 + i % 2,
+        )
+        for i in range(12)
+    ]
+    rows += [
+        Fixture(
+            api_id=2000 + i,
+            league_id=2,
+            season=2022,
+            date=datetime(2022, 5, 1 + i, 16, 0),
+            status_short="FT",
+            round="Regular Season - 1",
+            home_team_id=5,
+            away_team_id=6,
+        )
+        for i in range(2)
+    ]
+    rows.append(
+        Fixture(
+            api_id=3000,
+            league_id=3,
+            season=2023,
+            date=START + timedelta(days=1, hours=1),
+            status_short="AET",
+            round="Regular Season - 1",
+            home_team_id=7,
+            away_team_id=8,
+        )
+    )
+    return rows
+
+
+class FixturesApiTestCase(unittest.IsolatedAsyncioTestCase):
+    """GET /fixtures servido por um banco SQLite temporário."""
+
+    async def asyncSetUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmpdir.name, "fixtures.db")
+        self.engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        factory = async_sessionmaker(self.engine, class_=AsyncSession)
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with factory() as session:
+            session.add_all(seed())
+            await session.commit()
+
+        async def read_session():
+            async with factory() as session:
+                yield session
+
+        app = FastAPI()
+        app.include_router(fixtures.router, prefix="/fixtures")
+        app.dependency_overrides[get_read_session] = read_session
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        )
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        await self.engine.dispose()
+        self.tmpdir.cleanup()
+
+    async def get(self, **params):
+        response = await self.client.get("/fixtures", params=params)
+        self.assertEqual(response.status_code, 200, response.text)
+        return response.json()
+
+    async def api_ids(self, **params):
+        return [item["api_id"] for item in (await self.get(**params))["items"]]
+
+    async def walk(self, **params):
+        """Percorre todas as páginas seguindo next_cursor."""
+        seen, pages, cursor = [], 0, None
+        while True:
+            page = await self.get(**params, **({"cursor": cursor} if cursor else {}))
+            seen += [item["api_id"] for item in page["items"]]
+            pages += 1
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return seen, pages
+
+
+class TestCursor(unittest.TestCase):
+    def test_round_trip(self):
+        row = Fixture(api_id=1234, date=datetime(2023, 4, 1, 19, 30))
+        self.assertEqual(
+            decode_cursor(encode_cursor(row)), (datetime(2023, 4, 1, 19, 30), 1234)
+        )
+
+    def test_malformed_cursor_is_rejected(self):
+        for cursor in (
+            "zzz",
+            base64.urlsafe_b64encode(b"2023-04-01T19:00:00").decode(),
+            base64.urlsafe_b64encode(b"ontem|1234").decode(),
+            base64.urlsafe_b64encode(b"2023-04-01T19:00:00|abc").decode(),
+        ):
+            with self.assertRaises(HTTPException) as context:
+                decode_cursor(cursor)
+            self.assertEqual(context.exception.status_code, 400)
+
+
+class TestFixturesPagination(FixturesApiTestCase):
+    async def test_pages_cover_every_fixture_once_in_order(self):
+        seen, pages = await self.walk(limit=4)
+
+        self.assertEqual(pages, 4)
+        self.assertEqual(
+            seen,
+            [2000, 2001, 1000, 1001, 1002, 1003, 3000, *range(1004, 1012)],
+        )
+
+    async def test_ties_on_date_are_broken_by_api_id(self):
+        # limit=3 corta as duplas de partidas da mesma data ao meio
+        seen, _ = await self.walk(league=71, season=2023, limit=3)
+        self.assertEqual(seen, list(range(1000, 1012)))
+
+        seen, _ = await self.walk(league=71, season=2023, limit=3, order="desc")
+        self.assertEqual(seen, list(range(1011, 999, -1)))
+
+    async def test_last_page_has_no_cursor(self):
+        page = await self.get(league=71, season=2023, limit=12)
+        self.assertEqual(len(page["items"]), 12)
+        self.assertIsNone(page["next_cursor"])
+
+        page = await self.get(league=71, season=2023, limit=5)
+        self.assertIsNotNone(page["next_cursor"])
+        page = await self.get(
+            league=71, season=2023, limit=7, cursor=page["next_cursor"]
+        )
+        self.assertEqual(len(page["items"]), 7)
+        self.assertIsNone(page["next_cursor"])
+
+    async def test_bad_cursor_is_rejected(self):
+        response = await self.client.get("/fixtures", params={"cursor": "zzz"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["detail"], "Invalid cursor")
+
+
+class TestFixturesFilters(FixturesApiTestCase):
+    async def test_league(self):
+        self.assertEqual(await self.api_ids(league=72), [3000])
+        self.assertEqual(
+            await self.api_ids(league=71, limit=200),
+            [2000, 2001, *range(1000, 1012)],
+        )
+
+    async def test_season(self):
+        self.assertEqual(await self.api_ids(season=2022), [2000, 2001])
+        self.assertEqual(
+            await self.api_ids(season=2023, limit=200),
+            [1000, 1001, 1002, 1003, 3000, *range(1004, 1012)],
+        )
+        self.assertEqual(await self.api_ids(league=72, season=2022), [])
+
+    async def test_round(self):
+        self.assertEqual(
+            await self.api_ids(round="Regular Season - 2"), [1004, 1005, 1006, 1007]
+        )
+
+    async def test_team_home_or_away(self):
+        # 101 é mandante na liga 71 nas duas temporadas
+        self.assertEqual(
+            await self.api_ids(team=101),
+            [2000, 2001, 1000, 1002, 1004, 1006, 1008, 1010],
+        )
+        # 104 é sempre visitante
+        self.assertEqual(
+            await self.api_ids(team=104), [1001, 1003, 1005, 1007, 1009, 1011]
+        )
+
+    async def test_date_range_is_inclusive(self):
+        self.assertEqual(
+            await self.api_ids(**{"from": "2023-04-02", "to": "2023-04-02"}),
+            [1002, 1003, 3000],
+        )
+        self.assertEqual(await self.api_ids(**{"from": "2023-04-06"}), [1010, 1011])
+        self.assertEqual(await self.api_ids(to="2022-12-31"), [2000, 2001])
+
+    async def test_status(self):
+        self.assertEqual(await self.api_ids(status="AET"), [3000])
+        self.assertEqual(
+            await self.api_ids(status="AET-NS"), [3000, 1008, 1009, 1010, 1011]
+        )
+
+    async def test_order_desc(self):
+        self.assertEqual(
+            await self.api_ids(league=71, season=2022, order="desc"), [2001, 2000]
+        )
+
+    async def test_cursor_continues_with_filters(self):
+        seen, pages = await self.walk(team=101, status="FT", limit=2)
+        self.assertEqual(pages, 3)
+        self.assertEqual(seen, [2000, 2001, 1000, 1002, 1004, 1006])
+
+        seen, _ = await self.walk(team=101, status="FT", limit=2, order="desc")
+        self.assertEqual(seen, [1006, 1004, 1002, 1000, 2001, 2000])
+
+    async def test_invalid_parameters_are_rejected(self):
+        for params in ({"order": "up"}, {"limit": 0}, {"limit": 201}, {"from": "x"}):
+            response = await self.client.get("/fixtures", params=params)
+            self.assertEqual(response.status_code, 422, params)
+
+
+if __name__ == "__main__":
+    unittest.main()
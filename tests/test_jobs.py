@@ -0,0 +1,74 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from integrations import jobs
+from integrations.countries_processor import process_countries_json_and_save_to_db
+from integrations.jobs import FAILED, JobRunner, QUEUED, SUCCEEDED
+
+
+class FakeSession:
+    """Sessão que devolve sempre o mesmo job e guarda os UPDATEs executados."""
+
+    def __init__(self, job, updates):
+        self.job = job
+        self.updates = updates
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def get(self, model, job_id):
+        return self.job
+
+    async def commit(self):
+        pass
+
+    async def execute(self, statement):
+        self.updates.append(statement.compile().params)
+
+
+class TestJobRunner(unittest.IsolatedAsyncioTestCase):
+    async def run_job(self, task):
+        job = SimpleNamespace(task="fake", params={}, status=QUEUED)
+        updates = []
+        with mock.patch.object(
+            jobs, "async_session_factory", lambda: FakeSession(job, updates)
+        ), mock.patch.dict(jobs.TASKS, {"fake": task}):
+            await JobRunner()._run(1)
+        self.assertEqual(len(updates), 1)
+        return updates[0]
+
+    async def test_processor_error_marks_job_failed(self):
+        async def task():
+            return await process_countries_json_and_save_to_db("nao_existe.json")
+
+        values = await self.run_job(task)
+
+        self.assertEqual(values["status"], FAILED)
+        self.assertIn("FileNotFoundError", values["error"])
+
+    async def test_reported_failures_mark_job_failed(self):
+        async def task():
+            return {"inserted": 10, "failed": 0, "rows_failed": 3}
+
+        values = await self.run_job(task)
+
+        self.assertEqual(values["status"], FAILED)
+        self.assertEqual(values["result"]["rows_failed"], 3)
+
+    async def test_successful_task(self):
+        async def task():
+            return 5
+
+        values = await self.run_job(task)
+
+        self.assertEqual(values["status"], SUCCEEDED)
+        self.assertEqual(values["result"], {"rows": 5})
+        self.assertIsNone(values.get("error"))
+
+
+if __name__ == "__main__":
+    unittest.main()
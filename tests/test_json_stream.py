@@ -0,0 +1,123 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from integrations.json_stream import (
+    iter_response_items,
+    iter_chunks,
+    iter_response_chunks,
+    UnexpectedPayloadError,
+)
+from integrations.payload_storage import write_payload, GZIP, JSON
+
+
+class TestJsonStream(unittest.TestCase):
+
+    def _write(self, content):
+        handle, path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(handle, "w") as json_file:
+            json_file.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_matches_json_load_on_bundled_files(self):
+        for file_name in sorted(os.listdir("json")):
+            if not file_name.endswith(".json"):
+                continue
+            file_path = os.path.join("json", file_name)
+            with open(file_path) as json_file:
+                expected = json.load(json_file)["response"]
+            # Blocos pequenos forçam valores partidos entre leituras
+            items = list(iter_response_items(file_path, read_size=97))
+            self.assertEqual(items, expected, file_name)
+
+    def test_response_after_other_keys_and_numbers_at_block_edge(self):
+        payload = {
+            "get": "fixtures",
+            "results": 123456,
+            "paging": {"current": 1, "total": 1},
+            "response": [1, 2.5, "três", None, {"id": 10}],
+        }
+        path = self._write(json.dumps(payload))
+        for read_size in (1, 2, 3, 7, 1024):
+            self.assertEqual(
+                list(iter_response_items(path, read_size=read_size)),
+                payload["response"],
+            )
+
+    def test_empty_response(self):
+        path = self._write('{"response": [] , "errors": []}')
+        self.assertEqual(list(iter_response_items(path)), [])
+
+    def test_missing_or_invalid_response(self):
+        for content in ('{"errors": {"token": "invalid"}}', '{"response": {}}', "{}"):
+            path = self._write(content)
+            with self.assertRaises(UnexpectedPayloadError):
+                list(iter_response_items(path))
+
+    def test_truncated_file(self):
+        path = self._write('{"response": [{"id": 1}, {"id": ')
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_response_items(path, read_size=4))
+
+    def test_compressed_payload_is_read_transparently(self):
+        payload = {"get": "fixtures", "response": [{"id": 1, "x": 2.5}, {"id": 2}]}
+        for fmt in (GZIP, JSON):
+            path = self._write("")
+            write_payload(path, payload, fmt)
+            self.assertEqual(
+                list(iter_response_items(path, read_size=7)), payload["response"]
+            )
+
+    def test_gzip_payload_bytes_are_deterministic(self):
+        first, second = self._write(""), self._write("")
+        write_payload(first, {"response": [1, 2, 3]}, GZIP)
+        write_payload(second, {"response": [1, 2, 3]}, GZIP)
+        with open(first, "rb") as a, open(second, "rb") as b:
+            self.assertEqual(a.read(), b.read())
+
+    def test_iter_chunks(self):
+        self.assertEqual(list(iter_chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(iter_chunks([], 3)), [])
+
+
+class TestIterResponseChunks(unittest.IsolatedAsyncioTestCase):
+    def _write(self, payload):
+        handle, path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        write_payload(path, payload, GZIP)
+        self.addCleanup(os.remove, path)
+        return path
+
+    async def test_chunks_are_parsed_off_the_event_loop(self):
+        path = self._write({"response": [{"id": i} for i in range(5)]})
+        threads = set()
+
+        def parse(item):
+            threads.add(threading.get_ident())
+            return item["id"]
+
+        chunks = [
+            chunk async for chunk in iter_response_chunks(path, 2, parse=parse)
+        ]
+
+        self.assertEqual(chunks, [[0, 1], [2, 3], [4]])
+        self.assertTrue(threads)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    async def test_without_parse_and_errors_propagate(self):
+        path = self._write({"response": [1, 2, 3]})
+        self.assertEqual(
+            [chunk async for chunk in iter_response_chunks(path, 5)], [[1, 2, 3]]
+        )
+
+        path = self._write({"errors": {"token": "invalid"}})
+        with self.assertRaises(UnexpectedPayloadError):
+            async for _ in iter_response_chunks(path, 5):
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,336 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.future import select
+
+from config import LEADERBOARD_MIN_RATED_APPEARANCES
+from database.database import Base
+from database.replica import ReplicaRouter
+from integrations import leaderboards
+from integrations.leaderboards import (
+    LEADERBOARD_METRICS,
+    compute_leaderboard,
+    rank_entries,
+    refresh_leaderboards,
+)
+from routes import leagues
+from utils.feed_cache import FeedCache
+
+# Todas as tabelas são criadas no SQLite, como no app
+from models import (  # noqa: F401
+    base_coach,
+    base_player,
+    base_team,
+    country,
+    fixture,
+    fixture_lineup,
+    fixture_player_stat,
+    fixture_statistic,
+    ingestion_job,
+    league,
+    league_classification,
+    league_team,
+    player_leaderboard,
+    player_season_stat,
+    user,
+    venue,
+)
+from models.base_player import BasePlayer
+from models.base_team import BaseTeam
+from models.country import Country
+from models.league import League
+from models.league_team import LeagueTeam
+from models.player_leaderboard import PlayerLeaderboard
+from models.player_season_stat import PlayerSeasonStat
+
+MIN_RATED = LEADERBOARD_MIN_RATED_APPEARANCES
+
+
+def seed():
+    """
+    Liga 1 com as equipes 121 e 127 e liga 2 com a 130. Os jogadores 10 e 11
+    empatam em gols (11 jogou menos minutos) e 11 tem a maior nota, mas com
+    uma partida com nota a menos que o mínimo; 14 joga na liga 2.
+    """
+    rows = [
+        Country(id=1, name="Brazil"),
+        League(id=1, api_id=71, season=2023, name="Serie A", country_id=1),
+        League(id=2, api_id=72, season=2023, name="Serie B", country_id=1),
+        BaseTeam(api_id=121, name="Palmeiras", logo_url="121.png", country_id=1),
+        BaseTeam(api_id=127, name="Flamengo", logo_url="127.png", country_id=1),
+        BaseTeam(api_id=130, name="Santos", logo_url="130.png", country_id=1),
+        LeagueTeam(id=1, league_id=1, base_team_api_id=121),
+        LeagueTeam(id=2, league_id=1, base_team_api_id=127),
+        LeagueTeam(id=3, league_id=2, base_team_api_id=130),
+    ]
+    rows += [
+        BasePlayer(api_id=api_id, name=f"P{api_id}", firstname=f"P{api_id}")
+        for api_id in range(10, 15)
+    ]
+
+    def stats(api_id, league_team_id, minutes, goals, assists, rating, rated, **extra):
+        return PlayerSeasonStat(
+            base_player_api_id=api_id,
+            league_team_id=league_team_id,
+            appearances=rated,
+            minutes=minutes,
+            goals=goals,
+            assists=assists,
+            rating=Decimal(rating),
+            rated_appearances=rated,
+            **extra,
+        )
+
+    rows += [
+        stats(10, 1, 900, 8, 2, "7.50", MIN_RATED + 5, cards_yellow=3),
+        stats(11, 2, 700, 8, 5, "8.10", MIN_RATED - 1),
+        stats(12, 1, 1000, 3, 0, "6.90", MIN_RATED + 7),
+        stats(13, 2, None, 0, 1, "7.00", MIN_RATED),
+        stats(14, 3, 800, 20, 9, "9.00", MIN_RATED + 5),
+    ]
+    return rows
+
+
+class LeaderboardDbTestCase(unittest.IsolatedAsyncioTestCase):
+    """Rankings calculados a partir de um banco SQLite temporário."""
+
+    async def asyncSetUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmpdir.name, "leaderboards.db")
+        self.engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        self.factory = async_sessionmaker(
+            self.engine, class_=AsyncSession, expire_on_commit=False
+        )
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with self.factory() as session:
+            session.add_all(seed())
+            await session.commit()
+
+        self.cache = FeedCache(ttl=60, max_entries=100)
+        patches = [
+            mock.patch.object(leaderboards, "async_session_factory", self.factory),
+            mock.patch.object(
+                leaderboards, "replica_router", ReplicaRouter(self.factory)
+            ),
+            mock.patch.object(leaderboards, "leaderboard_cache", self.cache),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+        self.tmpdir.cleanup()
+
+    async def board(self, metric, size=50, league_id=1):
+        async with self.factory() as session:
+            entries = await compute_leaderboard(session, league_id, metric, size)
+        return [
+            (entry["base_player_api_id"], float(entry["value"]), entry["rank"])
+            for entry in entries
+        ]
+
+    async def stored(self, league_id=1):
+        async with self.factory() as session:
+            result = await session.execute(
+                select(
+                    PlayerLeaderboard.metric,
+                    PlayerLeaderboard.position,
+                    PlayerLeaderboard.base_player_api_id,
+                )
+                .where(PlayerLeaderboard.league_id == league_id)
+                .order_by(PlayerLeaderboard.metric, PlayerLeaderboard.position)
+            )
+            return [tuple(row) for row in result]
+
+
+class TestRankEntries(unittest.TestCase):
+    def test_ties_share_rank(self):
+        entries = rank_entries([{"value": v} for v in (12, 9, 9, 7, 7, 7, 3)])
+
+        self.assertEqual([e["rank"] for e in entries], [1, 2, 2, 4, 4, 4, 7])
+        self.assertEqual([e["position"] for e in entries], list(range(1, 8)))
+
+    def test_empty(self):
+        self.assertEqual(rank_entries([]), [])
+
+
+class TestLeaderboardCachePut(unittest.IsolatedAsyncioTestCase):
+    async def test_put_replaces_entry_without_build(self):
+        cache = FeedCache(ttl=60, max_entries=10)
+        cache.put((1, "goals"), {"entries": [1]}, [1])
+
+        async def build():
+            raise AssertionError("não deveria montar")
+
+        self.assertEqual(await cache.get((1, "goals"), build), {"entries": [1]})
+
+        cache.invalidate_leagues([1])
+        cache.put((1, "goals"), {"entries": [2]}, [1])
+        self.assertEqual(await cache.get((1, "goals"), build), {"entries": [2]})
+
+
+
+class TestComputeLeaderboard(LeaderboardDbTestCase):
+    async def test_ordered_by_value_and_ties_by_fewer_minutes(self):
+        # 11 e 10 empatam com 8 gols; 11 jogou menos e fica na frente
+        self.assertEqual(
+            await self.board("goals"), [(11, 8.0, 1), (10, 8.0, 1), (12, 3.0, 3)]
+        )
+        # Zero não entra no ranking; minutos nulos contam como zero
+        self.assertEqual(
+            await self.board("assists"), [(11, 5.0, 1), (10, 2.0, 2), (13, 1.0, 3)]
+        )
+        self.assertEqual(await self.board("yellow_cards"), [(10, 3.0, 1)])
+        self.assertEqual(await self.board("red_cards"), [])
+
+    async def test_rating_requires_min_rated_appearances(self):
+        # 11 tem a maior nota, mas uma partida com nota a menos que o mínimo
+        self.assertEqual(
+            await self.board("rating"), [(10, 7.5, 1), (13, 7.0, 2), (12, 6.9, 3)]
+        )
+
+    async def test_size_and_league(self):
+        self.assertEqual(await self.board("goals", size=1), [(11, 8.0, 1)])
+        self.assertEqual(await self.board("goals", league_id=2), [(14, 20.0, 1)])
+
+        async with self.factory() as session:
+            [entry] = await compute_leaderboard(session, 1, "goals", 1)
+        self.assertEqual(entry["player_name"], "P11")
+        self.assertEqual(entry["team_name"], "Flamengo")
+        self.assertEqual(entry["team_logo_url"], "127.png")
+        self.assertEqual(entry["minutes"], 700)
+
+
+class TestRefreshLeaderboards(LeaderboardDbTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        # Linhas de um cálculo anterior, nas duas ligas
+        stale = dict(metric="goals", position=1, rank=1, value=1)
+        async with self.factory() as session:
+            session.add_all(
+                [
+                    PlayerLeaderboard(
+                        league_id=1, base_player_api_id=13, league_team_id=2, **stale
+                    ),
+                    PlayerLeaderboard(
+                        league_id=2, base_player_api_id=14, league_team_id=3, **stale
+                    ),
+                ]
+            )
+            await session.commit()
+
+    async def test_replaces_rows_of_the_league_only(self):
+        report = await refresh_leaderboards(1)
+
+        self.assertEqual(
+            report,
+            {
+                "league_id": 1,
+                "metrics": {
+                    "goals": 3,
+                    "assists": 3,
+                    "rating": 3,
+                    "yellow_cards": 1,
+                    "red_cards": 0,
+                    "clean_sheets": 0,
+                },
+            },
+        )
+        stored = await self.stored()
+        self.assertEqual(
+            [row for row in stored if row[0] == "goals"],
+            [("goals", 1, 11), ("goals", 2, 10), ("goals", 3, 12)],
+        )
+        self.assertEqual(len(stored), 10)
+        self.assertEqual(await self.stored(league_id=2), [("goals", 1, 14)])
+
+    async def test_fills_the_cache(self):
+        await refresh_leaderboards(1)
+
+        async def build():
+            raise AssertionError("o ranking deveria vir do cache")
+
+        for metric in LEADERBOARD_METRICS:
+            board = await self.cache.get((1, metric), build)
+            self.assertEqual(board["league_id"], 1)
+            self.assertEqual(board["metric"], metric)
+        board = await self.cache.get((1, "goals"), build)
+        self.assertEqual(
+            [entry["base_player_api_id"] for entry in board["entries"]], [11, 10, 12]
+        )
+        self.assertEqual(board["entries"][0]["value"], 8.0)
+        self.assertNotIn("position", board["entries"][0])
+
+
+class TestLeaderboardRoutes(LeaderboardDbTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        app = FastAPI()
+        app.include_router(leagues.router, prefix="/leagues")
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        )
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        await super().asyncTearDown()
+
+    async def get(self, path, **params):
+        response = await self.client.get(path, params=params)
+        self.assertEqual(response.status_code, 200, response.text)
+        return response.json()
+
+    async def test_metric_board_is_served_from_the_table(self):
+        await refresh_leaderboards(1)
+        # Sem cache, a rota lê a tabela pré-calculada
+        self.cache.invalidate_leagues([1])
+
+        board = await self.get("/leagues/1/leaderboards/goals", limit=2)
+
+        self.assertEqual(board["league_id"], 1)
+        self.assertEqual(board["metric"], "goals")
+        self.assertIsNotNone(board["refreshed_at"])
+        self.assertEqual(
+            [
+                (entry["rank"], entry["base_player_api_id"], entry["value"])
+                for entry in board["entries"]
+            ],
+            [(1, 11, 8.0), (1, 10, 8.0)],
+        )
+        self.assertEqual(board["entries"][0]["player_name"], "P11")
+        self.assertEqual(board["entries"][0]["team_name"], "Flamengo")
+
+    async def test_all_boards(self):
+        await refresh_leaderboards(1)
+
+        boards = await self.get("/leagues/1/leaderboards", limit=1)
+
+        self.assertEqual(
+            [board["metric"] for board in boards], list(LEADERBOARD_METRICS)
+        )
+        by_metric = {board["metric"]: board["entries"] for board in boards}
+        self.assertEqual([e["base_player_api_id"] for e in by_metric["goals"]], [11])
+        self.assertEqual([e["base_player_api_id"] for e in by_metric["rating"]], [10])
+        self.assertEqual(by_metric["red_cards"], [])
+
+    async def test_league_without_refresh_has_empty_boards(self):
+        board = await self.get("/leagues/2/leaderboards/assists")
+        self.assertEqual(board["entries"], [])
+        self.assertIsNone(board["refreshed_at"])
+
+    async def test_unknown_metric(self):
+        response = await self.client.get("/leagues/1/leaderboards/saves")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json()["detail"], "Unknown leaderboard metric")
+
+
+if __name__ == "__main__":
+    unittest.main()
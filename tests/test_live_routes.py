@@ -0,0 +1,74 @@
+import asyncio
+import unittest
+
+from integrations.broker import broker, fixture_event
+from routes.live import websocket_updates
+
+
+class FakeWebSocket:
+    """Cliente que se conecta, não recebe nada e vai embora."""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = None
+        self._messages = asyncio.Queue()
+
+    async def accept(self):
+        pass
+
+    async def close(self, code=1000, reason=None):
+        self.closed = (code, reason)
+
+    async def receive(self):
+        return await self._messages.get()
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    def disconnect(self):
+        self._messages.put_nowait({"type": "websocket.disconnect", "code": 1000})
+
+
+class TestWebSocketUpdates(unittest.IsolatedAsyncioTestCase):
+    async def test_quiet_client_disconnect_unsubscribes(self):
+        before = broker.subscriber_count()
+        websocket = FakeWebSocket()
+        handler = asyncio.ensure_future(websocket_updates(websocket, fixture="999999"))
+        await asyncio.sleep(0.01)
+        self.assertEqual(broker.subscriber_count(), before + 1)
+
+        websocket.disconnect()
+        await asyncio.wait_for(handler, timeout=1)
+
+        self.assertEqual(broker.subscriber_count(), before)
+        self.assertEqual(websocket.sent, [])
+
+    async def test_delivers_events_until_disconnect(self):
+        websocket = FakeWebSocket()
+        handler = asyncio.ensure_future(websocket_updates(websocket, league="77"))
+        await asyncio.sleep(0.01)
+        row = {
+            "api_id": 1,
+            "league_id": 77,
+            "status": "First Half",
+            "status_short": "1H",
+            "elapsed": 5,
+            "home_team_score_goals": 0,
+            "away_team_score_goals": 0,
+        }
+        # Entrega local, sem depender do backend configurado
+        broker._deliver([fixture_event(row, 10, 11)])
+        await asyncio.sleep(0.01)
+
+        websocket.disconnect()
+        await asyncio.wait_for(handler, timeout=1)
+        self.assertEqual([event["api_id"] for event in websocket.sent], [1])
+
+    async def test_invalid_topics_close_the_socket(self):
+        websocket = FakeWebSocket()
+        await websocket_updates(websocket, fixture="abc")
+        self.assertEqual(websocket.closed[0], 1008)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from integrations import live_updater as live_updater_module
+from integrations.live_updater import LIVE_COLUMNS, LiveUpdater
+
+# Os mappers só são configurados com todos os modelos importados, como no app
+from models import (  # noqa: F401
+    base_coach,
+    base_player,
+    base_team,
+    country,
+    fixture,
+    league,
+    league_team,
+    user,
+    venue,
+)
+
+
+def api_fixture(api_id, home_goals, away_goals, status_short="1H", elapsed=30):
+    """Item de /fixtures no formato da api-sports."""
+    return {
+        "fixture": {
+            "id": api_id,
+            "date": "2023-05-01T19:00:00+00:00",
+            "status": {"long": status_short, "short": status_short, "elapsed": elapsed},
+        },
+        "league": {"id": 71, "season": 2023, "round": "Regular Season - 1"},
+        "teams": {"home": {"id": 121}, "away": {"id": 130}},
+        "goals": {"home": home_goals, "away": away_goals},
+    }
+
+
+def db_row(api_id, home_goals, away_goals, status_short="1H", elapsed=30):
+    """Linha devolvida pela consulta de _load_new."""
+    return SimpleNamespace(
+        api_id=api_id,
+        league_id=5,
+        home_team_id=50,
+        away_team_id=51,
+        home_team_api_id=121,
+        away_team_api_id=130,
+        home_team_score_goals=home_goals,
+        away_team_score_goals=away_goals,
+        status=status_short,
+        status_short=status_short,
+        elapsed=elapsed,
+    )
+
+
+class FakeApi:
+    """Responde /fixtures?live= e /fixtures?ids= com as partidas programadas."""
+
+    def __init__(self):
+        self.live = []
+        self.by_id = {}
+        self.calls = []
+
+    async def get_json(self, endpoint, params=None, priority=None):
+        self.calls.append(params)
+        if "ids" in params:
+            ids = [int(api_id) for api_id in params["ids"].split("-")]
+            return {"response": [self.by_id[api_id] for api_id in ids]}
+        return {"response": self.live}
+
+
+class FakeSession:
+    """Devolve as linhas do banco na consulta e registra os UPDATEs em lote."""
+
+    def __init__(self, rows, updates):
+        self.rows = rows
+        self.updates = updates
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement, params=None):
+        if params is not None:
+            self.updates.append(params)
+            return None
+        return list(self.rows)
+
+    async def commit(self):
+        pass
+
+
+class FakeBroker:
+    def __init__(self):
+        self.events = []
+
+    async def publish(self, events):
+        self.events.extend(events)
+
+
+class TestLiveUpdater(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.api = FakeApi()
+        self.rows = []
+        self.updates = []
+        self.broker = FakeBroker()
+        self.standings = []
+
+        async def refresh_standings(session, league_id, league_team_ids):
+            self.standings.append((league_id, league_team_ids))
+
+        patches = [
+            mock.patch.object(live_updater_module, "api_scheduler", self.api),
+            mock.patch.object(
+                live_updater_module,
+                "async_session_factory",
+                lambda: FakeSession(self.rows, self.updates),
+            ),
+            mock.patch.object(live_updater_module, "broker", self.broker),
+            mock.patch.object(
+                live_updater_module, "refresh_standings", refresh_standings
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.updater = LiveUpdater(leagues="all")
+
+    async def start_tracking(self):
+        """Primeiro ciclo: a partida ao vivo é carregada do banco, sem mudanças."""
+        self.api.live = [api_fixture(1001, 0, 0)]
+        self.rows.append(db_row(1001, 0, 0))
+        self.assertEqual(await self.updater.tick(), [])
+        self.rows.clear()
+
+    async def test_nothing_changed_publishes_no_event(self):
+        await self.start_tracking()
+
+        changes = await self.updater.tick()
+
+        self.assertEqual(changes, [])
+        self.assertEqual(self.updates, [])
+        self.assertEqual(self.broker.events, [])
+        self.assertEqual(self.updater.tracked_count(), 1)
+
+    async def test_goal_is_written_and_published(self):
+        await self.start_tracking()
+        self.api.live = [api_fixture(1001, 1, 0, elapsed=31)]
+
+        changes = await self.updater.tick()
+
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0]["home_team_score_goals"], 1)
+        self.assertEqual(self.updates, [changes])
+        self.assertEqual(len(self.broker.events), 1)
+        event = self.broker.events[0]
+        self.assertEqual(event["api_id"], 1001)
+        self.assertEqual(event["league_id"], 5)
+        self.assertEqual(event["home_team_api_id"], 121)
+        self.assertEqual(event["home_team_score_goals"], 1)
+        self.assertEqual(self.standings, [])
+
+        # O estado em memória passa a ser o gravado: o mesmo placar não gera evento
+        self.assertEqual(await self.updater.tick(), [])
+        self.assertEqual(len(self.broker.events), 1)
+
+    async def test_status_change_is_published(self):
+        await self.start_tracking()
+        self.api.live = [api_fixture(1001, 0, 0, status_short="HT", elapsed=45)]
+
+        changes = await self.updater.tick()
+
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(self.broker.events[0]["status_short"], "HT")
+        self.assertEqual(self.broker.events[0]["elapsed"], 45)
+
+    async def test_fixture_no_longer_live_gets_final_result(self):
+        await self.start_tracking()
+        self.api.live = []
+        self.api.by_id[1001] = api_fixture(1001, 2, 1, status_short="FT", elapsed=90)
+
+        changes = await self.updater.tick()
+
+        self.assertEqual(self.api.calls[-1], {"ids": "1001"})
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(
+            {column: changes[0][column] for column in LIVE_COLUMNS},
+            {
+                "home_team_score_goals": 2,
+                "away_team_score_goals": 1,
+                "status": "FT",
+                "status_short": "FT",
+                "elapsed": 90,
+            },
+        )
+        self.assertEqual(self.broker.events[0]["status_short"], "FT")
+        # Partida encerrada: a classificação das duas equipes é recalculada
+        self.assertEqual(self.standings, [(5, {50, 51})])
+        self.assertEqual(self.updater.tracked_count(), 0)
+
+    async def test_fixture_not_ingested_is_ignored(self):
+        self.api.live = [api_fixture(2002, 1, 0)]
+
+        changes = await self.updater.tick()
+
+        self.assertEqual(changes, [])
+        self.assertEqual(self.broker.events, [])
+        self.assertEqual(self.updater.tracked_count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
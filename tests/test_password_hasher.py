@@ -0,0 +1,35 @@
+import asyncio
+import threading
+import unittest
+
+from utils.security import PasswordHasher
+
+
+class TestPasswordHasherPending(unittest.IsolatedAsyncioTestCase):
+    async def test_cancelled_before_start_releases_slot(self):
+        hasher = PasswordHasher(workers=1, max_pending=2)
+        release = threading.Event()
+        blocker = asyncio.ensure_future(hasher._submit(release.wait))
+        await asyncio.sleep(0.05)
+
+        # Fica na fila atrás do bloqueio e é cancelado antes de começar
+        queued = asyncio.ensure_future(hasher._submit(lambda: "nunca"))
+        await asyncio.sleep(0)
+        queued.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await queued
+
+        release.set()
+        await blocker
+        await asyncio.sleep(0.05)
+
+        metrics = hasher.metrics()
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertEqual(metrics["running"], 0)
+        self.assertEqual(await hasher._submit(lambda: "ok"), "ok")
+        self.assertEqual(await hasher._submit(lambda: "ok"), "ok")
+        hasher.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from integrations.payload_cache import (
+    PayloadCache,
+    cache_key,
+    cache_file_name,
+    LIVE_TTL,
+    ENDPOINT_TTLS,
+)
+from integrations.payload_storage import open_payload, write_payload
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeDownload:
+    """Download falso: devolve as respostas programadas e registra os validadores."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    async def __call__(self, validators):
+        self.calls.append(validators)
+        await asyncio.sleep(0)
+        return self.responses.pop(0)
+
+
+def payload(*items):
+    return {"errors": [], "results": len(items), "response": list(items)}
+
+
+class CacheKeyTest(unittest.TestCase):
+    def test_key_ignores_param_order_and_value_types(self):
+        self.assertEqual(
+            cache_key("/fixtures", {"league": 71, "season": 2023}),
+            cache_key("/fixtures", {"season": "2023", "league": "71", "team": None}),
+        )
+        self.assertNotEqual(
+            cache_key("/fixtures", {"league": 71}), cache_key("/teams", {"league": 71})
+        )
+
+    def test_file_name_is_prefixed_by_endpoint(self):
+        self.assertTrue(
+            cache_file_name("/fixtures/statistics").startswith(
+                "cache/fixtures_statistics_"
+            )
+        )
+
+
+class PayloadCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def cache(self, **kwargs):
+        kwargs.setdefault("max_bytes", 10 * 1024 * 1024)
+        kwargs.setdefault("eviction_grace", 0)
+        return PayloadCache(json_dir=self.tmp.name, clock=self.clock, **kwargs)
+
+    def read(self, file_name):
+        with open_payload(os.path.join(self.tmp.name, file_name)) as json_file:
+            return json.load(json_file)
+
+    def test_fresh_payload_is_served_from_disk(self):
+        cache = self.cache()
+        download = FakeDownload((payload(1), {}), (payload(2), {}))
+
+        first = asyncio.run(cache.get("/countries", None, download))
+        self.clock.now += ENDPOINT_TTLS["/countries"] - 1
+        second = asyncio.run(cache.get("/countries", None, download))
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(download.calls), 1)
+        self.assertEqual(self.read(first)["response"], [1])
+
+    def test_live_fixtures_expire_in_seconds(self):
+        cache = self.cache()
+        download = FakeDownload((payload(1), {}), (payload(2), {}))
+        params = {"live": "all"}
+
+        asyncio.run(cache.get("/fixtures", params, download))
+        self.clock.now += LIVE_TTL + 1
+        file_name = asyncio.run(cache.get("/fixtures", params, download))
+
+        self.assertEqual(len(download.calls), 2)
+        self.assertEqual(self.read(file_name)["response"], [2])
+
+    def test_max_age_is_kept_as_the_entry_ttl(self):
+        cache = self.cache()
+        download = FakeDownload((payload(1), {}))
+
+        asyncio.run(cache.get("/countries", None, download, max_age=60))
+        self.assertTrue(cache.is_fresh("/countries"))
+        self.clock.now += 61
+
+        self.assertFalse(cache.is_fresh("/countries"))
+        self.assertFalse(self.cache().is_fresh("/countries"))
+
+    def test_stale_payload_is_revalidated_with_etag(self):
+        cache = self.cache()
+        download = FakeDownload((payload(1), {"etag": '"v1"'}), (None, {}))
+
+        asyncio.run(cache.get("/teams", {"league": 71}, download))
+        self.clock.now += ENDPOINT_TTLS["/teams"] + 1
+        file_name = asyncio.run(cache.get("/teams", {"league": 71}, download))
+
+        self.assertEqual(download.calls[1], {"If-None-Match": '"v1"'})
+        self.assertEqual(self.read(file_name)["response"], [1])
+        self.assertTrue(cache.is_fresh("/teams", {"league": 71}))
+
+    def test_concurrent_requests_share_one_download(self):
+        cache = self.cache()
+        download = FakeDownload((payload(1), {}))
+
+        async def fetch_twice():
+            return await asyncio.gather(
+                cache.get("/leagues", {"id": 71}, download),
+                cache.get("/leagues", {"id": 71}, download),
+            )
+
+        first, second = asyncio.run(fetch_twice())
+        self.assertEqual(first, second)
+        self.assertEqual(len(download.calls), 1)
+
+    def test_least_recently_used_payloads_are_evicted(self):
+        size = write_payload(
+            os.path.join(self.tmp.name, "size.json.gz"), payload(*range(50))
+        )
+        cache = self.cache(max_bytes=int(size * 2.5))
+        download = FakeDownload(*[(payload(*range(50)), {}) for _ in range(3)])
+
+        recent = asyncio.run(cache.get("/teams", {"league": 1}, download))
+        self.clock.now += 1
+        least_recent = asyncio.run(cache.get("/teams", {"league": 2}, download))
+        self.clock.now += 1
+        # Acessar a liga 1 de novo a torna a mais recente
+        asyncio.run(cache.get("/teams", {"league": 1}, download))
+        self.clock.now += 1
+        asyncio.run(cache.get("/teams", {"league": 3}, download))
+
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, recent)))
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, least_recent)))
+
+    def test_recently_served_payloads_are_not_evicted(self):
+        size = write_payload(
+            os.path.join(self.tmp.name, "size.json.gz"), payload(*range(50))
+        )
+        cache = self.cache(max_bytes=int(size * 1.5), eviction_grace=10)
+        download = FakeDownload(*[(payload(*range(50)), {}) for _ in range(3)])
+
+        first = asyncio.run(cache.get("/teams", {"league": 1}, download))
+        self.clock.now += 1
+        second = asyncio.run(cache.get("/teams", {"league": 2}, download))
+        # Acima do limite, mas o primeiro foi servido há 1s e ainda pode ser aberto
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, first)))
+
+        self.clock.now += 20
+        third = asyncio.run(cache.get("/teams", {"league": 3}, download))
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, first)))
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, second)))
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, third)))
+
+    def test_payload_is_replaced_atomically(self):
+        path = os.path.join(self.tmp.name, "teams.json.gz")
+        write_payload(path, payload(1))
+
+        with open_payload(path) as reader:
+            write_payload(path, payload(2))
+            # Quem já abriu o arquivo continua lendo o payload inteiro anterior
+            self.assertEqual(json.load(reader)["response"], [1])
+        self.assertEqual(self.read("teams.json.gz")["response"], [2])
+
+        with self.assertRaises(TypeError):
+            write_payload(path, payload(object()))
+        self.assertEqual(self.read("teams.json.gz")["response"], [2])
+        self.assertEqual(os.listdir(self.tmp.name), ["teams.json.gz"])
+
+    def test_concurrent_evictions_keep_index_consistent(self):
+        size = write_payload(
+            os.path.join(self.tmp.name, "size.json.gz"), payload(*range(50))
+        )
+        cache = self.cache(max_bytes=int(size * 3.5))
+        download = FakeDownload(*[(payload(*range(50)), {}) for _ in range(40)])
+
+        async def fetch_all():
+            return await asyncio.gather(
+                *(
+                    cache.get("/teams", {"league": league}, download)
+                    for league in range(40)
+                )
+            )
+
+        files = asyncio.run(fetch_all())
+
+        self.assertEqual(len(files), 40)
+        with open(cache._index_path) as index_file:
+            saved = json.load(index_file)
+        self.assertEqual(saved, cache._index)
+        self.assertLessEqual(len(saved), 3)
+        for entry in saved.values():
+            self.assertTrue(os.path.exists(os.path.join(self.tmp.name, entry["file"])))
+
+    def test_index_survives_restart(self):
+        download = FakeDownload((payload(1), {}))
+        asyncio.run(self.cache().get("/countries", None, download))
+
+        self.assertTrue(self.cache().is_fresh("/countries"))
+
+
+if __name__ == "__main__":
+    unittest.main()
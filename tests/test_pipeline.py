@@ -0,0 +1,356 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from database.database import Base
+from integrations import (
+    countries_processor,
+    fixtures_processor,
+    league_processor,
+    league_teams_processor,
+    pipeline,
+    profiles_processor,
+    reference_cache,
+    standings,
+    teams_processor,
+    venues_processor,
+)
+from integrations.payload_cache import cache_file_name
+from integrations.payload_storage import write_payload
+from integrations.pipeline import (
+    BLOCKED,
+    FAILED,
+    RAN,
+    SKIPPED,
+    Stage,
+    reported_failures,
+    league_season_stages,
+    run_pipeline,
+)
+from integrations.reference_cache import country_cache
+
+# Todas as tabelas são criadas no SQLite, como no app
+from models import (  # noqa: F401
+    base_coach,
+    base_player,
+    base_team,
+    country,
+    fixture,
+    fixture_lineup,
+    fixture_player_stat,
+    fixture_statistic,
+    ingestion_job,
+    league,
+    league_classification,
+    league_team,
+    player_leaderboard,
+    player_season_stat,
+    user,
+    venue,
+)
+from models.base_player import BasePlayer
+from models.base_team import BaseTeam
+from models.country import Country
+from models.fixture import Fixture
+from models.league import League
+from models.league_team import LeagueTeam
+from models.venue import Venue
+
+LEAGUE, SEASON = 71, 2023
+
+
+def api_fixture(api_id, day, home, away):
+    return {
+        "fixture": {
+            "id": api_id,
+            "date": f"2023-04-{day:02d}T19:00:00+00:00",
+            "venue": {"id": 500},
+            "status": {"long": "Match Finished", "short": "FT", "elapsed": 90},
+        },
+        "league": {"id": LEAGUE, "season": SEASON, "round": "Regular Season - 1"},
+        "teams": {"home": {"id": home}, "away": {"id": away}},
+        "goals": {"home": 1, "away": 0},
+    }
+
+
+def payloads(capacity=78000):
+    """Respostas da API, por endpoint, para o onboarding de uma liga-temporada."""
+    team = lambda api_id, name: {  # noqa: E731
+        "team": {"id": api_id, "name": name, "country": "Brazil", "logo": "l"},
+        "venue": {"id": 500, "name": "Maracanã"},
+    }
+    return {
+        "/countries": [
+            {"name": "Brazil", "code": "BR", "flag": "br.svg"},
+            {"name": "Argentina", "code": "AR", "flag": "ar.svg"},
+        ],
+        "/venues": [
+            {
+                "id": 500,
+                "name": "Maracanã",
+                "city": "Rio de Janeiro",
+                "country": "Brazil",
+                "capacity": capacity,
+            }
+        ],
+        "/teams": [team(121, "Palmeiras"), team(127, "Flamengo")],
+        "/leagues": [
+            {
+                "league": {"id": LEAGUE, "name": "Serie A", "type": "League"},
+                "country": {"name": "Brazil"},
+                "seasons": [
+                    {"year": SEASON, "start": "2023-04-15", "end": "2023-12-06"}
+                ],
+            }
+        ],
+        "/fixtures": [
+            api_fixture(1001, 15, 121, 127),
+            api_fixture(1002, 22, 127, 121),
+        ],
+        "/players": [
+            {"player": {"id": 10, "name": "Endrick", "nationality": "Brazil"}},
+        ],
+    }
+
+
+class TestReportedFailures(unittest.TestCase):
+    def test_counts_failed_keys(self):
+        self.assertEqual(reported_failures({"failed": 2, "rows_failed": 3}), 5)
+        self.assertEqual(reported_failures({"inserted": 4, "not_fetched": 1}), 0)
+        self.assertEqual(reported_failures(10), 0)
+        self.assertEqual(reported_failures(None), 0)
+
+
+class TestRunPipeline(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # O pipeline lê os arquivos e o estado de json/ no diretório atual
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        os.mkdir("json")
+        with open(os.path.join("json", "teams.json"), "w") as file:
+            file.write('{"response": []}')
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def stages(self, process):
+        async def dependent(file_name):
+            return 0
+
+        return [
+            Stage("teams", process, "teams.json"),
+            Stage("league_teams", dependent, "teams.json", depends_on=["teams"]),
+        ]
+
+    async def test_reported_failure_fails_stage_and_keeps_no_hash(self):
+        async def failing(file_name):
+            return {"inserted": 1, "failed": 2}
+
+        async def succeeding(file_name):
+            return {"inserted": 3, "failed": 0}
+
+        report = await run_pipeline(self.stages(failing))
+
+        self.assertEqual(report["teams"]["status"], FAILED)
+        self.assertEqual(report["teams"]["result"]["failed"], 2)
+        self.assertEqual(report["league_teams"]["status"], BLOCKED)
+
+        # O arquivo não mudou, mas a etapa que falhou roda de novo
+        report = await run_pipeline(self.stages(succeeding))
+        self.assertEqual(report["teams"]["status"], RAN)
+        self.assertEqual(report["league_teams"]["status"], RAN)
+
+        report = await run_pipeline(self.stages(succeeding))
+        self.assertEqual(report["teams"]["status"], SKIPPED)
+
+    async def test_failure_discards_previous_hash(self):
+        async def succeeding(file_name):
+            return 1
+
+        async def raising(file_name):
+            raise ValueError("payload inválido")
+
+        await run_pipeline(self.stages(succeeding))
+        report = await run_pipeline(self.stages(raising), force=True)
+        self.assertEqual(report["teams"]["status"], FAILED)
+
+        report = await run_pipeline(self.stages(succeeding))
+        self.assertEqual(report["teams"]["status"], RAN)
+
+    async def test_failed_fetch_does_not_process_stale_file(self):
+        processed = []
+
+        async def process(file_name):
+            processed.append(file_name)
+            return 1
+
+        async def failed_fetch(*args, **kwargs):
+            return None
+
+        stage = Stage("teams", process, "teams.json", fetch=("/teams", None))
+        with mock.patch.object(pipeline, "fetch_and_save_to_json", failed_fetch):
+            report = await run_pipeline([stage])
+
+        self.assertEqual(report["teams"]["status"], FAILED)
+        self.assertEqual(processed, [])
+
+
+class TestLeagueSeasonPipeline(unittest.IsolatedAsyncioTestCase):
+    """Onboarding de uma liga-temporada contra um SQLite, com a API simulada."""
+
+    async def asyncSetUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        os.mkdir("json")
+
+        self.engine = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(self.tmp.name, 'pipeline.db')}"
+        )
+        self.factory = async_sessionmaker(
+            self.engine, class_=AsyncSession, expire_on_commit=False
+        )
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        self.payloads = payloads()
+
+        async def fetch(endpoint, params=None, **kwargs):
+            file_name = cache_file_name(endpoint, params)
+            data = {"errors": [], "response": self.payloads[endpoint]}
+            write_payload(os.path.join("json", file_name), data)
+            return file_name
+
+        async def no_fixture_data(league, season):
+            return {"fetched": 0, "failed": 0}
+
+        patches = [
+            mock.patch.object(pipeline, "fetch_and_save_to_json", fetch),
+            mock.patch.object(pipeline, "ingest_fixture_statistics", no_fixture_data),
+            mock.patch.object(pipeline, "ingest_fixture_players", no_fixture_data),
+            mock.patch.object(pipeline, "ingest_league_coaches", no_fixture_data),
+            # Cada teste roda num event loop novo; o lock do cache é do módulo
+            mock.patch.object(country_cache, "_lock", asyncio.Lock()),
+        ]
+        for module in (
+            countries_processor,
+            venues_processor,
+            teams_processor,
+            league_processor,
+            league_teams_processor,
+            fixtures_processor,
+            profiles_processor,
+            reference_cache,
+            standings,
+        ):
+            patches.append(
+                mock.patch.object(module, "async_session_factory", self.factory)
+            )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        country_cache.invalidate()
+
+    async def asyncTearDown(self):
+        country_cache.invalidate()
+        await self.engine.dispose()
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    async def run_stages(self, force=False):
+        return await run_pipeline(
+            league_season_stages(LEAGUE, SEASON, "Brazil"), force=force
+        )
+
+    async def counts(self):
+        async with self.factory() as session:
+            return {
+                model.__tablename__: await session.scalar(
+                    select(func.count()).select_from(model)
+                )
+                for model in (
+                    Country,
+                    Venue,
+                    BaseTeam,
+                    League,
+                    LeagueTeam,
+                    Fixture,
+                    BasePlayer,
+                )
+            }
+
+    async def test_same_league_season_runs_twice(self):
+        report = await self.run_stages()
+        self.assertEqual(
+            {stage["status"] for stage in report.values()}, {RAN}, report
+        )
+        first = await self.counts()
+        self.assertEqual(
+            first,
+            {
+                "countries": 2,
+                "venues": 1,
+                "base_teams": 2,
+                "leagues": 1,
+                "league_teams": 2,
+                "fixtures": 2,
+                "base_players": 1,
+            },
+        )
+
+        # Mesmo banco, tudo reprocessado: nenhuma etapa falha nem duplica linhas
+        self.payloads = payloads(capacity=80000)
+        report = await self.run_stages(force=True)
+        self.assertEqual(
+            {stage["status"] for stage in report.values()}, {RAN}, report
+        )
+        self.assertEqual(await self.counts(), first)
+        async with self.factory() as session:
+            self.assertEqual(await session.scalar(select(Venue.capacity)), 80000)
+
+        # Sem mudanças nos arquivos, as etapas com arquivo são puladas
+        report = await self.run_stages()
+        self.assertEqual(report["countries"]["status"], SKIPPED)
+        self.assertEqual(report["fixtures"]["status"], SKIPPED)
+
+    async def test_profiles_write_error_fails_stage(self):
+        self.payloads["/players"].append(
+            {"player": {"id": 13, "name": "Vitor Roque", "nationality": "Brazil"}}
+        )
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "CREATE TRIGGER reject_player BEFORE INSERT ON base_players "
+                    "WHEN NEW.api_id = 13 BEGIN SELECT RAISE(ABORT, 'rejeitado'); END"
+                )
+            )
+
+        report = await self.run_stages()
+
+        # O bloco perdido no banco falha a etapa em vez de sumir do relatório
+        self.assertEqual(report["player_profiles"]["status"], FAILED)
+        self.assertEqual(report["player_profiles"]["result"]["failed"], 2)
+        self.assertEqual(report["players"]["status"], BLOCKED)
+        self.assertEqual(report["fixtures"]["status"], RAN)
+        self.assertEqual((await self.counts())["base_players"], 0)
+
+        async with self.engine.begin() as conn:
+            await conn.execute(text("DROP TRIGGER reject_player"))
+
+        # O hash não foi gravado: o mesmo arquivo é reprocessado
+        report = await self.run_stages()
+        self.assertEqual(report["player_profiles"]["status"], RAN)
+        self.assertEqual(report["player_profiles"]["result"]["inserted"], 2)
+        self.assertEqual(report["players"]["status"], RAN)
+        self.assertEqual((await self.counts())["base_players"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+from datetime import date
+
+from integrations.profiles_processor import content_hash
+
+
+class TestContentHash(unittest.TestCase):
+    def setUp(self):
+        self.profile = {
+            "api_id": 10,
+            "name": "P. Silva",
+            "birth_date": date(1998, 2, 3),
+            "nationality_id": 24,
+            "injured": False,
+        }
+
+    def test_independent_of_key_order(self):
+        reordered = dict(reversed(list(self.profile.items())))
+        self.assertEqual(content_hash(self.profile), content_hash(reordered))
+
+    def test_changes_with_any_field(self):
+        changed = {**self.profile, "injured": True}
+        self.assertNotEqual(content_hash(self.profile), content_hash(changed))
+        changed = {**self.profile, "nationality_id": None}
+        self.assertNotEqual(content_hash(self.profile), content_hash(changed))
+
+
+if __name__ == "__main__":
+    unittest.main()
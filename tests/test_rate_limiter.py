@@ -0,0 +1,161 @@
+import asyncio
+import time
+import unittest
+
+import httpx
+
+from integrations.rate_limiter import (
+    ApiScheduler,
+    TokenBucket,
+    LIVE,
+    BACKFILL,
+    QuotaExhaustedError,
+    RateLimitExceededError,
+)
+
+
+class FakeApi:
+    """API falsa local: devolve as respostas programadas e registra as chamadas."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def handler(self, request):
+        self.calls.append((time.monotonic(), request.url.path, dict(request.url.params)))
+        status_code, headers, body = self.responses.pop(0) if self.responses else (
+            200,
+            {},
+            {"errors": [], "response": []},
+        )
+        return httpx.Response(status_code, headers=headers, json=body)
+
+    def scheduler(self, **kwargs):
+        client = httpx.AsyncClient(
+            base_url="http://fake-api", transport=httpx.MockTransport(self.handler)
+        )
+        kwargs.setdefault("backoff_base", 0.01)
+        kwargs.setdefault("backoff_max", 0.02)
+        return ApiScheduler(client_factory=lambda: client, **kwargs)
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_refill_is_capped_by_capacity(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=2, capacity=3, clock=lambda: now[0])
+        for _ in range(3):
+            self.assertEqual(bucket.time_until_available(), 0)
+            bucket.take()
+        self.assertAlmostEqual(bucket.time_until_available(), 0.5)
+        now[0] = 100
+        bucket.time_until_available()
+        self.assertEqual(bucket.tokens, 3)
+
+
+class TestApiScheduler(unittest.TestCase):
+
+    def test_paces_requests_at_bucket_rate(self):
+        api = FakeApi([])
+        scheduler = api.scheduler(rate_per_minute=600, burst=1)  # 10 req/s
+
+        async def run():
+            await asyncio.gather(*(scheduler.get_json("/status") for _ in range(4)))
+
+        start = time.monotonic()
+        asyncio.run(run())
+        # 1 token inicial + 3 tokens a 10/s
+        self.assertGreaterEqual(time.monotonic() - start, 0.28)
+        self.assertEqual(len(api.calls), 4)
+
+    def test_live_lane_is_served_before_backfill(self):
+        api = FakeApi([])
+        scheduler = api.scheduler(rate_per_minute=1200, burst=1)
+
+        async def run():
+            backfill = [
+                asyncio.create_task(
+                    scheduler.get_json("/fixtures", {"n": i}, priority=BACKFILL)
+                )
+                for i in range(3)
+            ]
+            await asyncio.sleep(0)
+            live = asyncio.create_task(
+                scheduler.get_json("/fixtures", {"live": "all"}, priority=LIVE)
+            )
+            await asyncio.gather(*backfill, live)
+
+        asyncio.run(run())
+        order = [params for _, _, params in api.calls]
+        # O primeiro pedido usa o token inicial; o ao vivo vem logo depois
+        self.assertEqual(order[1], {"live": "all"})
+
+    def test_retries_429_and_rate_limit_body_then_succeeds(self):
+        api = FakeApi(
+            [
+                (429, {}, {}),
+                (200, {}, {"errors": {"rateLimit": "Too many requests"}}),
+                (200, {}, {"errors": [], "response": [1, 2]}),
+            ]
+        )
+        scheduler = api.scheduler(rate_per_minute=6000, burst=5)
+        data = asyncio.run(scheduler.get_json("/teams"))
+        self.assertEqual(data["response"], [1, 2])
+        self.assertEqual(len(api.calls), 3)
+
+    def test_gives_up_after_max_retries(self):
+        api = FakeApi([(503, {}, {})] * 3)
+        scheduler = api.scheduler(rate_per_minute=6000, max_retries=2)
+        with self.assertRaises(httpx.HTTPStatusError):
+            asyncio.run(scheduler.get_json("/teams"))
+        self.assertEqual(len(api.calls), 3)
+
+        api = FakeApi([(429, {}, {})] * 2)
+        scheduler = api.scheduler(rate_per_minute=6000, max_retries=1)
+        with self.assertRaises(RateLimitExceededError):
+            asyncio.run(scheduler.get_json("/teams"))
+
+    def test_quota_headers_adjust_rate_and_reserve_daily_quota(self):
+        api = FakeApi(
+            [
+                (
+                    200,
+                    {
+                        "x-ratelimit-limit": "300",
+                        "x-ratelimit-remaining": "299",
+                        "x-ratelimit-requests-remaining": "10",
+                    },
+                    {"errors": [], "response": []},
+                )
+            ]
+        )
+        scheduler = api.scheduler(rate_per_minute=60, daily_reserve=10)
+        asyncio.run(scheduler.get_json("/leagues"))
+        self.assertEqual(scheduler._bucket.rate, 5)
+        self.assertEqual(scheduler.daily_remaining, 10)
+
+        with self.assertRaises(QuotaExhaustedError):
+            asyncio.run(scheduler.get_json("/leagues", priority=BACKFILL))
+        # A faixa ao vivo ainda pode usar a reserva
+        asyncio.run(scheduler.get_json("/fixtures", {"live": "all"}, priority=LIVE))
+
+    def test_daily_quota_is_released_at_utc_midnight(self):
+        headers = {"x-ratelimit-requests-remaining": "5"}
+        api = FakeApi([(200, headers, {"errors": [], "response": []})])
+        now = [3 * 86400 + 23 * 3600]  # 23h UTC
+        scheduler = api.scheduler(daily_reserve=10, clock=lambda: now[0])
+        asyncio.run(scheduler.get_json("/leagues"))
+
+        now[0] += 30 * 60
+        with self.assertRaises(QuotaExhaustedError):
+            asyncio.run(scheduler.get_json("/leagues", priority=BACKFILL))
+
+        # Depois da meia-noite UTC a leitura de ontem não bloqueia mais
+        now[0] += 60 * 60
+        asyncio.run(scheduler.get_json("/leagues", priority=BACKFILL))
+        self.assertEqual(len(api.calls), 2)
+        self.assertIsNone(scheduler.daily_remaining)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from database.replica import ReplicaRouter
+
+
+class TestReplicaRouter(unittest.TestCase):
+    """Duas instâncias SQLite fazem o papel do primário e da réplica."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.primary = self._engine("primary.db")
+        self.replica = self._engine("replica.db")
+        self.primary_factory = async_sessionmaker(self.primary, class_=AsyncSession)
+        self.replica_factory = async_sessionmaker(self.replica, class_=AsyncSession)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _engine(self, name: str):
+        path = os.path.join(self.tmpdir.name, name)
+        return create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+    def _router(self, replica_engine=None, **options):
+        return ReplicaRouter(
+            self.primary_factory,
+            replica_engine or self.replica,
+            self.replica_factory,
+            **options,
+        )
+
+    async def _database_name(self, router) -> str:
+        async with router.reader_factory()() as session:
+            return await session.scalar(text("SELECT name FROM origin"))
+
+    async def _seed(self):
+        for engine, name in ((self.primary, "primary"), (self.replica, "replica")):
+            async with engine.begin() as connection:
+                await connection.execute(text("CREATE TABLE origin (name TEXT)"))
+                await connection.execute(
+                    text("INSERT INTO origin VALUES (:name)"), {"name": name}
+                )
+
+    def test_reads_go_to_primary_until_replica_is_checked(self):
+        router = self._router()
+
+        async def run():
+            await self._seed()
+            before = await self._database_name(router)
+            await router.check()
+            after = await self._database_name(router)
+            await self.primary.dispose()
+            await self.replica.dispose()
+            return before, after
+
+        self.assertEqual(asyncio.run(run()), ("primary", "replica"))
+        self.assertEqual(router.metrics()["replica_reads"], 1)
+        self.assertEqual(router.metrics()["primary_reads"], 1)
+
+    def test_lagging_replica_falls_back_to_primary(self):
+        router = self._router(max_lag=5)
+
+        async def run():
+            await self._seed()
+            await router.check()
+            router.lag = 30
+            name = await self._database_name(router)
+            await self.primary.dispose()
+            await self.replica.dispose()
+            return name
+
+        self.assertEqual(asyncio.run(run()), "primary")
+        self.assertFalse(router.healthy)
+
+    def test_unreachable_replica_falls_back_to_primary(self):
+        unreachable = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(self.tmpdir.name, 'missing', 'x.db')}"
+        )
+        router = self._router(unreachable)
+
+        async def run():
+            await self._seed()
+            await router.check()
+            name = await self._database_name(router)
+            await self.primary.dispose()
+            await self.replica.dispose()
+            return name
+
+        self.assertEqual(asyncio.run(run()), "primary")
+        self.assertIsNone(router.lag)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,315 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from unittest import mock
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.future import select
+
+from database.database import Base
+from integrations import fixture_players, season_stats
+from integrations.fixture_players import PLAYER_COLUMNS, save_player_stats
+from integrations.leaderboards import LeaderboardRefresher
+from integrations.season_stats import (
+    SEASON_AGGREGATES,
+    apply_season_deltas,
+    rebuild_player_season_stats,
+    season_deltas,
+    season_rating,
+)
+
+# Todas as tabelas são criadas no SQLite, como no app
+from models import (  # noqa: F401
+    base_coach,
+    base_player,
+    base_team,
+    country,
+    fixture,
+    fixture_lineup,
+    fixture_player_stat,
+    fixture_statistic,
+    ingestion_job,
+    league,
+    league_classification,
+    league_team,
+    player_leaderboard,
+    player_season_stat,
+    user,
+    venue,
+)
+from models.base_player import BasePlayer
+from models.base_team import BaseTeam
+from models.country import Country
+from models.fixture import Fixture
+from models.league import League
+from models.league_team import LeagueTeam
+from models.player_season_stat import PlayerSeasonStat
+
+
+def totals(**values):
+    return {**dict.fromkeys(SEASON_AGGREGATES, 0), **values}
+
+
+class TestSeasonDeltas(unittest.TestCase):
+    def test_rewriting_same_stats_gives_no_delta(self):
+        state = {(10, 5): totals(goals=2, minutes=180, appearances=2)}
+        self.assertEqual(season_deltas(state, dict(state)), [])
+
+    def test_correction_and_new_player(self):
+        before = {(10, 5): totals(goals=2, minutes=180, appearances=2)}
+        after = {
+            (10, 5): totals(goals=1, minutes=180, appearances=2),
+            (11, 5): totals(goals=1, minutes=30, appearances=1),
+        }
+
+        deltas = {
+            (d["base_player_api_id"], d["league_team_id"]): d
+            for d in season_deltas(before, after)
+        }
+
+        self.assertEqual(deltas[(10, 5)]["goals"], -1)
+        self.assertEqual(deltas[(10, 5)]["minutes"], 0)
+        self.assertEqual(deltas[(11, 5)]["goals"], 1)
+        self.assertEqual(deltas[(11, 5)]["appearances"], 1)
+
+    def test_season_rating(self):
+        self.assertIsNone(season_rating(0, 0))
+        self.assertEqual(season_rating(Decimal("14.61"), 2), Decimal("7.31"))
+        self.assertEqual(season_rating(Decimal("7.25"), 1), Decimal("7.25"))
+        self.assertEqual(season_rating(Decimal("21.95"), 3), Decimal("7.32"))
+
+
+
+def seed():
+    """Liga 1 com as equipes 1 (api 121) e 2 (api 127), duas partidas e jogadores."""
+    rows = [
+        Country(id=1, name="Brazil"),
+        League(id=1, api_id=71, season=2023, name="Serie A", country_id=1),
+        BaseTeam(api_id=121, name="Palmeiras", country_id=1),
+        BaseTeam(api_id=127, name="Flamengo", country_id=1),
+        LeagueTeam(id=1, league_id=1, base_team_api_id=121),
+        LeagueTeam(id=2, league_id=1, base_team_api_id=127),
+        BasePlayer(api_id=10, name="P10", firstname="P10"),
+        BasePlayer(api_id=11, name="P11", firstname="P11"),
+    ]
+    rows += [
+        Fixture(
+            api_id=api_id,
+            league_id=1,
+            season=2023,
+            date=datetime(2023, 4, day, 19, 0),
+            status_short="FT",
+            round="Regular Season - 1",
+            home_team_id=1,
+            away_team_id=2,
+        )
+        for api_id, day in ((1001, 15), (1002, 22))
+    ]
+    return rows
+
+
+def stat_row(fixture_id, league_team_id, player_api_id, minutes, goals, rating):
+    """Linha de fixture_player_stats como a montada por parse_player_stats."""
+    return {
+        **dict.fromkeys(PLAYER_COLUMNS),
+        "fixture_id": fixture_id,
+        "league_team_id": league_team_id,
+        "base_player_api_id": player_api_id,
+        "is_starter": True,
+        "game_minute": minutes,
+        "goals": goals,
+        "game_position": Decimal(rating),
+        "last_updated": datetime(2023, 5, 1),
+    }
+
+
+class SeasonStatsDbTestCase(unittest.IsolatedAsyncioTestCase):
+    """players_season_stats mantida por deltas num banco SQLite temporário."""
+
+    async def asyncSetUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmpdir.name, "season_stats.db")
+        self.engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        self.factory = async_sessionmaker(
+            self.engine, class_=AsyncSession, expire_on_commit=False
+        )
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with self.factory() as session:
+            session.add_all(seed())
+            await session.commit()
+
+        self.refresher = LeaderboardRefresher()
+        patches = [
+            mock.patch.object(season_stats, "async_session_factory", self.factory),
+            mock.patch.object(season_stats, "leaderboard_refresher", self.refresher),
+            mock.patch.object(fixture_players, "leaderboard_refresher", self.refresher),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+        self.tmpdir.cleanup()
+
+    async def write(self, rows):
+        async with self.factory() as session:
+            await save_player_stats(session, rows)
+            await session.commit()
+
+    async def season(self):
+        """players_season_stats por (jogador, equipe)."""
+        async with self.factory() as session:
+            result = await session.execute(select(PlayerSeasonStat))
+            return {
+                (row.base_player_api_id, row.league_team_id): {
+                    column: getattr(row, column)
+                    for column in (*SEASON_AGGREGATES, "rating", "last_updated")
+                }
+                for row in result.scalars()
+            }
+
+
+class TestApplySeasonDeltas(SeasonStatsDbTestCase):
+    async def test_deltas_are_added_on_conflict_and_rating_recomputed(self):
+        async with self.factory() as session:
+            session.add(
+                PlayerSeasonStat(
+                    base_player_api_id=10,
+                    league_team_id=1,
+                    goals=2,
+                    minutes=180,
+                    appearances=2,
+                    rating_sum=Decimal("14.00"),
+                    rated_appearances=2,
+                    rating=Decimal("7.00"),
+                )
+            )
+            await session.commit()
+
+        deltas = [
+            {
+                "base_player_api_id": 10,
+                "league_team_id": 1,
+                **totals(
+                    goals=1,
+                    minutes=90,
+                    appearances=1,
+                    rating_sum=Decimal("8.50"),
+                    rated_appearances=1,
+                ),
+            },
+            {
+                "base_player_api_id": 11,
+                "league_team_id": 2,
+                **totals(
+                    minutes=30,
+                    appearances=1,
+                    rating_sum=Decimal("6.50"),
+                    rated_appearances=1,
+                ),
+            },
+        ]
+        async with self.factory() as session:
+            changed = await apply_season_deltas(session, deltas)
+            await session.commit()
+
+        self.assertEqual(changed, {1, 2})
+        season = await self.season()
+        self.assertEqual(season[(10, 1)]["goals"], 3)
+        self.assertEqual(season[(10, 1)]["minutes"], 270)
+        self.assertEqual(season[(10, 1)]["appearances"], 3)
+        self.assertEqual(season[(10, 1)]["rated_appearances"], 3)
+        # Média recalculada no SQL a partir das somas: 22.50 / 3
+        self.assertEqual(season[(10, 1)]["rating"], Decimal("7.50"))
+        self.assertEqual(season[(11, 2)]["goals"], 0)
+        self.assertEqual(season[(11, 2)]["rating"], Decimal("6.50"))
+
+        async with self.factory() as session:
+            self.assertEqual(await apply_season_deltas(session, []), set())
+
+    async def test_writing_the_same_match_twice_changes_nothing(self):
+        rows = [
+            stat_row(1001, 1, 10, 90, 2, "8.00"),
+            stat_row(1001, 2, 11, 60, 0, "6.50"),
+        ]
+        await self.write(rows)
+        first = await self.season()
+        self.assertEqual(first[(10, 1)]["goals"], 2)
+        self.assertEqual(first[(10, 1)]["appearances"], 1)
+        self.assertEqual(first[(11, 2)]["minutes"], 60)
+        self.assertEqual(self.refresher.metrics()["pending_league_teams"], 2)
+
+        # Mesmas estatísticas: delta zero, nem last_updated muda
+        await self.write(rows)
+        self.assertEqual(await self.season(), first)
+
+        # Correção da partida e uma partida nova somam só a diferença
+        await self.write([stat_row(1001, 1, 10, 90, 1, "7.00")])
+        await self.write([stat_row(1002, 1, 10, 80, 1, "7.50")])
+        season = await self.season()
+        self.assertEqual(season[(10, 1)]["goals"], 2)
+        self.assertEqual(season[(10, 1)]["minutes"], 170)
+        self.assertEqual(season[(10, 1)]["appearances"], 2)
+        self.assertEqual(season[(10, 1)]["rating"], Decimal("7.25"))
+        self.assertEqual(season[(11, 2)], first[(11, 2)])
+
+
+class TestRebuildPlayerSeasonStats(SeasonStatsDbTestCase):
+    async def test_reports_and_repairs_drift(self):
+        await self.write(
+            [
+                stat_row(1001, 1, 10, 90, 2, "8.00"),
+                stat_row(1002, 1, 10, 90, 1, "7.00"),
+            ]
+        )
+        expected = await self.season()
+        self.assertEqual(
+            await rebuild_player_season_stats(1),
+            {"league_id": 1, "rows": 1, "drifted": 0, "written": 0, "dry_run": False},
+        )
+
+        # Um total corrompido e uma linha sem nenhuma estatística por partida
+        async with self.factory() as session:
+            await session.execute(
+                update(PlayerSeasonStat)
+                .where(PlayerSeasonStat.base_player_api_id == 10)
+                .values(goals=99, rating=Decimal("9.00"))
+            )
+            session.add(
+                PlayerSeasonStat(
+                    base_player_api_id=11, league_team_id=2, goals=5, appearances=3
+                )
+            )
+            await session.commit()
+        corrupted = await self.season()
+
+        report = await rebuild_player_season_stats(1, dry_run=True)
+        self.assertEqual(report["drifted"], 2)
+        self.assertEqual(report["written"], 0)
+        self.assertEqual(await self.season(), corrupted)
+        self.assertEqual(self.refresher.metrics()["pending_leagues"], 0)
+
+        report = await rebuild_player_season_stats(1)
+        self.assertEqual(report["drifted"], 2)
+        self.assertEqual(report["written"], 2)
+        season = await self.season()
+        self.assertEqual(season[(10, 1)]["goals"], 3)
+        self.assertEqual(season[(10, 1)]["minutes"], expected[(10, 1)]["minutes"])
+        self.assertEqual(season[(10, 1)]["rating"], Decimal("7.50"))
+        self.assertEqual(season[(11, 2)]["goals"], 0)
+        self.assertEqual(season[(11, 2)]["appearances"], 0)
+        self.assertIsNone(season[(11, 2)]["rating"])
+        self.assertEqual(self.refresher.metrics()["pending_leagues"], 1)
+
+        report = await rebuild_player_season_stats(1)
+        self.assertEqual(report["drifted"], 0)
+        self.assertEqual(report["written"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from types import SimpleNamespace
+
+from integrations.standings import compute_team_rows, rank_key, affected_teams
+
+
+class TestStandings(unittest.TestCase):
+
+    def test_compute_team_rows(self):
+        fixtures = [
+            (1, 2, 2, 0),
+            (3, 1, 1, 1),
+            (2, 1, 0, 3),
+            (2, 3, None, None),  # placar ausente é ignorado
+        ]
+        rows = compute_team_rows(fixtures, {1, 2})
+
+        team = rows[1]
+        self.assertEqual(
+            (team["all_played"], team["all_win"], team["all_draw"]), (3, 2, 1)
+        )
+        self.assertEqual((team["home_played"], team["away_played"]), (1, 2))
+        self.assertEqual((team["all_goals_for"], team["all_goals_against"]), (6, 1))
+        self.assertEqual(team["points"], 7)
+        self.assertEqual(team["goals_difference"], 5)
+        self.assertEqual(team["form"], "WDW")
+        self.assertEqual(rows[2]["form"], "LL")
+        self.assertNotIn(3, rows)
+
+    def test_form_keeps_last_five_results(self):
+        fixtures = [(1, 2, 1, 0)] * 4 + [(1, 2, 0, 1)] * 2
+        self.assertEqual(compute_team_rows(fixtures, {1})[1]["form"], "WWWLL")
+
+    def test_rank_key_tie_breaks(self):
+        def row(team, points, goal_difference, goals_for):
+            return SimpleNamespace(
+                base_team_api_id=team,
+                points=points,
+                goals_difference=goal_difference,
+                all_goals_for=goals_for,
+            )
+
+        rows = [
+            row(10, 50, 5, 40),
+            row(11, 50, 8, 30),
+            row(12, 50, 5, 45),
+            row(9, 60, 0, 1),
+        ]
+        self.assertEqual(
+            [r.base_team_api_id for r in sorted(rows, key=rank_key)], [9, 11, 12, 10]
+        )
+
+    def test_affected_teams(self):
+        def row(api_id, status_short, home, away):
+            return {
+                "api_id": api_id,
+                "league_id": 7,
+                "status_short": status_short,
+                "home_team_id": home,
+                "away_team_id": away,
+            }
+
+        rows = [row(1, "FT", 1, 2), row(2, "NS", 3, 4), row(3, "PST", 5, 6)]
+        self.assertEqual(dict(affected_teams(rows, {3})), {7: {1, 2, 5, 6}})
+
+
+if __name__ == "__main__":
+    unittest.main()
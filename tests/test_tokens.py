@@ -0,0 +1,77 @@
+import time
+import unittest
+
+from utils.tokens import (
+    ACCESS,
+    REFRESH,
+    CurrentUser,
+    InvalidTokenError,
+    RevocationList,
+    decode_token,
+    encode_token,
+    revocation_list,
+)
+
+
+class TestTokens(unittest.TestCase):
+    def test_round_trip(self):
+        token = encode_token(
+            {"sub": "7", "username": "ana", "favorite_leagues": [3, 1]}, ACCESS, 60
+        )
+        user = CurrentUser(decode_token(token, ACCESS))
+
+        self.assertEqual(user.id, 7)
+        self.assertEqual(user.username, "ana")
+        self.assertTrue(user.follows_league(3))
+        self.assertFalse(user.follows_league(2))
+
+    def test_rejects_wrong_type(self):
+        token = encode_token({"sub": "7"}, REFRESH, 60)
+        with self.assertRaises(InvalidTokenError):
+            decode_token(token, ACCESS)
+
+    def test_rejects_expired(self):
+        token = encode_token({"sub": "7"}, ACCESS, -1)
+        with self.assertRaises(InvalidTokenError):
+            decode_token(token, ACCESS)
+
+    def test_rejects_tampered_payload(self):
+        header, _, signature = encode_token({"sub": "7"}, ACCESS, 60).split(".")
+        _, forged_payload, _ = encode_token({"sub": "1"}, ACCESS, 60).split(".")
+        with self.assertRaises(InvalidTokenError):
+            decode_token(f"{header}.{forged_payload}.{signature}", ACCESS)
+
+    def test_rejects_malformed(self):
+        for token in ("", "a.b", "a.b.c", "a.b.c.d"):
+            with self.assertRaises(InvalidTokenError):
+                decode_token(token, ACCESS)
+
+    def test_rejects_revoked(self):
+        token = encode_token({"sub": "7"}, ACCESS, 60)
+        claims = decode_token(token, ACCESS)
+        revocation_list.revoke(claims["jti"], claims["exp"])
+        with self.assertRaises(InvalidTokenError):
+            decode_token(token, ACCESS)
+
+
+class TestRevocationList(unittest.TestCase):
+    def test_prunes_expired_entries(self):
+        now = [time.time()]
+        revoked = RevocationList(clock=lambda: now[0])
+        revoked.revoke("a", now[0] + 10)
+        now[0] += 20
+        revoked.revoke("b", now[0] + 10)
+
+        self.assertFalse(revoked.is_revoked("a"))
+        self.assertTrue(revoked.is_revoked("b"))
+        self.assertEqual(len(revoked), 1)
+
+    def test_revoke_succeeds_once(self):
+        revoked = RevocationList(clock=lambda: 1000)
+        self.assertTrue(revoked.revoke("a", 1010))
+        self.assertFalse(revoked.revoke("a", 1010))
+        self.assertTrue(revoked.is_revoked("a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import asyncio
+import time
+from collections import OrderedDict
+from config import FEED_CACHE_TTL, FEED_CACHE_MAX_ENTRIES
+from typing import Iterable, Optional
+
+
+def feed_key(favorite_team: Optional[int], favorite_leagues: Iterable[int]) -> tuple:
+    """Chave do feed: usuários com os mesmos favoritos compartilham a entrada."""
+    return favorite_team, frozenset(favorite_leagues)
+
+
+class FeedCache:
+    """
+    Cache em memória dos feeds montados pelo /me/feed.
+
+    Cada entrada guarda as ligas das quais depende (as ligas favoritas e as
+    ligas em que a equipe favorita joga); uma gravação de partidas ou de
+    classificação numa liga invalida só as entradas que a usam. A validade
+    `ttl` é apenas um limite de segurança, e acima de `max_entries` as
+    entradas usadas há mais tempo são descartadas.
+    """
+
+    def __init__(
+        self,
+        ttl: float = FEED_CACHE_TTL,
+        max_entries: int = FEED_CACHE_MAX_ENTRIES,
+        clock=time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries = OrderedDict()  # chave -> (expira_em, ligas, feed)
+        self._by_league = {}  # league_id -> conjunto de chaves
+        self._inflight = {}
+        # Incrementado a cada invalidação: um feed montado enquanto uma liga
+        # mudava pode estar desatualizado e não é guardado
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def get(self, key: tuple, build) -> dict:
+        """
+        Devolve o feed de `key`, chamando `build()` quando não está em cache.
+
+        `build()` devolve (feed, league_ids das quais o feed depende). Pedidos
+        simultâneos da mesma chave compartilham uma única montagem.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self._clock():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        task = asyncio.ensure_future(self._build(key, build, self._generation))
+        self._inflight[key] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done():
+                self._inflight.pop(key, None)
+            else:
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+    async def _build(self, key: tuple, build, generation: int) -> dict:
+        feed, league_ids = await build()
+        if generation == self._generation:
+            self._store(key, feed, frozenset(league_ids))
+        return feed
+
+    def put(self, key: tuple, value: dict, league_ids: Iterable[int]):
+        """Guarda um valor já montado (ex.: recalculado em segundo plano)."""
+        self._store(key, value, frozenset(league_ids))
+
+    def _store(self, key: tuple, feed: dict, league_ids: frozenset):
+        self._discard(key)
+        self._entries[key] = (self._clock() + self.ttl, league_ids, feed)
+        for league_id in league_ids:
+            self._by_league.setdefault(league_id, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: tuple):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for league_id in entry[1]:
+            keys = self._by_league.get(league_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_league[league_id]
+
+    def invalidate_leagues(self, league_ids: Iterable[int]):
+        """Descarta os feeds que dependem de alguma das ligas."""
+        self._generation += 1
+        for league_id in set(league_ids):
+            for key in self._by_league.pop(league_id, ()):
+                if key in self._entries:
+                    self._discard(key)
+                    self.invalidations += 1
+
+    def on_fixture_events(self, events: list):
+        """Ouvinte do broker: cada atualização de partida invalida a sua liga."""
+        self.invalidate_leagues(event["league_id"] for event in events)
+
+    def clear(self):
+        self._generation += 1
+        self._entries.clear()
+        self._by_league.clear()
+
+    def metrics(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+feed_cache = FeedCache()
@@ -1,9 +1,111 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config import BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS
+)
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHasherBusyError(Exception):
+    """Há mais pedidos de hash aguardando do que o limite configurado."""
+
+
+class PasswordHasher:
+    """
+    Executa o bcrypt num pool de threads dedicado e limitado, fora do event
+    loop (o bcrypt libera o GIL durante o cálculo).
+
+    Pedidos acima de `max_pending` (na fila + em execução) são recusados com
+    PasswordHasherBusyError em vez de acumular latência para todos.
+    """
+
+    def __init__(
+        self,
+        workers: int = PASSWORD_HASH_WORKERS,
+        max_pending: int = PASSWORD_HASH_MAX_PENDING,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="bcrypt"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._max_queue_depth = 0
+        self._wait_total = 0.0
+        self._run_total = 0.0
+
+    async def _submit(self, function, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise PasswordHasherBusyError(
+                    f"{self._pending} hashes de senha pendentes"
+                )
+            self._pending += 1
+            self._max_queue_depth = max(
+                self._max_queue_depth, self._pending - self._running
+            )
+        submitted_at = time.perf_counter()
+
+        def run():
+            started_at = time.perf_counter()
+            with self._lock:
+                self._running += 1
+                self._wait_total += started_at - submitted_at
+            try:
+                return function(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    self._run_total += time.perf_counter() - started_at
+
+        def release(_):
+            # Roda também quando o pedido é cancelado antes de começar
+            with self._lock:
+                self._pending -= 1
+
+        future = self._executor.submit(run)
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            completed = self._completed or 1
+            return {
+                "workers": self.workers,
+                "bcrypt_rounds": BCRYPT_ROUNDS,
+                "queue_depth": self._pending - self._running,
+                "running": self._running,
+                "max_queue_depth": self._max_queue_depth,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(self._wait_total / completed * 1000, 1),
+                "avg_run_ms": round(self._run_total / completed * 1000, 1),
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher()
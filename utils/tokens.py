@@ -0,0 +1,193 @@
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import threading
+import time
+import uuid
+from config import AUTH_SECRET_KEY, ACCESS_TOKEN_TTL, REFRESH_TOKEN_TTL
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from typing import Optional
+
+ACCESS = "access"
+REFRESH = "refresh"
+
+_HEADER = {"alg": "HS256", "typ": "JWT"}
+
+if AUTH_SECRET_KEY:
+    _secret = AUTH_SECRET_KEY.encode("utf-8")
+else:
+    # Sem chave configurada os tokens só valem até o processo reiniciar
+    print("AUTH_SECRET_KEY não definida: usando uma chave aleatória temporária.")
+    _secret = secrets.token_bytes(32)
+
+
+class InvalidTokenError(Exception):
+    """Token malformado, com assinatura inválida, expirado ou revogado."""
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(signing_input: str) -> str:
+    return _b64encode(
+        hmac.new(_secret, signing_input.encode("ascii"), hashlib.sha256).digest()
+    )
+
+
+def encode_token(claims: dict, token_type: str, ttl: int) -> str:
+    """Gera um JWT HS256 com `typ`, `iat`, `exp` e um `jti` único."""
+    now = int(time.time())
+    payload = {
+        **claims,
+        "typ": token_type,
+        "iat": now,
+        "exp": now + ttl,
+        "jti": uuid.uuid4().hex,
+    }
+    signing_input = ".".join(
+        _b64encode(json.dumps(part, separators=(",", ":")).encode("utf-8"))
+        for part in (_HEADER, payload)
+    )
+    return f"{signing_input}.{_sign(signing_input)}"
+
+
+def decode_token(token: str, token_type: str) -> dict:
+    """
+    Confere a assinatura, o tipo, a validade e a lista de revogação, sem
+    acessar o banco.
+
+    Raises:
+        InvalidTokenError: se o token não for aceito.
+    """
+    try:
+        header, payload, signature = token.split(".")
+        valid_signature = hmac.compare_digest(
+            signature.encode("ascii"), _sign(f"{header}.{payload}").encode("ascii")
+        )
+    except ValueError:
+        raise InvalidTokenError("Token malformado")
+
+    if not valid_signature:
+        raise InvalidTokenError("Assinatura inválida")
+
+    try:
+        claims = json.loads(_b64decode(payload))
+    except ValueError:
+        raise InvalidTokenError("Token malformado")
+    if not isinstance(claims, dict):
+        raise InvalidTokenError("Token malformado")
+
+    if claims.get("typ") != token_type:
+        raise InvalidTokenError("Tipo de token inválido")
+    if claims.get("exp", 0) <= time.time():
+        raise InvalidTokenError("Token expirado")
+    if revocation_list.is_revoked(claims.get("jti")):
+        raise InvalidTokenError("Token revogado")
+    return claims
+
+
+class RevocationList:
+    """
+    `jti` de tokens revogados (logout, refresh já usado) guardados até o
+    vencimento de cada token; depois disso a própria validade os recusa.
+    """
+
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self._revoked = {}  # jti -> exp
+        self._lock = threading.Lock()
+
+    def revoke(self, jti: str, expires_at: float) -> bool:
+        """
+        Revoga o token se ele ainda não estava revogado.
+
+        Returns:
+            bool: True só para quem de fato revogou; pedidos simultâneos com
+            o mesmo `jti` recebem False.
+        """
+        with self._lock:
+            now = self._clock()
+            for expired in [j for j, exp in self._revoked.items() if exp <= now]:
+                del self._revoked[expired]
+            if jti in self._revoked:
+                return False
+            self._revoked[jti] = expires_at
+            return True
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        return jti in self._revoked
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+revocation_list = RevocationList()
+
+
+def issue_token_pair(user) -> dict:
+    """
+    Tokens de acesso e de renovação de um User. As ligas favoritas vão nas
+    claims para que as rotas protegidas não consultem o banco.
+    """
+    claims = {
+        "sub": str(user.id),
+        "username": user.username,
+        "favorite_team": user.favorite_team_api_id,
+        "favorite_leagues": sorted(
+            association.league_id for association in user.favorite_league_associations
+        ),
+    }
+    return {
+        "access_token": encode_token(claims, ACCESS, ACCESS_TOKEN_TTL),
+        "refresh_token": encode_token(
+            {"sub": claims["sub"]}, REFRESH, REFRESH_TOKEN_TTL
+        ),
+        "token_type": "bearer",
+        "expires_in": ACCESS_TOKEN_TTL,
+    }
+
+
+class CurrentUser:
+    """Usuário autenticado, montado apenas a partir das claims do token."""
+
+    def __init__(self, claims: dict):
+        self.id = int(claims["sub"])
+        self.username = claims.get("username")
+        self.favorite_team = claims.get("favorite_team")
+        self.favorite_leagues = frozenset(claims.get("favorite_leagues") or ())
+        self.token_id = claims["jti"]
+        self.expires_at = claims["exp"]
+
+    def follows_league(self, league_id: int) -> bool:
+        return league_id in self.favorite_leagues
+
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+async def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+) -> CurrentUser:
+    """Dependência das rotas protegidas: só valida a assinatura do token."""
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    try:
+        return CurrentUser(decode_token(credentials.credentials, ACCESS))
+    except InvalidTokenError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )